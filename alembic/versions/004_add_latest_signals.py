@@ -0,0 +1,96 @@
+"""add latest_signals table
+
+Revision ID: 004_add_latest_signals
+Revises: 003_add_binance_ourbit_position
+Create Date: 2026-01-12
+"""
+from alembic import op
+import sqlalchemy as sa
+from pydantic_core import to_jsonable_python
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "004_add_latest_signals"
+down_revision = "003_add_binance_ourbit_position"
+branch_labels = None
+depends_on = None
+
+# Signal columns serialized into the payload, as of this revision
+SIGNAL_COLUMNS = {
+    "mexc_spot_futures": (
+        "signals_mexc_spot_futures",
+        (
+            "id", "coin_name", "position", "spread", "mexc_spot_price", "mexc_futures_price",
+            "spot_url", "futures_url", "deposit_enabled", "withdrawal_enabled", "dex_url",
+            "created_at",
+        ),
+    ),
+    "funding_rate": (
+        "signals_funding_rate",
+        (
+            "id", "coin_name", "hourly_profit",
+            "gate_rate", "gate_url", "gate_interval", "gate_position",
+            "binance_rate", "binance_url", "binance_interval", "binance_position",
+            "mexc_rate", "mexc_url", "mexc_interval", "mexc_position",
+            "ourbit_rate", "ourbit_url", "ourbit_interval", "ourbit_position",
+            "bitget_rate", "bitget_url", "bitget_interval", "bitget_position",
+            "bybit_rate", "bybit_url", "bybit_interval", "bybit_position",
+            "created_at",
+        ),
+    ),
+    "mexc_dex": (
+        "signals_mexc_dex",
+        (
+            "id", "coin_name", "spread_percent", "mexc_price", "mexc_url", "dex_price",
+            "dexscreener_url", "max_size_usd", "deposit_enabled", "withdrawal_enabled",
+            "deposit_url", "withdrawal_url", "token_contract", "token_chain", "created_at",
+        ),
+    ),
+}
+
+
+def upgrade():
+    latest_signals = op.create_table(
+        "latest_signals",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("signal_type", sa.String(length=50), nullable=False),
+        sa.Column("coin_name", sa.String(length=100), nullable=False),
+        sa.Column("signal_id", sa.Integer(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("signal_type", "coin_name", name="uq_latest_signals_type_coin"),
+    )
+    op.create_index(op.f("ix_latest_signals_id"), "latest_signals", ["id"], unique=False)
+    op.create_index(op.f("ix_latest_signals_created_at"), "latest_signals", ["created_at"], unique=False)
+
+    # Backfill from existing history: newest signal per coin for each type,
+    # serialized the way the response schemas did at this revision.
+    bind = op.get_bind()
+    for signal_type, (table_name, columns) in SIGNAL_COLUMNS.items():
+        table = sa.table(table_name, *(sa.column(name) for name in columns))
+        newest = (
+            sa.select(table)
+            .distinct(table.c.coin_name)
+            .order_by(table.c.coin_name, table.c.created_at.desc(), table.c.id.desc())
+        )
+        rows = [
+            {
+                "signal_type": signal_type,
+                "coin_name": row["coin_name"],
+                "signal_id": row["id"],
+                "payload": to_jsonable_python(dict(row)),
+                "created_at": row["created_at"],
+            }
+            for row in bind.execute(newest).mappings()
+        ]
+        if rows:
+            op.bulk_insert(latest_signals, rows)
+
+
+def downgrade():
+    op.drop_index(op.f("ix_latest_signals_created_at"), table_name="latest_signals")
+    op.drop_index(op.f("ix_latest_signals_id"), table_name="latest_signals")
+    op.drop_table("latest_signals")
@@ -0,0 +1,83 @@
+"""add signal stats rollup tables
+
+Revision ID: 005_add_signal_stats_rollups
+Revises: 004_add_latest_signals
+Create Date: 2026-01-14
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "005_add_signal_stats_rollups"
+down_revision = "004_add_latest_signals"
+branch_labels = None
+depends_on = None
+
+# signal_type -> (table, metric column)
+SIGNAL_METRICS = {
+    "mexc_spot_futures": ("signals_mexc_spot_futures", "spread"),
+    "funding_rate": ("signals_funding_rate", "hourly_profit"),
+    "mexc_dex": ("signals_mexc_dex", "spread_percent"),
+}
+
+# rollup table -> (date_trunc unit, backfill horizon)
+ROLLUPS = {
+    "signal_stats_minute": ("minute", "48 hours"),
+    "signal_stats_hour": ("hour", "30 days"),
+}
+
+
+def upgrade():
+    for table in ROLLUPS:
+        op.create_table(
+            table,
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("signal_type", sa.String(length=50), nullable=False),
+            sa.Column("coin_name", sa.String(length=100), nullable=False),
+            sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("signal_count", sa.Integer(), nullable=False),
+            sa.Column("value_count", sa.Integer(), nullable=False),
+            sa.Column("value_sum", sa.Numeric(precision=20, scale=8), nullable=True),
+            sa.Column("value_max", sa.Numeric(precision=20, scale=8), nullable=True),
+            sa.Column("last_value", sa.Numeric(precision=20, scale=8), nullable=True),
+            sa.Column("first_seen", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("last_seen", sa.DateTime(timezone=True), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("signal_type", "coin_name", "bucket_start", name=f"uq_{table}_bucket"),
+        )
+        op.create_index(op.f(f"ix_{table}_id"), table, ["id"], unique=False)
+        op.create_index(op.f(f"ix_{table}_bucket_start"), table, ["bucket_start"], unique=False)
+
+    # Backfill from existing history within each table's retention
+    for table, (unit, horizon) in ROLLUPS.items():
+        for signal_type, (source, metric) in SIGNAL_METRICS.items():
+            op.execute(
+                f"""
+                INSERT INTO {table} (
+                    signal_type, coin_name, bucket_start, signal_count, value_count,
+                    value_sum, value_max, last_value, first_seen, last_seen
+                )
+                SELECT
+                    '{signal_type}',
+                    coin_name,
+                    date_trunc('{unit}', created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+                    count(*),
+                    count({metric}),
+                    sum({metric}),
+                    max({metric}),
+                    (array_agg({metric} ORDER BY created_at DESC))[1],
+                    min(created_at),
+                    max(created_at)
+                FROM {source}
+                WHERE created_at >= now() - interval '{horizon}'
+                GROUP BY 2, 3
+                """
+            )
+
+
+def downgrade():
+    for table in reversed(list(ROLLUPS)):
+        op.drop_index(op.f(f"ix_{table}_bucket_start"), table_name=table)
+        op.drop_index(op.f(f"ix_{table}_id"), table_name=table)
+        op.drop_table(table)
@@ -0,0 +1,30 @@
+"""add (coin_name, created_at) indexes on signal tables
+
+Revision ID: 006_add_signal_coin_created_indexes
+Revises: 005_add_signal_stats_rollups
+Create Date: 2026-01-15
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "006_add_signal_coin_created_indexes"
+down_revision = "005_add_signal_stats_rollups"
+branch_labels = None
+depends_on = None
+
+SIGNAL_TABLES = (
+    "signals_mexc_spot_futures",
+    "signals_funding_rate",
+    "signals_mexc_dex",
+)
+
+
+def upgrade():
+    for table in SIGNAL_TABLES:
+        op.create_index(f"ix_{table}_coin_created", table, ["coin_name", "created_at"], unique=False)
+
+
+def downgrade():
+    for table in SIGNAL_TABLES:
+        op.drop_index(f"ix_{table}_coin_created", table_name=table)
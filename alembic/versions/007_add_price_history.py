@@ -0,0 +1,59 @@
+"""add price_history table
+
+Revision ID: 007_add_price_history
+Revises: 006_add_signal_coin_created_indexes
+Create Date: 2026-01-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "007_add_price_history"
+down_revision = "006_add_signal_coin_created_indexes"
+branch_labels = None
+depends_on = None
+
+# (source table, price column, venue) observed in signals
+SIGNAL_PRICES = (
+    ("signals_mexc_spot_futures", "mexc_spot_price", "mexc_spot"),
+    ("signals_mexc_spot_futures", "mexc_futures_price", "mexc_futures"),
+    ("signals_mexc_dex", "mexc_price", "mexc_futures_dex"),
+    ("signals_mexc_dex", "dex_price", "dex"),
+)
+
+
+def upgrade():
+    op.create_table(
+        "price_history",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("coin_name", sa.String(length=100), nullable=False),
+        sa.Column("venue", sa.String(length=20), nullable=False),
+        sa.Column("price", sa.Numeric(precision=20, scale=8), nullable=False),
+        sa.Column("recorded_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_price_history_id"), "price_history", ["id"], unique=False)
+    op.create_index(
+        "ix_price_history_coin_venue_recorded",
+        "price_history",
+        ["coin_name", "venue", "recorded_at"],
+        unique=False,
+    )
+
+    # Backfill with the prices already recorded in signals
+    for table, column, venue in SIGNAL_PRICES:
+        op.execute(
+            f"""
+            INSERT INTO price_history (coin_name, venue, price, recorded_at)
+            SELECT coin_name, '{venue}', {column}, created_at
+            FROM {table}
+            WHERE {column} > 0 AND created_at IS NOT NULL
+            """
+        )
+
+
+def downgrade():
+    op.drop_index("ix_price_history_coin_venue_recorded", table_name="price_history")
+    op.drop_index(op.f("ix_price_history_id"), table_name="price_history")
+    op.drop_table("price_history")
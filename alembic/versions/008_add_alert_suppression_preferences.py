@@ -0,0 +1,31 @@
+"""add alert suppression preference columns
+
+Revision ID: 008_add_alert_suppression_preferences
+Revises: 007_add_price_history
+Create Date: 2026-01-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "008_add_alert_suppression_preferences"
+down_revision = "007_add_price_history"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "user_preferences",
+        sa.Column("alert_suppression_seconds", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "user_preferences",
+        sa.Column("alert_min_change_percent", sa.String(length=10), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_column("user_preferences", "alert_min_change_percent")
+    op.drop_column("user_preferences", "alert_suppression_seconds")
@@ -0,0 +1,60 @@
+"""add email digest preferences and email_digest_items table
+
+Revision ID: 010_add_email_digest
+Revises: 009_add_email_outbox
+Create Date: 2026-01-23
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "010_add_email_digest"
+down_revision = "009_add_email_outbox"
+branch_labels = None
+depends_on = None
+
+SIGNAL_TYPES = ("mexc_spot_futures", "funding_rate", "mexc_dex")
+
+
+def upgrade():
+    for signal_type in SIGNAL_TYPES:
+        op.add_column(
+            "user_preferences",
+            sa.Column(
+                f"{signal_type}_email_digest",
+                sa.String(length=10),
+                server_default="immediate",
+                nullable=True,
+            ),
+        )
+
+    op.create_table(
+        "email_digest_items",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("period", sa.String(length=10), nullable=False),
+        sa.Column("signal_type", sa.String(length=50), nullable=True),
+        sa.Column("signal_id", sa.Integer(), nullable=True),
+        sa.Column("coin_name", sa.String(length=100), nullable=True),
+        sa.Column("title", sa.String(length=255), nullable=True),
+        sa.Column("body", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_email_digest_items_id"), "email_digest_items", ["id"], unique=False)
+    op.create_index(
+        "ix_email_digest_items_period_user_created",
+        "email_digest_items",
+        ["period", "user_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_email_digest_items_period_user_created", table_name="email_digest_items")
+    op.drop_index(op.f("ix_email_digest_items_id"), table_name="email_digest_items")
+    op.drop_table("email_digest_items")
+
+    for signal_type in reversed(SIGNAL_TYPES):
+        op.drop_column("user_preferences", f"{signal_type}_email_digest")
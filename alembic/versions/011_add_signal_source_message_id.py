@@ -0,0 +1,33 @@
+"""add source_message_id to signal tables
+
+Revision ID: 011_add_signal_source_message_id
+Revises: 010_add_email_digest
+Create Date: 2026-01-24
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "011_add_signal_source_message_id"
+down_revision = "010_add_email_digest"
+branch_labels = None
+depends_on = None
+
+SIGNAL_TABLES = (
+    "signals_mexc_spot_futures",
+    "signals_funding_rate",
+    "signals_mexc_dex",
+)
+
+
+def upgrade():
+    for table in SIGNAL_TABLES:
+        op.add_column(table, sa.Column("source_message_id", sa.String(length=64), nullable=True))
+        op.create_unique_constraint(f"uq_{table}_source_message_id", table, ["source_message_id"])
+
+
+def downgrade():
+    for table in SIGNAL_TABLES:
+        op.drop_constraint(f"uq_{table}_source_message_id", table, type_="unique")
+        op.drop_column(table, "source_message_id")
@@ -63,7 +63,7 @@ class Settings(BaseSettings):
     # Security
     secret_key: str
     algorithm: str = "HS256"
-    access_token_expire_minutes: int = 14400  # 24 hours
+    access_token_expire_minutes: int = 14400  # 10 days
     refresh_token_expire_days: int = 70
 
     # CoinMarketCap API
@@ -73,12 +73,88 @@ class Settings(BaseSettings):
     telegram_bot_token: str = ""
     telegram_chat_id: str = ""
 
+    # Signal ingestion stream (Redis Streams)
+    ingest_stream_enabled: bool = False
+    ingest_stream_name: str = "signals:ingest"
+    ingest_stream_maxlen: int = 100000
+    ingest_consumer_group: str = "signal-workers"
+    ingest_worker_in_process: bool = True
+    ingest_batch_size: int = 50
+    ingest_block_ms: int = 5000
+    ingest_claim_idle_ms: int = 60000
+    ingest_max_deliveries: int = 5
+    # Standalone ingestion workers publish persisted signals here for the API
+    signal_events_channel: str = "signals:events"
+
+    # Opportunity leaderboard (in-memory)
+    leaderboard_window_seconds: int = 900
+    leaderboard_size: int = 20
+
+    # Newest signals per type kept in memory for WebSocket snapshots
+    recent_signals_size: int = 50
+
+    # Backtest API bounds: the simulation holds several float arrays of
+    # signals x steps cells (about 50 bytes per cell at peak)
+    backtest_max_cells: int = 2_000_000
+    backtest_max_days: int = 90
+
+    # Per-coin signal statistics rollups
+    stats_minute_retention_hours: int = 48
+    stats_hour_retention_days: int = 30
+    # Raw rows LTTB history may hold in memory; above it the rollups are used
+    history_lttb_max_raw_points: int = 50_000
+
+    # Alert suppression per (signal_type, coin_name); window 0 disables it
+    alert_suppression_window_seconds: int = 300
+    alert_suppression_min_change_percent: float = 20.0
+    alert_suppression_backend: str = "memory"  # 'memory' or 'redis'
+
+    # WebSocket frames kept for replay to reconnecting clients
+    ws_replay_buffer_size: int = 5000
+    # Upper bound for the per-connection coalescing window clients can ask for
+    ws_max_coalesce_ms: int = 250
+    # Admission control per worker; over the ceiling new connections are
+    # closed with 1013 (try again later), over the per-user cap the user's
+    # oldest connection is closed
+    ws_max_connections: int = 10000
+    ws_max_connections_per_user: int = 5
+    ws_retry_after_seconds: int = 5
+    # Deferred subscription checks for tokens carrying a plan claim
+    ws_auth_check_concurrency: int = 10
+    ws_auth_cache_seconds: int = 300
+    # Connected users are re-checked for an active VIP subscription this often;
+    # the broadcast path itself does no subscription lookup
+    ws_auth_recheck_seconds: int = 60
+    # Server pings: every connection is pinged once per interval and closed
+    # after the timeout without any message from the client; interval 0 disables
+    ws_heartbeat_interval_seconds: int = 30
+    ws_heartbeat_timeout_seconds: int = 75
+
     # Email (SMTP)
     smtp_host: str = ""
     smtp_port: int = 587
     smtp_user: str = ""
     smtp_password: str = ""
     smtp_from_email: str = "noreply@cryptotracker.com"
+    # Pool of logged-in SMTP connections: at most pool_size sends at once,
+    # a connection is replaced after max_messages and checked with NOOP
+    # when idle for longer than health_check_seconds
+    smtp_pool_size: int = 4
+    smtp_pool_max_messages: int = 100
+    smtp_pool_health_check_seconds: int = 30
+    smtp_timeout_seconds: int = 30
+    # Email outbox worker: due emails are sent in batches; a failed email is
+    # retried after retry_base * 2^(attempts - 1) seconds (capped) and marked
+    # dead after max_attempts; sent rows are kept for retention_days
+    email_worker_in_process: bool = True
+    email_outbox_batch_size: int = 50
+    email_outbox_poll_seconds: float = 2
+    email_outbox_max_attempts: int = 6
+    email_outbox_retry_base_seconds: int = 30
+    email_outbox_retry_max_seconds: int = 3600
+    email_outbox_retention_days: int = 7
+    # How often the email worker folds waiting digest items into emails
+    email_digest_poll_seconds: int = 30
 
     # Environment
     environment: str = "development"
@@ -1,4 +1,5 @@
 """Database configuration and session management."""
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
@@ -22,6 +23,21 @@ AsyncSessionLocal = async_sessionmaker(
 # Base class for models
 Base = declarative_base()
 
+# INSERT constructs supporting ON CONFLICT DO UPDATE
+_UPSERT_DIALECTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def upsert_insert(session: AsyncSession, table):
+    """Dialect-specific insert for ``table`` with ``on_conflict_do_update`` support."""
+    dialect = session.get_bind().dialect.name
+    insert = _UPSERT_DIALECTS.get(dialect)
+    if insert is None:
+        raise NotImplementedError(f"Upsert is not supported on {dialect}")
+    return insert(table)
+
 
 async def get_db() -> AsyncSession:
     """Dependency for getting database session."""
@@ -34,6 +50,3 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             await session.close()
-
-
-
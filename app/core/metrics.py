@@ -0,0 +1,38 @@
+"""Prometheus metrics."""
+from prometheus_client import Counter, Histogram
+
+# Signal pipeline latency: Telegram post -> parse -> insert -> broadcast -> notify
+SIGNAL_STAGE_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIGNAL_END_TO_END_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60, 120, 300)
+
+signal_stage_seconds = Histogram(
+    "signal_stage_seconds",
+    "Time spent in each stage of the signal pipeline",
+    ["signal_type", "stage"],
+    buckets=SIGNAL_STAGE_BUCKETS,
+)
+
+signal_end_to_end_seconds = Histogram(
+    "signal_end_to_end_seconds",
+    "Time from the Telegram post to the end of notification fan-out",
+    ["signal_type"],
+    buckets=SIGNAL_END_TO_END_BUCKETS,
+)
+
+ws_connections_rejected_total = Counter(
+    "ws_connections_rejected_total",
+    "WebSocket connections refused or closed by admission control",
+    ["reason"],
+)
+
+ws_connections_reaped_total = Counter(
+    "ws_connections_reaped_total",
+    "WebSocket connections closed by the server heartbeat",
+    ["reason"],
+)
+
+email_outbox_deliveries_total = Counter(
+    "email_outbox_deliveries_total",
+    "Email outbox delivery attempts by result",
+    ["result"],
+)
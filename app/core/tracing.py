@@ -0,0 +1,59 @@
+"""Per-signal tracing for pipeline latency measurements."""
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from app.core.metrics import signal_stage_seconds, signal_end_to_end_seconds
+
+
+class SignalTrace:
+    """Trace of a single signal through parse, insert, broadcast and notify.
+
+    ``source_ts`` is the Unix timestamp of the Telegram post
+    (``update.message.date``); it has one-second resolution.
+    """
+
+    def __init__(
+        self,
+        signal_type: Optional[str] = None,
+        source_ts: Optional[float] = None,
+        trace_id: Optional[str] = None,
+    ):
+        self.trace_id = trace_id or uuid.uuid4().hex
+        self.signal_type = signal_type or "unknown"
+        self.source_ts = source_ts
+        self.started_at = time.time()
+        self.stages: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a pipeline stage and export it to the stage histogram."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.stages[name] = elapsed
+            signal_stage_seconds.labels(self.signal_type, name).observe(elapsed)
+
+    def observe_queue_delay(self):
+        """Record the delay between the Telegram post and the start of processing."""
+        if self.source_ts:
+            delay = max(self.started_at - self.source_ts, 0.0)
+            self.stages["queue"] = delay
+            signal_stage_seconds.labels(self.signal_type, "queue").observe(delay)
+
+    def finish(self):
+        """Record the end-to-end latency of the signal."""
+        origin = self.source_ts or self.started_at
+        signal_end_to_end_seconds.labels(self.signal_type).observe(
+            max(time.time() - origin, 0.0)
+        )
+
+    def frame_fields(self) -> dict:
+        """Fields added to WebSocket frames so clients can measure delivery lag."""
+        return {
+            "trace_id": self.trace_id,
+            "source_ts": self.source_ts,
+            "sent_at": time.time(),
+        }
@@ -1,10 +1,12 @@
 """Main FastAPI application."""
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 from app.core.config import settings
 from app.core.redis_client import get_redis, close_redis
 from app.core.exceptions import setup_exception_handlers
+from app.core.responses import FastJSONResponse
 from app.core.rate_limit import RateLimitMiddleware
 from app.core.logging_config import setup_logging, get_logger
 from app.services.auth.router import router as auth_router
@@ -12,7 +14,9 @@ from app.services.user.router import router as user_router
 from app.services.market.router import router as market_router
 from app.services.signals.router import router as signals_router
 from app.services.websocket.router import router as websocket_router
+from app.services.websocket.sse import router as sse_router
 from app.services.notifications.router import router as notifications_router
+from app.services.analytics.router import router as analytics_router
 
 # Setup logging
 setup_logging()
@@ -33,6 +37,24 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to connect to Redis: {e}. Application will continue without rate limiting.")
     
+    # Restore the opportunity leaderboard and recent signals cache
+    try:
+        from app.core.database import AsyncSessionLocal
+        from app.services.signals.leaderboard import leaderboard
+        async with AsyncSessionLocal() as db:
+            loaded = await leaderboard.warm(db)
+        logger.info(f"Leaderboard warmed with {loaded} signals")
+    except Exception as e:
+        logger.warning(f"Failed to warm leaderboard: {e}")
+    try:
+        from app.core.database import AsyncSessionLocal
+        from app.services.signals.recent import recent_signals
+        async with AsyncSessionLocal() as db:
+            loaded = await recent_signals.warm(db)
+        logger.info(f"Recent signals cache warmed with {loaded} signals")
+    except Exception as e:
+        logger.warning(f"Failed to warm recent signals cache: {e}")
+
     # Start Telegram bot in background
     from app.services.telegram.bot import start_telegram_bot
     telegram_task = asyncio.create_task(start_telegram_bot())
@@ -42,7 +64,40 @@ async def lifespan(app: FastAPI):
     from app.tasks.scheduler import start_background_tasks, stop_background_tasks
     background_task = await start_background_tasks()
     logger.info("Background tasks started")
+
+    # Server-driven WebSocket heartbeats, one task for all connections
+    heartbeat_task = None
+    if settings.ws_heartbeat_interval_seconds > 0:
+        from app.services.websocket.manager import manager
+        heartbeat_task = asyncio.create_task(manager.run_heartbeats())
+
+    # Drop connections whose VIP subscription was cancelled or expired
+    revalidation_task = None
+    if settings.ws_auth_recheck_seconds > 0:
+        from app.services.websocket.router import run_revalidation
+        revalidation_task = asyncio.create_task(run_revalidation())
+
+    # Start ingestion stream consumer when running in-process
+    ingest_consumer, ingest_task = None, None
+    if settings.ingest_stream_enabled and settings.ingest_worker_in_process:
+        from app.tasks.ingest_worker import start_ingest_worker
+        ingest_consumer, ingest_task = await start_ingest_worker()
+        logger.info("Ingestion worker started")
+
+    # Apply signals persisted by standalone ingestion workers
+    signal_events_task = None
+    if settings.ingest_stream_enabled:
+        from app.services.signals.events import run_signal_event_listener
+        signal_events_task = asyncio.create_task(run_signal_event_listener())
     
+    # Start email outbox delivery when running in-process
+    email_worker, email_task = None, None
+    from app.services.notifications.email import email_service
+    if settings.email_worker_in_process and email_service.is_configured():
+        from app.tasks.email_worker import start_email_worker
+        email_worker, email_task = await start_email_worker()
+        logger.info("Email worker started")
+
     yield
     
     # Shutdown
@@ -56,9 +111,25 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
     logger.info("Telegram bot stopped")
+
+    for task in (heartbeat_task, revalidation_task, signal_events_task):
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    if ingest_task:
+        from app.tasks.ingest_worker import stop_ingest_worker
+        await stop_ingest_worker(ingest_consumer, ingest_task)
+        logger.info("Ingestion worker stopped")
     
     await stop_background_tasks(background_task)
     logger.info("Background tasks stopped")
+
+    from app.tasks.email_worker import stop_email_worker
+    await stop_email_worker(email_worker, email_task)
     
     await close_redis()
     logger.info("Redis connection closed")
@@ -70,6 +141,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # Setup exception handlers
@@ -93,7 +165,9 @@ app.include_router(user_router)
 app.include_router(market_router)
 app.include_router(signals_router)
 app.include_router(websocket_router)
+app.include_router(sse_router)
 app.include_router(notifications_router)
+app.include_router(analytics_router)
 
 
 @app.get("/")
@@ -111,3 +185,8 @@ async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
 
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics endpoint."""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
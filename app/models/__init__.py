@@ -4,7 +4,13 @@ from app.models.signal import (
     SignalMEXCSpotFutures,
     SignalFundingRate,
     SignalMEXCDEX,
+    LatestSignal,
+    SignalStatsMinute,
+    SignalStatsHour,
+    PriceHistory,
     Notification,
+    EmailOutbox,
+    EmailDigestItem,
     CoinMarketCapData,
     AuditLog,
 )
@@ -16,7 +22,13 @@ __all__ = [
     "SignalMEXCSpotFutures",
     "SignalFundingRate",
     "SignalMEXCDEX",
+    "LatestSignal",
+    "SignalStatsMinute",
+    "SignalStatsHour",
+    "PriceHistory",
     "Notification",
+    "EmailOutbox",
+    "EmailDigestItem",
     "CoinMarketCapData",
     "AuditLog",
 ]
@@ -1,5 +1,6 @@
 """Signal models."""
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Numeric, func
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Numeric, JSON, Index, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import JSONB
 from app.core.database import Base
 
 
@@ -7,6 +8,11 @@ class SignalMEXCSpotFutures(Base):
     """MEXC Spot & Futures signal model."""
 
     __tablename__ = "signals_mexc_spot_futures"
+    __table_args__ = (
+        # Per-coin history scans (history endpoint, latest rebuild)
+        Index("ix_signals_mexc_spot_futures_coin_created", "coin_name", "created_at"),
+        UniqueConstraint("source_message_id", name="uq_signals_mexc_spot_futures_source_message_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     coin_name = Column(String(100), nullable=False, index=True)
@@ -19,6 +25,8 @@ class SignalMEXCSpotFutures(Base):
     deposit_enabled = Column(Boolean, default=True)
     withdrawal_enabled = Column(Boolean, default=True)
     dex_url = Column(String(500))
+    # Ingestion stream entry the signal came from; makes redelivery idempotent
+    source_message_id = Column(String(64))
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
@@ -27,6 +35,11 @@ class SignalFundingRate(Base):
     """Funding Rate Spread signal model."""
 
     __tablename__ = "signals_funding_rate"
+    __table_args__ = (
+        # Per-coin history scans (history endpoint, latest rebuild)
+        Index("ix_signals_funding_rate_coin_created", "coin_name", "created_at"),
+        UniqueConstraint("source_message_id", name="uq_signals_funding_rate_source_message_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     coin_name = Column(String(100), nullable=False, index=True)
@@ -63,6 +76,8 @@ class SignalFundingRate(Base):
     bybit_interval = Column(String(10))
     bybit_position = Column(String(10))
 
+    # Ingestion stream entry the signal came from; makes redelivery idempotent
+    source_message_id = Column(String(64))
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
@@ -71,6 +86,11 @@ class SignalMEXCDEX(Base):
     """MEXC & DEX Price Spread signal model."""
 
     __tablename__ = "signals_mexc_dex"
+    __table_args__ = (
+        # Per-coin history scans (history endpoint, latest rebuild)
+        Index("ix_signals_mexc_dex_coin_created", "coin_name", "created_at"),
+        UniqueConstraint("source_message_id", name="uq_signals_mexc_dex_source_message_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     coin_name = Column(String(100), nullable=False, index=True)
@@ -92,10 +112,86 @@ class SignalMEXCDEX(Base):
     token_contract = Column(String(100))
     token_chain = Column(String(50))  # 'ETH', 'BSC', etc.
 
+    # Ingestion stream entry the signal came from; makes redelivery idempotent
+    source_message_id = Column(String(64))
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 
+class LatestSignal(Base):
+    """Newest signal per coin for each signal type, upserted on insert."""
+
+    __tablename__ = "latest_signals"
+    __table_args__ = (
+        UniqueConstraint("signal_type", "coin_name", name="uq_latest_signals_type_coin"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    signal_type = Column(String(50), nullable=False)  # 'mexc_spot_futures', 'funding_rate', 'mexc_dex'
+    coin_name = Column(String(100), nullable=False)
+    signal_id = Column(Integer, nullable=False)
+    payload = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)  # Signal response JSON
+    created_at = Column(DateTime(timezone=True), nullable=False, index=True)  # Of the signal
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class SignalStatsMinute(Base):
+    """Per-coin signal statistics rolled up per minute."""
+
+    __tablename__ = "signal_stats_minute"
+    __table_args__ = (
+        UniqueConstraint("signal_type", "coin_name", "bucket_start", name="uq_signal_stats_minute_bucket"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    signal_type = Column(String(50), nullable=False)
+    coin_name = Column(String(100), nullable=False)
+    bucket_start = Column(DateTime(timezone=True), nullable=False, index=True)
+    signal_count = Column(Integer, nullable=False, default=0)
+    value_count = Column(Integer, nullable=False, default=0)  # Signals with a metric value
+    value_sum = Column(Numeric(20, 8))
+    value_max = Column(Numeric(20, 8))
+    last_value = Column(Numeric(20, 8))
+    first_seen = Column(DateTime(timezone=True), nullable=False)
+    last_seen = Column(DateTime(timezone=True), nullable=False)
+
+
+class SignalStatsHour(Base):
+    """Per-coin signal statistics rolled up per hour."""
+
+    __tablename__ = "signal_stats_hour"
+    __table_args__ = (
+        UniqueConstraint("signal_type", "coin_name", "bucket_start", name="uq_signal_stats_hour_bucket"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    signal_type = Column(String(50), nullable=False)
+    coin_name = Column(String(100), nullable=False)
+    bucket_start = Column(DateTime(timezone=True), nullable=False, index=True)
+    signal_count = Column(Integer, nullable=False, default=0)
+    value_count = Column(Integer, nullable=False, default=0)  # Signals with a metric value
+    value_sum = Column(Numeric(20, 8))
+    value_max = Column(Numeric(20, 8))
+    last_value = Column(Numeric(20, 8))
+    first_seen = Column(DateTime(timezone=True), nullable=False)
+    last_seen = Column(DateTime(timezone=True), nullable=False)
+
+
+class PriceHistory(Base):
+    """Observed price of a coin on one venue, used for backtesting."""
+
+    __tablename__ = "price_history"
+    __table_args__ = (
+        Index("ix_price_history_coin_venue_recorded", "coin_name", "venue", "recorded_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    coin_name = Column(String(100), nullable=False)
+    venue = Column(String(20), nullable=False)  # 'mexc_spot', 'mexc_futures', 'mexc_futures_dex', 'dex'
+    price = Column(Numeric(20, 8), nullable=False)
+    recorded_at = Column(DateTime(timezone=True), nullable=False)
+
+
 class Notification(Base):
     """Notification model."""
 
@@ -112,6 +208,51 @@ class Notification(Base):
     read_at = Column(DateTime(timezone=True), nullable=True)
 
 
+class EmailOutbox(Base):
+    """Email waiting for delivery, written in the same transaction as its notification."""
+
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # Worker poll: due pending emails
+        Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, nullable=False, index=True)
+    to_email = Column(String(255), nullable=False)
+    signal_type = Column(String(50))
+    signal_id = Column(Integer)
+    subject = Column(String(255), nullable=False)
+    html_body = Column(String, nullable=False)
+    text_body = Column(String)
+    status = Column(String(20), nullable=False, default="pending")  # 'pending', 'sent', 'dead'
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(String)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class EmailDigestItem(Base):
+    """Signal waiting to be sent in a user's next email digest."""
+
+    __tablename__ = "email_digest_items"
+    __table_args__ = (
+        # Digest task: oldest waiting item per user and period
+        Index("ix_email_digest_items_period_user_created", "period", "user_id", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, nullable=False)
+    period = Column(String(10), nullable=False)  # '5m', '1h'
+    signal_type = Column(String(50))
+    signal_id = Column(Integer)
+    coin_name = Column(String(100))
+    title = Column(String(255))
+    body = Column(String)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 class CoinMarketCapData(Base):
     """CoinMarketCap data cache model."""
 
@@ -60,6 +60,7 @@ class UserPreferences(Base):
     mexc_spot_futures_sound = Column(Boolean, default=True)
     mexc_spot_futures_browser_notif = Column(Boolean, default=True)
     mexc_spot_futures_email_notif = Column(Boolean, default=False)
+    mexc_spot_futures_email_digest = Column(String(10), default="immediate")  # 'immediate', '5m', '1h'
 
     # Funding Rate
     funding_rate_enabled = Column(Boolean, default=True)
@@ -67,6 +68,7 @@ class UserPreferences(Base):
     funding_rate_sound = Column(Boolean, default=True)
     funding_rate_browser_notif = Column(Boolean, default=True)
     funding_rate_email_notif = Column(Boolean, default=False)
+    funding_rate_email_digest = Column(String(10), default="immediate")  # 'immediate', '5m', '1h'
 
     # MEXC & DEX
     mexc_dex_enabled = Column(Boolean, default=True)
@@ -74,6 +76,11 @@ class UserPreferences(Base):
     mexc_dex_sound = Column(Boolean, default=True)
     mexc_dex_browser_notif = Column(Boolean, default=True)
     mexc_dex_email_notif = Column(Boolean, default=False)
+    mexc_dex_email_digest = Column(String(10), default="immediate")  # 'immediate', '5m', '1h'
+
+    # Alert suppression overrides (None = global setting); can only widen suppression
+    alert_suppression_seconds = Column(Integer, nullable=True)
+    alert_min_change_percent = Column(String(10), nullable=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
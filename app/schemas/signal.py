@@ -91,4 +91,17 @@ class SignalListResponse(BaseModel):
     pagination: dict
 
 
+class LatestSignalResponse(BaseModel):
+    """Newest signal of a coin for one signal type."""
 
+    signal_type: str
+    coin_name: str
+    signal_id: int
+    created_at: datetime
+    signal: dict
+
+
+class LatestSignalListResponse(BaseModel):
+    """Latest signal per coin list response schema."""
+
+    data: list[LatestSignalResponse]
@@ -3,6 +3,9 @@ from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, EmailStr, Field
 
+# Email delivery per signal type: each email right away, or a digest every 5 minutes / hour
+EMAIL_DIGEST_PATTERN = r"^(immediate|5m|1h)$"
+
 
 class UserProfileResponse(BaseModel):
     """User profile response schema."""
@@ -32,6 +35,7 @@ class UserPreferencesResponse(BaseModel):
     mexc_spot_futures_sound: bool = True
     mexc_spot_futures_browser_notif: bool = True
     mexc_spot_futures_email_notif: bool = False
+    mexc_spot_futures_email_digest: str = "immediate"
 
     # Funding Rate
     funding_rate_enabled: bool = True
@@ -39,6 +43,7 @@ class UserPreferencesResponse(BaseModel):
     funding_rate_sound: bool = True
     funding_rate_browser_notif: bool = True
     funding_rate_email_notif: bool = False
+    funding_rate_email_digest: str = "immediate"
 
     # MEXC & DEX
     mexc_dex_enabled: bool = True
@@ -46,6 +51,11 @@ class UserPreferencesResponse(BaseModel):
     mexc_dex_sound: bool = True
     mexc_dex_browser_notif: bool = True
     mexc_dex_email_notif: bool = False
+    mexc_dex_email_digest: str = "immediate"
+
+    # Alert suppression overrides
+    alert_suppression_seconds: Optional[int] = None
+    alert_min_change_percent: Optional[str] = None
 
     class Config:
         from_attributes = True
@@ -65,6 +75,7 @@ class UserPreferencesUpdate(BaseModel):
     mexc_spot_futures_sound: Optional[bool] = None
     mexc_spot_futures_browser_notif: Optional[bool] = None
     mexc_spot_futures_email_notif: Optional[bool] = None
+    mexc_spot_futures_email_digest: Optional[str] = Field(None, pattern=EMAIL_DIGEST_PATTERN)
 
     # Funding Rate
     funding_rate_enabled: Optional[bool] = None
@@ -72,6 +83,7 @@ class UserPreferencesUpdate(BaseModel):
     funding_rate_sound: Optional[bool] = None
     funding_rate_browser_notif: Optional[bool] = None
     funding_rate_email_notif: Optional[bool] = None
+    funding_rate_email_digest: Optional[str] = Field(None, pattern=EMAIL_DIGEST_PATTERN)
 
     # MEXC & DEX
     mexc_dex_enabled: Optional[bool] = None
@@ -79,6 +91,11 @@ class UserPreferencesUpdate(BaseModel):
     mexc_dex_sound: Optional[bool] = None
     mexc_dex_browser_notif: Optional[bool] = None
     mexc_dex_email_notif: Optional[bool] = None
+    mexc_dex_email_digest: Optional[str] = Field(None, pattern=EMAIL_DIGEST_PATTERN)
+
+    # Alert suppression overrides
+    alert_suppression_seconds: Optional[int] = Field(None, ge=0, le=86400)
+    alert_min_change_percent: Optional[str] = Field(None, pattern=r"^\d+(\.\d+)?$")
 
 
 class ChangePasswordRequest(BaseModel):
@@ -0,0 +1,358 @@
+"""Historical backtesting of spread signals.
+
+A MEXC spot-futures or MEXC-DEX signal is treated as a convergence trade:
+long the cheaper leg and short the dearer one at the signal's prices, then
+exit when the spread closes below a threshold, on stop-loss or take-profit,
+or when the holding period ends. Leg prices after entry come from
+``price_history``, sampled on a fixed time grid, so every signal's path is a
+row of a ``(signals, steps)`` array and all exits are found in one pass.
+
+``price_history`` is only fed from signals: a leg price after entry is known
+only when a later signal for the same coin is posted, which happens while
+its spread is wide. Paths are therefore sparse and biased towards wide
+spreads, so a price is carried forward for at most ``max_staleness_minutes``
+(a few minutes by default) and every report says so in ``price_source``.
+The MEXC leg of MEXC-DEX signals is kept apart from the spot-futures
+signals' futures prices; the two feeds quote and sample it differently.
+
+    python -m app.services.analytics.backtest --signal-type mexc_dex --days 30
+"""
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.signal import SignalMEXCSpotFutures, SignalMEXCDEX, PriceHistory
+
+# signal_type -> (model, leg A (venue, price column), leg B (venue, price column))
+LEGS = {
+    "mexc_spot_futures": (
+        SignalMEXCSpotFutures,
+        ("mexc_spot", "mexc_spot_price"),
+        ("mexc_futures", "mexc_futures_price"),
+    ),
+    "mexc_dex": (
+        SignalMEXCDEX,
+        ("mexc_futures_dex", "mexc_price"),
+        ("dex", "dex_price"),
+    ),
+}
+
+EXIT_REASONS = ("converged", "take_profit", "stop_loss", "timeout")
+DEFAULT_MAX_STALENESS_MINUTES = 5
+PRICE_SOURCE = {
+    "kind": "signal_observations",
+    "note": (
+        "Prices after entry are only observed when a later signal for the same coin "
+        "is posted, i.e. while its spread is wide; paths are sparse and biased towards "
+        "wide spreads. A price is carried forward for at most max_staleness_minutes."
+    ),
+}
+_NEVER = np.iinfo(np.int64).max
+
+
+def _epoch(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def record_signal_prices(db: AsyncSession, signal_type: str, signal) -> None:
+    """Add the leg prices observed in a flushed signal to price_history."""
+    if signal_type not in LEGS:
+        return
+    _, *legs = LEGS[signal_type]
+    for venue, column in legs:
+        price = getattr(signal, column)
+        if price:
+            db.add(PriceHistory(
+                coin_name=signal.coin_name,
+                venue=venue,
+                price=price,
+                recorded_at=signal.created_at,
+            ))
+
+
+def _prices_at(series: Optional[Tuple[np.ndarray, np.ndarray]], times: np.ndarray, max_staleness: float) -> np.ndarray:
+    """Last observed price at each time, NaN when missing or older than max_staleness seconds."""
+    if series is None:
+        return np.full(times.shape, np.nan)
+    timestamps, prices = series
+    index = np.searchsorted(timestamps, times, side="right") - 1
+    clipped = np.clip(index, 0, None)
+    result = prices[clipped]
+    stale = (index < 0) | (times - timestamps[clipped] > max_staleness)
+    return np.where(stale, np.nan, result)
+
+
+def simulate(
+    coins: np.ndarray,
+    entry_times: np.ndarray,
+    entry_a: np.ndarray,
+    entry_b: np.ndarray,
+    prices_a: Dict[str, Tuple[np.ndarray, np.ndarray]],
+    prices_b: Dict[str, Tuple[np.ndarray, np.ndarray]],
+    hold_minutes: int = 240,
+    step_minutes: int = 1,
+    exit_spread: float = 0.5,
+    stop_loss: Optional[float] = None,
+    take_profit: Optional[float] = None,
+    fee_bps: float = 10.0,
+    max_staleness_minutes: int = DEFAULT_MAX_STALENESS_MINUTES,
+) -> Dict[str, np.ndarray]:
+    """Simulate every signal's trade; percentages throughout.
+
+    ``prices_a``/``prices_b`` map a coin to sorted ``(epoch seconds, price)``
+    arrays for the leg's venue. Returns per-trade ``pnl``, ``exit_step``,
+    ``reason`` (index into ``EXIT_REASONS``) and a ``traded`` mask for signals
+    that had price data after entry.
+    """
+    steps = hold_minutes // step_minutes
+    offsets = np.arange(steps + 1) * step_minutes * 60.0
+    times = entry_times[:, None] + offsets[None, :]
+    max_staleness = max_staleness_minutes * 60.0
+
+    path_a = np.empty(times.shape)
+    path_b = np.empty(times.shape)
+    # Group signal rows by coin once, then look prices up per coin
+    coin_names, inverse = np.unique(coins, return_inverse=True)
+    order = np.argsort(inverse, kind="stable")
+    bounds = np.searchsorted(inverse[order], np.arange(len(coin_names) + 1))
+    for i, coin in enumerate(coin_names):
+        rows = order[bounds[i]:bounds[i + 1]]
+        path_a[rows] = _prices_at(prices_a.get(coin), times[rows], max_staleness)
+        path_b[rows] = _prices_at(prices_b.get(coin), times[rows], max_staleness)
+    path_a[:, 0] = entry_a
+    path_b[:, 0] = entry_b
+
+    # Long the cheaper leg, short the dearer one
+    direction = np.where(entry_b >= entry_a, 1.0, -1.0)[:, None]
+    costs = 4 * fee_bps / 100  # two legs, entry and exit
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pnl = direction * ((path_a / entry_a[:, None] - 1) - (path_b / entry_b[:, None] - 1)) * 100 - costs
+        spread = np.abs(path_b - path_a) / path_a * 100
+
+    valid = ~np.isnan(pnl)
+    valid[:, 0] = False
+
+    def first(condition: np.ndarray) -> np.ndarray:
+        condition = condition & valid
+        return np.where(condition.any(axis=1), condition.argmax(axis=1), _NEVER)
+
+    with np.errstate(invalid="ignore"):
+        candidates = np.stack([
+            first(spread <= exit_spread),
+            first(pnl >= take_profit) if take_profit is not None else np.full(len(pnl), _NEVER),
+            first(pnl <= -stop_loss) if stop_loss is not None else np.full(len(pnl), _NEVER),
+        ])
+    exit_step = candidates.min(axis=0)
+    # On a tie the stop-loss wins: the conservative assumption
+    reason = np.where(candidates[2] == exit_step, 2, candidates.argmin(axis=0))
+
+    # No rule fired: exit at the last step with a price
+    last_valid = np.where(valid.any(axis=1), steps - valid[:, ::-1].argmax(axis=1), -1)
+    timed_out = exit_step == _NEVER
+    exit_step = np.where(timed_out, last_valid, exit_step)
+    reason = np.where(timed_out, 3, reason)
+    traded = exit_step > 0
+
+    rows = np.arange(len(pnl))
+    return {
+        "pnl": np.where(traded, pnl[rows, np.clip(exit_step, 0, steps)], np.nan),
+        "exit_step": exit_step,
+        "reason": reason,
+        "traded": traded,
+    }
+
+
+def summarize(trades: Dict[str, np.ndarray], step_minutes: int = 1) -> Dict[str, Any]:
+    """PnL statistics of simulated trades, in the order they were entered."""
+    traded = trades["traded"]
+    pnl = trades["pnl"][traded]
+    summary: Dict[str, Any] = {
+        "signals": int(len(traded)),
+        "trades": int(traded.sum()),
+        "skipped_no_data": int((~traded).sum()),
+    }
+    if not len(pnl):
+        return summary
+
+    cumulative = np.cumsum(pnl)
+    drawdown = np.maximum.accumulate(np.concatenate(([0.0], cumulative)))[1:] - cumulative
+    gains, losses = pnl[pnl > 0].sum(), -pnl[pnl < 0].sum()
+    reasons = np.bincount(trades["reason"][traded], minlength=len(EXIT_REASONS))
+    summary.update({
+        "win_rate": round(float((pnl > 0).mean()), 4),
+        "pnl_mean": round(float(pnl.mean()), 4),
+        "pnl_median": round(float(np.median(pnl)), 4),
+        "pnl_std": round(float(pnl.std()), 4),
+        "pnl_total": round(float(pnl.sum()), 4),
+        "pnl_best": round(float(pnl.max()), 4),
+        "pnl_worst": round(float(pnl.min()), 4),
+        "profit_factor": round(float(gains / losses), 4) if losses else None,
+        "max_drawdown": round(float(drawdown.max()), 4),
+        "avg_holding_minutes": round(float(trades["exit_step"][traded].mean() * step_minutes), 2),
+        "exit_reasons": {name: int(count) for name, count in zip(EXIT_REASONS, reasons)},
+    })
+    return summary
+
+
+async def _load_price_series(
+    db: AsyncSession,
+    venue: str,
+    coins: List[str],
+    start: datetime,
+    end: datetime,
+) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    result = await db.execute(
+        select(PriceHistory.coin_name, PriceHistory.recorded_at, PriceHistory.price)
+        .where(
+            PriceHistory.venue == venue,
+            PriceHistory.coin_name.in_(coins),
+            PriceHistory.recorded_at >= start,
+            PriceHistory.recorded_at <= end,
+        )
+        .order_by(PriceHistory.coin_name, PriceHistory.recorded_at)
+    )
+    grouped: Dict[str, Tuple[list, list]] = {}
+    for coin_name, recorded_at, price in result:
+        timestamps, prices = grouped.setdefault(coin_name, ([], []))
+        timestamps.append(_epoch(recorded_at))
+        prices.append(float(price))
+    return {
+        coin_name: (np.array(timestamps), np.array(prices))
+        for coin_name, (timestamps, prices) in grouped.items()
+    }
+
+
+async def run_backtest(
+    db: AsyncSession,
+    signal_type: str,
+    since: datetime,
+    until: datetime,
+    coin_name: Optional[str] = None,
+    min_spread: Optional[float] = None,
+    max_signals: int = 50000,
+    **params,
+) -> Dict[str, Any]:
+    """Backtest the signals of a type in ``[since, until]``; ``params`` go to ``simulate``.
+
+    Raises ValueError if more than ``max_signals`` signals match.
+    """
+    model, (venue_a, column_a), (venue_b, column_b) = LEGS[signal_type]
+    spread_column = model.spread if signal_type == "mexc_spot_futures" else model.spread_percent
+    query = select(
+        model.coin_name, model.created_at, getattr(model, column_a), getattr(model, column_b)
+    ).where(
+        model.created_at >= since,
+        model.created_at <= until,
+        getattr(model, column_a) > 0,
+        getattr(model, column_b) > 0,
+    )
+    if coin_name:
+        query = query.where(model.coin_name == coin_name)
+    if min_spread is not None:
+        query = query.where(spread_column >= min_spread)
+    query = query.order_by(model.created_at).limit(max_signals + 1)
+    records = (await db.execute(query)).all()
+    if len(records) > max_signals:
+        raise ValueError(
+            f"More than {max_signals} signals match; narrow the date range or filter by coin or min_spread"
+        )
+
+    parameters = {
+        "hold_minutes": params.get("hold_minutes", 240),
+        "step_minutes": params.get("step_minutes", 1),
+        "exit_spread": params.get("exit_spread", 0.5),
+        "stop_loss": params.get("stop_loss"),
+        "take_profit": params.get("take_profit"),
+        "fee_bps": params.get("fee_bps", 10.0),
+        "max_staleness_minutes": params.get("max_staleness_minutes", DEFAULT_MAX_STALENESS_MINUTES),
+    }
+    report = {
+        "signal_type": signal_type,
+        "since": since,
+        "until": until,
+        "coin_name": coin_name,
+        "parameters": parameters,
+        "price_source": PRICE_SOURCE,
+    }
+    if not records:
+        report["summary"] = {"signals": 0, "trades": 0, "skipped_no_data": 0}
+        return report
+
+    coins = np.array([record[0] for record in records], dtype=object)
+    entry_times = np.array([_epoch(record[1]) for record in records])
+    entry_a = np.array([float(record[2]) for record in records])
+    entry_b = np.array([float(record[3]) for record in records])
+
+    unique_coins = sorted(set(coins))
+    window_end = max(record[1] for record in records) + timedelta(minutes=parameters["hold_minutes"])
+    window_start = min(record[1] for record in records) - timedelta(minutes=parameters["max_staleness_minutes"])
+    prices_a = await _load_price_series(db, venue_a, unique_coins, window_start, window_end)
+    prices_b = await _load_price_series(db, venue_b, unique_coins, window_start, window_end)
+
+    # The simulation is CPU-bound; keep it off the event loop
+    trades = await asyncio.to_thread(
+        simulate, coins, entry_times, entry_a, entry_b, prices_a, prices_b, **parameters
+    )
+    report["summary"] = summarize(trades, parameters["step_minutes"])
+    return report
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Backtest MEXC spot-futures or MEXC-DEX signals")
+    parser.add_argument("--signal-type", choices=sorted(LEGS), required=True)
+    parser.add_argument("--days", type=int, default=30, help="Backtest the last N days")
+    parser.add_argument("--coin", default=None)
+    parser.add_argument("--min-spread", type=float, default=None)
+    parser.add_argument("--hold-minutes", type=int, default=240)
+    parser.add_argument("--step-minutes", type=int, default=1)
+    parser.add_argument("--exit-spread", type=float, default=0.5, help="Exit when the spread closes below this, %%")
+    parser.add_argument("--stop-loss", type=float, default=None, help="Stop-loss, %%")
+    parser.add_argument("--take-profit", type=float, default=None, help="Take-profit, %%")
+    parser.add_argument("--fee-bps", type=float, default=10.0, help="Fee per leg per side, bps")
+    parser.add_argument("--max-staleness-minutes", type=int, default=DEFAULT_MAX_STALENESS_MINUTES)
+    return parser.parse_args(argv)
+
+
+async def _main(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.core.database import AsyncSessionLocal, engine
+
+    until = datetime.now(timezone.utc)
+    async with AsyncSessionLocal() as db:
+        report = await run_backtest(
+            db,
+            args.signal_type,
+            since=until - timedelta(days=args.days),
+            until=until,
+            coin_name=args.coin,
+            min_spread=args.min_spread,
+            hold_minutes=args.hold_minutes,
+            step_minutes=args.step_minutes,
+            exit_spread=args.exit_spread,
+            stop_loss=args.stop_loss,
+            take_profit=args.take_profit,
+            fee_bps=args.fee_bps,
+            max_staleness_minutes=args.max_staleness_minutes,
+        )
+    await engine.dispose()
+    return report
+
+
+def main(argv=None):
+    try:
+        report = asyncio.run(_main(parse_args(argv)))
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    print(json.dumps(report, indent=2, default=str))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
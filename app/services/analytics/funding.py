@@ -0,0 +1,139 @@
+"""Cross-exchange funding-rate arbitrage analytics.
+
+Funding signals carry a rate (percent per funding interval) and an interval
+("1h", "4h", "8h") for up to six exchanges. A window of signals is loaded into
+``(signals, exchanges)`` arrays, every rate is normalized to percent per hour
+and per year, and the best pair per coin is picked in one vectorized pass:
+long on the exchange with the lowest hourly rate, short on the highest.
+"""
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.signal import SignalFundingRate
+
+EXCHANGES = ("gate", "binance", "mexc", "ourbit", "bitget", "bybit")
+HOURS_PER_YEAR = 24 * 365
+# Most perpetual contracts settle funding every 8 hours
+DEFAULT_INTERVAL_HOURS = 8.0
+
+
+@lru_cache(maxsize=64)
+def parse_interval_hours(interval: Optional[str]) -> float:
+    """Funding interval like "1h", "1.0h" or "8h" in hours."""
+    if interval:
+        match = re.match(r"\s*([0-9]*\.?[0-9]+)\s*h", interval, re.IGNORECASE)
+        if match and float(match.group(1)) > 0:
+            return float(match.group(1))
+    return DEFAULT_INTERVAL_HOURS
+
+
+def compute_funding_arbitrage(
+    coins: Sequence[str],
+    rates: np.ndarray,
+    interval_hours: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Best long/short pair for the newest signal of each coin.
+
+    ``coins`` are ordered oldest signal first; ``rates`` and ``interval_hours``
+    are ``(signals, exchanges)`` arrays with NaN where an exchange is missing.
+    """
+    hourly = rates / interval_hours
+    valid = ~np.isnan(hourly)
+    pairable = valid.sum(axis=1) >= 2
+
+    # Long where funding is lowest (longs get paid when it is negative),
+    # short where it is highest
+    long_index = np.where(valid, hourly, np.inf).argmin(axis=1)
+    short_index = np.where(valid, hourly, -np.inf).argmax(axis=1)
+    rows = np.arange(len(hourly))
+    long_hourly = hourly[rows, long_index]
+    short_hourly = hourly[rows, short_index]
+    spread_hourly = np.where(pairable, short_hourly - long_hourly, np.nan)
+
+    # Group signals by coin: newest row per coin and mean spread over the window
+    coin_names, inverse = np.unique(np.asarray(coins, dtype=object), return_inverse=True)
+    latest = np.full(len(coin_names), -1)
+    np.maximum.at(latest, inverse, rows)
+    samples = np.bincount(inverse, weights=pairable, minlength=len(coin_names))
+    spread_total = np.bincount(
+        inverse, weights=np.where(pairable, spread_hourly, 0.0), minlength=len(coin_names)
+    )
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_spread = np.where(samples > 0, spread_total / samples, np.nan)
+
+    return {
+        "coin_name": coin_names,
+        "row": latest,
+        "pairable": pairable[latest],
+        "long_index": long_index[latest],
+        "short_index": short_index[latest],
+        "long_hourly": long_hourly[latest],
+        "short_hourly": short_hourly[latest],
+        "spread_hourly": spread_hourly[latest],
+        "mean_spread_hourly": mean_spread,
+        "samples": samples.astype(int),
+    }
+
+
+def _number(value: float, digits: int = 6) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), digits)
+
+
+async def funding_arbitrage(
+    db: AsyncSession,
+    window_hours: int = 24,
+    limit: int = 50,
+    now: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """Best funding arbitrage pair per coin over a window, widest spread first."""
+    since = (now or datetime.now(timezone.utc)) - timedelta(hours=window_hours)
+    columns = [SignalFundingRate.coin_name, SignalFundingRate.hourly_profit, SignalFundingRate.created_at]
+    for exchange in EXCHANGES:
+        columns.append(getattr(SignalFundingRate, f"{exchange}_rate"))
+        columns.append(getattr(SignalFundingRate, f"{exchange}_interval"))
+    result = await db.execute(
+        select(*columns)
+        .where(SignalFundingRate.created_at >= since)
+        .order_by(SignalFundingRate.created_at, SignalFundingRate.id)
+    )
+    records = result.all()
+    if not records:
+        return []
+
+    coins = [record[0] for record in records]
+    rates = np.array(
+        [[np.nan if record[3 + 2 * i] is None else float(record[3 + 2 * i]) for i in range(len(EXCHANGES))]
+         for record in records],
+        dtype=float,
+    )
+    interval_hours = np.array(
+        [[parse_interval_hours(record[4 + 2 * i]) for i in range(len(EXCHANGES))] for record in records],
+        dtype=float,
+    )
+
+    pairs = compute_funding_arbitrage(coins, rates, interval_hours)
+
+    results = []
+    for i in np.flatnonzero(pairs["pairable"]):
+        record = records[pairs["row"][i]]
+        spread_hourly = pairs["spread_hourly"][i]
+        results.append({
+            "coin_name": pairs["coin_name"][i],
+            "long_exchange": EXCHANGES[pairs["long_index"][i]],
+            "short_exchange": EXCHANGES[pairs["short_index"][i]],
+            "long_rate_hourly": _number(pairs["long_hourly"][i]),
+            "short_rate_hourly": _number(pairs["short_hourly"][i]),
+            "spread_hourly": _number(spread_hourly),
+            "spread_annualized": _number(spread_hourly * HOURS_PER_YEAR, 2),
+            "mean_spread_hourly": _number(pairs["mean_spread_hourly"][i]),
+            "samples": int(pairs["samples"][i]),
+            "reported_hourly_profit": record[1],
+            "created_at": record[2],
+        })
+
+    results.sort(key=lambda entry: entry["spread_hourly"], reverse=True)
+    return results[:limit]
@@ -0,0 +1,102 @@
+"""Analytics Service API routes."""
+from typing import Optional
+from datetime import datetime, timedelta, timezone
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.dependencies import require_vip
+from app.core.responses import FastJSONResponse
+from app.models.user import User
+from app.services.analytics.funding import funding_arbitrage, HOURS_PER_YEAR
+from app.services.analytics.backtest import DEFAULT_MAX_STALENESS_MINUTES, run_backtest
+
+router = APIRouter(prefix="/api/v1/analytics", tags=["analytics"])
+
+
+@router.get("/funding-arbitrage")
+async def get_funding_arbitrage(
+    window_hours: int = Query(24, ge=1, le=168),
+    limit: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(require_vip),
+):
+    """Get the best cross-exchange funding pair per coin (VIP only).
+
+    Rates are in percent, normalized per hour and annualized over 365 days.
+    """
+    rows = await funding_arbitrage(db, window_hours=window_hours, limit=limit)
+    return FastJSONResponse({
+        "window_hours": window_hours,
+        "hours_per_year": HOURS_PER_YEAR,
+        "data": rows,
+    })
+
+
+@router.get("/backtest")
+async def get_backtest(
+    signal_type: str = Query(..., regex="^(mexc_spot_futures|mexc_dex)$"),
+    since: Optional[datetime] = Query(None),
+    until: Optional[datetime] = Query(None),
+    coin: Optional[str] = Query(None),
+    min_spread: Optional[float] = Query(None, ge=0),
+    hold_minutes: int = Query(240, ge=1, le=10080),
+    step_minutes: int = Query(1, ge=1, le=60),
+    exit_spread: float = Query(0.5, ge=0),
+    stop_loss: Optional[float] = Query(None, gt=0),
+    take_profit: Optional[float] = Query(None, gt=0),
+    fee_bps: float = Query(10.0, ge=0),
+    max_staleness_minutes: int = Query(DEFAULT_MAX_STALENESS_MINUTES, ge=1, le=60),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(require_vip),
+):
+    """Backtest spread signals as convergence trades and return PnL statistics (VIP only).
+
+    Prices after entry are only those observed in later signals, so paths are
+    sparse and biased towards wide spreads; ``price_source`` in the response
+    describes this. A price is carried forward for at most
+    ``max_staleness_minutes``.
+    """
+    until = until or datetime.now(timezone.utc)
+    since = since or until - timedelta(days=30)
+    if since >= until:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="since must be earlier than until",
+        )
+    if until - since > timedelta(days=settings.backtest_max_days):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"The date range must not exceed {settings.backtest_max_days} days",
+        )
+    if hold_minutes // step_minutes > 2000:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="hold_minutes / step_minutes must not exceed 2000 steps",
+        )
+
+    # Bound the signals x steps arrays of the simulation
+    steps = hold_minutes // step_minutes + 1
+    try:
+        report = await run_backtest(
+            db,
+            signal_type,
+            since=since,
+            until=until,
+            coin_name=coin,
+            min_spread=min_spread,
+            max_signals=settings.backtest_max_cells // steps,
+            hold_minutes=hold_minutes,
+            step_minutes=step_minutes,
+            exit_spread=exit_spread,
+            stop_loss=stop_loss,
+            take_profit=take_profit,
+            fee_bps=fee_bps,
+            max_staleness_minutes=max_staleness_minutes,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    return FastJSONResponse(report)
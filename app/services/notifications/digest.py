@@ -0,0 +1,90 @@
+"""Email digests for users who prefer fewer emails.
+
+Signals for a user whose ``*_email_digest`` preference is ``5m`` or ``1h``
+are stored as ``EmailDigestItem`` rows instead of being emailed one by one.
+Once the oldest waiting item of a user is a full period old, all of that
+user's items for the period are folded into one email in the outbox.
+"""
+from datetime import datetime, timedelta, timezone
+from itertools import groupby
+from typing import Optional
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.signal import EmailDigestItem
+from app.models.user import User
+from app.services.notifications.email import email_service
+from app.services.notifications.outbox import queue_email
+
+# Digest period -> (seconds, name used in the email)
+EMAIL_DIGEST_PERIODS = {
+    "5m": (300, "5 minutes"),
+    "1h": (3600, "hour"),
+}
+
+
+def add_digest_item(
+    db: AsyncSession,
+    user_id: int,
+    period: str,
+    signal_type: str,
+    signal_id: int,
+    coin_name: str,
+    title: str,
+    body: str,
+) -> EmailDigestItem:
+    """Hold a signal for the user's next digest; saved when the caller commits."""
+    item = EmailDigestItem(
+        user_id=user_id,
+        period=period,
+        signal_type=signal_type,
+        signal_id=signal_id,
+        coin_name=coin_name,
+        title=title,
+        body=body,
+    )
+    db.add(item)
+    return item
+
+
+async def send_due_digests(db: AsyncSession, now: Optional[datetime] = None) -> int:
+    """Queue one digest email per user whose period is up. Returns emails queued.
+
+    Items are locked with SKIP LOCKED, so concurrent workers never send a
+    digest twice.
+    """
+    now = now or datetime.now(timezone.utc)
+    queued = 0
+    for period, (seconds, period_name) in EMAIL_DIGEST_PERIODS.items():
+        due_users = (
+            select(EmailDigestItem.user_id)
+            .where(EmailDigestItem.period == period)
+            .group_by(EmailDigestItem.user_id)
+            .having(func.min(EmailDigestItem.created_at) <= now - timedelta(seconds=seconds))
+        )
+        result = await db.execute(
+            select(EmailDigestItem)
+            .where(EmailDigestItem.period == period, EmailDigestItem.user_id.in_(due_users))
+            .order_by(EmailDigestItem.user_id, EmailDigestItem.created_at, EmailDigestItem.id)
+            .with_for_update(skip_locked=True)
+        )
+        items = result.scalars().all()
+        if not items:
+            continue
+
+        users = {
+            user.id: user
+            for user in (
+                await db.execute(select(User).where(User.id.in_({item.user_id for item in items})))
+            ).scalars()
+        }
+        for user_id, user_items in groupby(items, key=lambda item: item.user_id):
+            user_items = list(user_items)
+            user = users.get(user_id)
+            if user is not None:
+                subject, html_body, text_body = email_service.generate_digest_email(user_items, period_name)
+                queue_email(db, user, subject, html_body, text_body)
+                queued += 1
+
+        await db.execute(delete(EmailDigestItem).where(EmailDigestItem.id.in_([item.id for item in items])))
+    await db.commit()
+    return queued
@@ -1,14 +1,94 @@
 """Email notification service."""
-import aiosmtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional
+from email.policy import SMTP as SMTP_POLICY
+from html import escape
+from typing import Any, Optional, Sequence
 from app.core.config import settings
+from app.services.notifications.smtp_pool import SMTPPool, create_smtp_pool
+
+SIGNAL_TYPE_NAMES = {
+    "mexc_spot_futures": "MEXC Spot & Futures",
+    "funding_rate": "Funding Rate Spread",
+    "mexc_dex": "MEXC & DEX Price Spread",
+}
+
+# Signals listed in one digest email; the rest are only counted
+DIGEST_MAX_ITEMS = 50
+
+
+class RenderedEmail:
+    """Email content rendered once and sent to any number of recipients.
+
+    The MIME message (headers, encoded parts) is serialized on first use
+    without a ``To`` header; each recipient gets those same bytes with only
+    their ``To`` line in front.
+    """
+
+    def __init__(self, subject: str, html_body: str, text_body: Optional[str] = None):
+        self.subject = subject
+        self.html_body = html_body
+        self.text_body = text_body
+        self._payload: Optional[bytes] = None
+
+    def payload(self) -> bytes:
+        """The serialized message minus the ``To`` header."""
+        if self._payload is None:
+            message = email_service.build_message(None, self.subject, self.html_body, self.text_body)
+            self._payload = message.as_bytes(policy=SMTP_POLICY)
+        return self._payload
+
+    def message_bytes(self, to_email: str) -> bytes:
+        """The complete message for one recipient."""
+        return b"To: " + to_email.encode() + b"\r\n" + self.payload()
 
 
 class EmailService:
     """Service for sending email notifications."""
 
+    def __init__(self):
+        self.pool: Optional[SMTPPool] = None
+
+    def get_pool(self) -> SMTPPool:
+        """Connection pool for the configured SMTP server, created on first send."""
+        if self.pool is None:
+            self.pool = create_smtp_pool()
+        return self.pool
+
+    async def close(self):
+        """Close pooled SMTP connections."""
+        if self.pool is not None:
+            await self.pool.close()
+
+    def is_configured(self) -> bool:
+        return all([settings.smtp_host, settings.smtp_user, settings.smtp_password])
+
+    def build_message(
+        self,
+        to_email: Optional[str],
+        subject: str,
+        html_body: str,
+        text_body: Optional[str] = None,
+    ) -> MIMEMultipart:
+        """Build a multipart email with optional plain text and HTML parts.
+
+        Without ``to_email`` the message has no ``To`` header (see ``RenderedEmail``).
+        """
+        message = MIMEMultipart("alternative")
+        message["Subject"] = subject
+        message["From"] = settings.smtp_from_email
+        if to_email is not None:
+            message["To"] = to_email
+
+        # Add text and HTML parts
+        if text_body:
+            text_part = MIMEText(text_body, "plain")
+            message.attach(text_part)
+
+        html_part = MIMEText(html_body, "html")
+        message.attach(html_part)
+        return message
+
     async def send_email(
         self,
         to_email: str,
@@ -17,34 +97,15 @@ class EmailService:
         text_body: Optional[str] = None,
     ) -> bool:
         """Send email via SMTP."""
-        if not all([settings.smtp_host, settings.smtp_user, settings.smtp_password]):
+        if not self.is_configured():
             print("SMTP not configured, skipping email send")
             return False
 
         try:
-            # Create message
-            message = MIMEMultipart("alternative")
-            message["Subject"] = subject
-            message["From"] = settings.smtp_from_email
-            message["To"] = to_email
-
-            # Add text and HTML parts
-            if text_body:
-                text_part = MIMEText(text_body, "plain")
-                message.attach(text_part)
+            message = RenderedEmail(subject, html_body, text_body).message_bytes(to_email)
 
-            html_part = MIMEText(html_body, "html")
-            message.attach(html_part)
-
-            # Send email
-            await aiosmtplib.send(
-                message,
-                hostname=settings.smtp_host,
-                port=settings.smtp_port,
-                username=settings.smtp_user,
-                password=settings.smtp_password,
-                use_tls=settings.smtp_port == 587,
-            )
+            # Send email over a pooled connection
+            await self.get_pool().sendmail(settings.smtp_from_email, [to_email], message)
 
             return True
 
@@ -52,6 +113,10 @@ class EmailService:
             print(f"Error sending email to {to_email}: {e}")
             return False
 
+    def render_signal_email(self, signal_type: str, coin_name: str, signal_data: dict) -> RenderedEmail:
+        """Render a signal email once, for all of its recipients."""
+        return RenderedEmail(*self.generate_signal_email_html(signal_type, coin_name, signal_data))
+
     def generate_signal_email_html(
         self,
         signal_type: str,
@@ -63,13 +128,7 @@ class EmailService:
         Returns:
             tuple: (subject, html_body, text_body)
         """
-        signal_type_names = {
-            "mexc_spot_futures": "MEXC Spot & Futures",
-            "funding_rate": "Funding Rate Spread",
-            "mexc_dex": "MEXC & DEX Price Spread",
-        }
-
-        signal_name = signal_type_names.get(signal_type, signal_type)
+        signal_name = SIGNAL_TYPE_NAMES.get(signal_type, signal_type)
         subject = f"New {signal_name} Signal: {coin_name}"
 
         # Build HTML content
@@ -162,6 +221,78 @@ Signal Details:
         return subject, html, text
 
 
+    def generate_digest_email(self, items: Sequence[Any], period_name: str) -> tuple[str, str, str]:
+        """Generate one email for several signals (digest items, oldest first).
+
+        Returns:
+            tuple: (subject, html_body, text_body)
+        """
+        subject = f"{len(items)} new signals in the last {period_name}"
+        shown = items[:DIGEST_MAX_ITEMS]
+
+        rows = "".join(
+            f"""
+                        <tr>
+                            <td>{item.created_at:%H:%M}</td>
+                            <td>{escape(SIGNAL_TYPE_NAMES.get(item.signal_type, item.signal_type or ""))}</td>
+                            <td><strong>{escape(item.coin_name or "")}</strong></td>
+                            <td>{escape(item.body or "")}</td>
+                        </tr>"""
+            for item in shown
+        )
+        more = len(items) - len(shown)
+        more_html = f"<p>…and {more} more.</p>" if more > 0 else ""
+
+        html = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="UTF-8">
+            <style>
+                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
+                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
+                .header {{ background-color: #4CAF50; color: white; padding: 20px; text-align: center; }}
+                .content {{ background-color: #f9f9f9; padding: 20px; }}
+                table {{ width: 100%; border-collapse: collapse; background-color: white; }}
+                td {{ padding: 6px 8px; border-bottom: 1px solid #eee; }}
+                .footer {{ text-align: center; padding: 20px; color: #666; font-size: 12px; }}
+                .button {{ display: inline-block; padding: 10px 20px; background-color: #4CAF50; color: white; text-decoration: none; border-radius: 5px; }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <h1>📬 Signal Digest</h1>
+                </div>
+                <div class="content">
+                    <h2>{len(items)} new signals in the last {period_name}</h2>
+                    <table>{rows}
+                    </table>
+                    {more_html}
+                    <p style="text-align: center; margin-top: 20px;">
+                        <a href="https://cryptotracker.com/signals" class="button">View Signals</a>
+                    </p>
+                </div>
+                <div class="footer">
+                    <p>This is an automated notification from CryptoTracker</p>
+                    <p>You can switch between instant emails and digests in your profile settings.</p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
+        text = f"Signal Digest: {len(items)} new signals in the last {period_name}\n\n"
+        for item in shown:
+            signal_name = SIGNAL_TYPE_NAMES.get(item.signal_type, item.signal_type or "")
+            text += f"{item.created_at:%H:%M}  {signal_name}  {item.coin_name}: {item.body}\n"
+        if more > 0:
+            text += f"...and {more} more.\n"
+        text += "\nView signals at: https://cryptotracker.com/signals"
+
+        return subject, html, text
+
+
 # Global email service instance
 email_service = EmailService()
 
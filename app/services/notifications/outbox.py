@@ -0,0 +1,153 @@
+"""Transactional email outbox.
+
+Signal notifications write their emails to ``email_outbox`` in the same
+transaction as the notification rows instead of talking to SMTP inline, so
+SMTP latency and outages never hold up signal processing. ``EmailOutboxWorker``
+sends due rows in batches over the SMTP pool, retries failures with
+exponential backoff and marks a row dead after the last attempt.
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Optional
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.logging_config import get_logger
+from app.core.metrics import email_outbox_deliveries_total
+from app.models.signal import EmailOutbox
+from app.models.user import User
+from app.services.notifications.email import RenderedEmail, email_service
+
+logger = get_logger(__name__)
+
+
+def queue_email(
+    db: AsyncSession,
+    user: User,
+    subject: str,
+    html_body: str,
+    text_body: Optional[str] = None,
+    signal_type: Optional[str] = None,
+    signal_id: Optional[int] = None,
+) -> EmailOutbox:
+    """Add an email to the outbox; it is sent once the caller commits."""
+    email = EmailOutbox(
+        user_id=user.id,
+        to_email=user.email,
+        signal_type=signal_type,
+        signal_id=signal_id,
+        subject=subject,
+        html_body=html_body,
+        text_body=text_body,
+        status="pending",
+        attempts=0,
+    )
+    db.add(email)
+    return email
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff before the next attempt after ``attempts`` failures."""
+    seconds = settings.email_outbox_retry_base_seconds * 2 ** (attempts - 1)
+    return timedelta(seconds=min(seconds, settings.email_outbox_retry_max_seconds))
+
+
+class EmailOutboxWorker:
+    """Delivers due outbox emails until stopped."""
+
+    def __init__(self, send: Optional[Callable[[str, bytes], Awaitable]] = None):
+        self.send = send or (
+            lambda to_email, message: email_service.get_pool().sendmail(settings.smtp_from_email, [to_email], message)
+        )
+        self._running = False
+        self._last_purge: Optional[datetime] = None
+        self._last_digest: Optional[datetime] = None
+
+    async def _deliver(self, email: EmailOutbox, rendered: RenderedEmail, now: datetime):
+        try:
+            await self.send(email.to_email, rendered.message_bytes(email.to_email))
+        except Exception as e:
+            email.attempts += 1
+            email.last_error = str(e)[:1000]
+            if email.attempts >= settings.email_outbox_max_attempts:
+                email.status = "dead"
+                email_outbox_deliveries_total.labels(result="dead").inc()
+                logger.error("Email moved to dead letter", email_id=email.id, error=str(e))
+            else:
+                email.next_attempt_at = now + retry_delay(email.attempts)
+                email_outbox_deliveries_total.labels(result="retry").inc()
+            return
+        email.attempts += 1
+        email.status = "sent"
+        email.sent_at = now
+        email_outbox_deliveries_total.labels(result="sent").inc()
+
+    async def deliver_batch(self, db: AsyncSession) -> int:
+        """Send one batch of due emails. Returns the number of rows handled.
+
+        Rows are locked with SKIP LOCKED, so several workers never pick the same email.
+        """
+        now = datetime.now(timezone.utc)
+        result = await db.execute(
+            select(EmailOutbox)
+            .where(EmailOutbox.status == "pending", EmailOutbox.next_attempt_at <= now)
+            .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+            .limit(settings.email_outbox_batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        emails = result.scalars().all()
+        if emails:
+            # Recipients of the same signal share one serialized MIME message
+            rendered = {}
+            for email in emails:
+                key = (email.subject, email.html_body, email.text_body)
+                if key not in rendered:
+                    rendered[key] = RenderedEmail(*key)
+            # Concurrency is capped by the SMTP pool
+            await asyncio.gather(*(
+                self._deliver(email, rendered[(email.subject, email.html_body, email.text_body)], now)
+                for email in emails
+            ))
+        await db.commit()
+        return len(emails)
+
+    async def purge_sent(self, db: AsyncSession) -> int:
+        """Delete sent emails older than the retention period."""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=settings.email_outbox_retention_days)
+        result = await db.execute(
+            delete(EmailOutbox).where(EmailOutbox.status == "sent", EmailOutbox.sent_at < cutoff)
+        )
+        await db.commit()
+        return result.rowcount
+
+    async def run(self):
+        """Poll the outbox, and fold due digests into it, until ``stop`` is called."""
+        from app.services.notifications.digest import send_due_digests
+
+        self._running = True
+        logger.info("Email outbox worker started")
+        digest_interval = timedelta(seconds=settings.email_digest_poll_seconds)
+        while self._running:
+            try:
+                async with AsyncSessionLocal() as db:
+                    now = datetime.now(timezone.utc)
+                    if self._last_purge is None or now - self._last_purge >= timedelta(hours=1):
+                        self._last_purge = now
+                        await self.purge_sent(db)
+                    if self._last_digest is None or now - self._last_digest >= digest_interval:
+                        self._last_digest = now
+                        await send_due_digests(db, now)
+                    handled = await self.deliver_batch(db)
+                # A full batch means more may be due right away
+                if handled < settings.email_outbox_batch_size:
+                    await asyncio.sleep(settings.email_outbox_poll_seconds)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Email outbox worker error", error=str(e), exc_info=True)
+                await asyncio.sleep(settings.email_outbox_poll_seconds)
+
+    def stop(self):
+        """Ask the worker loop to exit after the current batch."""
+        self._running = False
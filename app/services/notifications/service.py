@@ -4,6 +4,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.user import User, UserPreferences, Subscription
 from app.models.signal import Notification
+from app.services.notifications.digest import EMAIL_DIGEST_PERIODS, add_digest_item
+from app.services.notifications.email import RenderedEmail
+from app.services.notifications.suppression import alert_suppressor
+from app.services.signals.leaderboard import SCORE_FIELDS
 from datetime import datetime
 
 
@@ -26,6 +30,15 @@ class NotificationService:
         if not preferences:
             return False
 
+        return self.preferences_allow(preferences, signal_type, signal_data)
+
+    def preferences_allow(
+        self,
+        preferences: UserPreferences,
+        signal_type: str,
+        signal_data: Dict[str, Any],
+    ) -> bool:
+        """Check already loaded user preferences against a signal."""
         # Check if notifications are enabled globally
         if not preferences.notifications_enabled:
             return False
@@ -68,8 +81,12 @@ class NotificationService:
         signal_id: int,
         title: str,
         body: str,
+        commit: bool = True,
     ) -> Notification:
-        """Create a notification record in database."""
+        """Create a notification record in database.
+
+        With ``commit=False`` the record is only added to the caller's transaction.
+        """
         notification = Notification(
             user_id=user_id,
             signal_type=signal_type,
@@ -79,8 +96,9 @@ class NotificationService:
             is_read=False,
         )
         db.add(notification)
-        await db.commit()
-        await db.refresh(notification)
+        if commit:
+            await db.commit()
+            await db.refresh(notification)
         return notification
 
     async def send_browser_notification(
@@ -149,6 +167,33 @@ class NotificationService:
             text_body=text_body,
         )
 
+    def queue_email_notification(
+        self,
+        db: AsyncSession,
+        user: User,
+        signal_type: str,
+        signal_id: int,
+        signal_data: Dict[str, Any],
+        rendered: Optional[RenderedEmail] = None,
+    ) -> Optional[RenderedEmail]:
+        """Add a signal email to the outbox in the caller's transaction.
+
+        Returns the rendered email so callers can pass it back in for the
+        signal's other recipients instead of rendering it again.
+        """
+        from app.services.notifications.email import email_service
+        from app.services.notifications.outbox import queue_email
+
+        if not email_service.is_configured():
+            return None
+
+        if rendered is None:
+            rendered = email_service.render_signal_email(
+                signal_type, signal_data.get("coin_name", "Unknown"), signal_data
+            )
+        queue_email(db, user, rendered.subject, rendered.html_body, rendered.text_body, signal_type, signal_id)
+        return rendered
+
     async def notify_users_about_signal(
         self,
         db: AsyncSession,
@@ -157,16 +202,44 @@ class NotificationService:
         signal_data: Dict[str, Any],
     ):
         """Notify all users who should receive notification about new signal."""
-        # Get all VIP users
+        coin_name = signal_data.get('coin_name', 'Unknown')
+        value = signal_data.get(SCORE_FIELDS.get(signal_type, ''))
+
+        # Suppress repeats of the same coin before any database work
+        if not await alert_suppressor.allow_signal(signal_type, coin_name, value):
+            return
+
+        # Get all VIP users with their preferences in one query
         result = await db.execute(
-            select(User.id, User.email, Subscription.user_id)
+            select(User, UserPreferences)
             .join(Subscription, User.id == Subscription.user_id)
+            .join(UserPreferences, User.id == UserPreferences.user_id)
             .where(Subscription.plan == 'vip', Subscription.status == 'active')
         )
-        vip_users = result.all()
+        recipients = [
+            (user, preferences)
+            for user, preferences in result.all()
+            if self.preferences_allow(preferences, signal_type, signal_data)
+        ]
+
+        # Users with their own, wider suppression window or threshold
+        user_rules = {}
+        for user, preferences in recipients:
+            if preferences.alert_suppression_seconds is None and not preferences.alert_min_change_percent:
+                continue
+            user_rules[user.id] = (
+                max(preferences.alert_suppression_seconds or 0, alert_suppressor.window_seconds),
+                max(float(preferences.alert_min_change_percent or 0), alert_suppressor.min_change_percent),
+            )
+        if user_rules:
+            allowed = await alert_suppressor.allow_users(signal_type, coin_name, value, user_rules)
+            recipients = [
+                (user, preferences)
+                for user, preferences in recipients
+                if user.id not in user_rules or user.id in allowed
+            ]
 
         # Generate notification title and body
-        coin_name = signal_data.get('coin_name', 'Unknown')
         title = f"New {signal_type.replace('_', ' ').title()} Signal: {coin_name}"
         
         if signal_type == 'mexc_spot_futures':
@@ -182,26 +255,15 @@ class NotificationService:
         else:
             body = "New signal available"
 
-        for user_id, email, _ in vip_users:
-            # Check if user should receive notification
-            should_send = await self.should_send_notification(
-                db, user_id, signal_type, signal_data
-            )
-
-            if not should_send:
-                continue
-
-            # Get user preferences for notification types
-            pref_result = await db.execute(
-                select(UserPreferences).where(UserPreferences.user_id == user_id)
-            )
-            preferences = pref_result.scalar_one_or_none()
-
-            if not preferences:
-                continue
+        # Email content is rendered once for all recipients
+        from app.services.notifications.email import email_service
+        email_configured = email_service.is_configured()
+        rendered_email = None
+        for user, preferences in recipients:
+            user_id = user.id
 
-            # Create notification record
-            await self.create_notification(db, user_id, signal_type, signal_id, title, body)
+            # Create notification record; committed together with the emails below
+            await self.create_notification(db, user_id, signal_type, signal_id, title, body, commit=False)
 
             # Send browser notification if enabled
             if signal_type == 'mexc_spot_futures' and preferences.mexc_spot_futures_browser_notif:
@@ -219,17 +281,28 @@ class NotificationService:
             elif signal_type == 'mexc_dex' and preferences.mexc_dex_sound:
                 await self.send_sound_notification(db, user_id, signal_type)
 
-            # Send email notification if enabled
-            user_result = await db.execute(select(User).where(User.id == user_id))
-            user = user_result.scalar_one_or_none()
-            
-            if user:
-                if signal_type == 'mexc_spot_futures' and preferences.mexc_spot_futures_email_notif:
-                    await self.send_email_notification(user, title, body, signal_data)
-                elif signal_type == 'funding_rate' and preferences.funding_rate_email_notif:
-                    await self.send_email_notification(user, title, body, signal_data)
-                elif signal_type == 'mexc_dex' and preferences.mexc_dex_email_notif:
-                    await self.send_email_notification(user, title, body, signal_data)
+            # Queue email notification if enabled; the outbox worker sends it.
+            # Without SMTP nothing would ever send it, so no digest item either
+            if not email_configured:
+                continue
+            if signal_type == 'mexc_spot_futures' and preferences.mexc_spot_futures_email_notif:
+                digest = preferences.mexc_spot_futures_email_digest
+            elif signal_type == 'funding_rate' and preferences.funding_rate_email_notif:
+                digest = preferences.funding_rate_email_digest
+            elif signal_type == 'mexc_dex' and preferences.mexc_dex_email_notif:
+                digest = preferences.mexc_dex_email_digest
+            else:
+                continue
+            if digest in EMAIL_DIGEST_PERIODS:
+                add_digest_item(db, user_id, digest, signal_type, signal_id, coin_name, title, body)
+            else:
+                rendered_email = self.queue_email_notification(
+                    db, user, signal_type, signal_id, signal_data, rendered_email
+                )
+
+        # Notifications and outbox emails in one transaction
+        if recipients:
+            await db.commit()
 
 
 # Global service instance
@@ -0,0 +1,159 @@
+"""Pool of persistent, logged-in SMTP connections.
+
+Opening a connection per email costs a TCP connect, TLS handshake, EHLO and
+AUTH before the message is even sent. The pool keeps connections open
+between sends, caps how many sends run at once, checks a connection that
+sat idle with NOOP before reusing it, reconnects when the server has dropped
+it and replaces each connection after a number of messages, since many
+providers limit messages per session.
+"""
+import asyncio
+import time
+from email.message import Message
+from typing import Awaitable, Callable, List, Optional, Sequence
+import aiosmtplib
+from app.core.config import settings
+
+
+class PooledConnection:
+    """An SMTP client with its usage counters."""
+
+    def __init__(self, client: aiosmtplib.SMTP):
+        self.client = client
+        self.messages = 0
+        self.last_used = time.monotonic()
+
+
+class SMTPPool:
+    """Up to ``size`` SMTP connections shared by concurrent senders."""
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = False,
+        size: int = 4,
+        max_messages: int = 100,
+        health_check_seconds: float = 30,
+        timeout: float = 30,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.max_messages = max_messages
+        self.health_check_seconds = health_check_seconds
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(size)
+        self._idle: List[PooledConnection] = []
+        self.connections_opened = 0
+
+    async def _open(self) -> PooledConnection:
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            use_tls=self.use_tls,
+            timeout=self.timeout,
+        )
+        # Logs in as part of connecting when credentials are set
+        await client.connect()
+        self.connections_opened += 1
+        return PooledConnection(client)
+
+    async def _discard(self, connection: PooledConnection):
+        try:
+            if connection.client.is_connected:
+                await connection.client.quit()
+        except Exception:
+            connection.client.close()
+
+    async def _healthy(self, connection: PooledConnection) -> bool:
+        if not connection.client.is_connected:
+            return False
+        if time.monotonic() - connection.last_used < self.health_check_seconds:
+            return True
+        try:
+            await connection.client.noop()
+            return True
+        except Exception:
+            return False
+
+    async def _acquire(self) -> PooledConnection:
+        """A working connection: the most recently used idle one, or a new one."""
+        while self._idle:
+            connection = self._idle.pop()
+            if await self._healthy(connection):
+                return connection
+            await self._discard(connection)
+        return await self._open()
+
+    async def _release(self, connection: PooledConnection):
+        connection.messages += 1
+        connection.last_used = time.monotonic()
+        if connection.messages >= self.max_messages:
+            await self._discard(connection)
+        else:
+            self._idle.append(connection)
+
+    async def send_message(self, message: Message):
+        """Send a message over a pooled connection."""
+        return await self._send(lambda client: client.send_message(message))
+
+    async def sendmail(self, sender: str, recipients: Sequence[str], message: bytes):
+        """Send an already serialized message over a pooled connection."""
+        return await self._send(lambda client: client.sendmail(sender, recipients, message))
+
+    async def _send(self, send: Callable[[aiosmtplib.SMTP], Awaitable]):
+        """Run a send on a pooled connection.
+
+        A connection the server closed is replaced and the send retried once;
+        errors the server returns for the message itself are raised as is.
+        """
+        async with self._slots:
+            for attempt in range(2):
+                connection = await self._acquire()
+                try:
+                    result = await send(connection.client)
+                except aiosmtplib.SMTPServerDisconnected:
+                    connection.client.close()
+                    if attempt:
+                        raise
+                    continue
+                except (aiosmtplib.SMTPResponseException, aiosmtplib.SMTPRecipientsRefused):
+                    # The session is usable after a rejected message once reset
+                    try:
+                        await connection.client.rset()
+                        self._idle.append(connection)
+                    except Exception:
+                        connection.client.close()
+                    raise
+                except Exception:
+                    connection.client.close()
+                    raise
+                await self._release(connection)
+                return result
+
+    async def close(self):
+        """Quit all idle connections."""
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(self._discard(connection) for connection in idle))
+
+
+def create_smtp_pool() -> SMTPPool:
+    """Pool for the configured SMTP server."""
+    return SMTPPool(
+        hostname=settings.smtp_host,
+        port=settings.smtp_port,
+        username=settings.smtp_user or None,
+        password=settings.smtp_password or None,
+        use_tls=settings.smtp_port == 587,
+        size=settings.smtp_pool_size,
+        max_messages=settings.smtp_pool_max_messages,
+        health_check_seconds=settings.smtp_pool_health_check_seconds,
+        timeout=settings.smtp_timeout_seconds,
+    )
@@ -0,0 +1,158 @@
+"""Alert suppression windows for repeated signals of the same coin.
+
+A signal notifies only if no alert went out for its ``(signal_type,
+coin_name)`` within the suppression window, or if its metric (spread,
+hourly profit) moved by at least ``min_change_percent`` relative to the last
+value that was notified. Suppressed signals do not move the reference value,
+so a slow drift still triggers once it adds up.
+
+The global window is checked before any database work. Users can set their
+own, wider window and threshold; those are checked for all such users in one
+call. State lives in process memory or, for several workers, in Redis.
+"""
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.core.config import settings
+
+# (key, window seconds, min change percent)
+SuppressionRule = Tuple[str, float, float]
+
+# Atomic check-and-set over many keys. ARGV: value, then window_ms and
+# min_change per key. Returns 1 (notify, value recorded) or 0 per key.
+_CHECK_AND_SET = """
+local value = ARGV[1]
+local result = {}
+for i, key in ipairs(KEYS) do
+    local window_ms = ARGV[2 * i]
+    local min_change = tonumber(ARGV[2 * i + 1])
+    local last = redis.call('GET', key)
+    local allow = 1
+    if last then
+        if value == '' or last == '' then
+            allow = 0
+        else
+            local current, previous = tonumber(value), tonumber(last)
+            if previous == 0 then
+                if current == 0 then allow = 0 end
+            elseif math.abs(current - previous) / math.abs(previous) * 100 < min_change then
+                allow = 0
+            end
+        end
+    end
+    if allow == 1 then
+        redis.call('SET', key, value, 'PX', window_ms)
+    end
+    result[i] = allow
+end
+return result
+"""
+
+
+def is_material_change(previous: Optional[float], current: Optional[float], min_change_percent: float) -> bool:
+    """Whether the metric moved enough to notify again inside a window."""
+    if previous is None or current is None:
+        return False
+    if previous == 0:
+        return current != 0
+    return abs(current - previous) / abs(previous) * 100 >= min_change_percent
+
+
+class MemorySuppressionBackend:
+    """Suppression state in process memory."""
+
+    def __init__(self):
+        # key -> (value, expires_at)
+        self._state: Dict[str, Tuple[Optional[float], float]] = {}
+
+    async def check_and_set(self, rules: Iterable[SuppressionRule], value: Optional[float]) -> List[bool]:
+        now = time.monotonic()
+        results = []
+        for key, window, min_change in rules:
+            entry = self._state.get(key)
+            allow = entry is None or entry[1] <= now or is_material_change(entry[0], value, min_change)
+            if allow:
+                self._state[key] = (value, now + window)
+            results.append(allow)
+        if len(self._state) > 10000:
+            self._state = {key: entry for key, entry in self._state.items() if entry[1] > now}
+        return results
+
+    def clear(self):
+        self._state.clear()
+
+
+class RedisSuppressionBackend:
+    """Suppression state in Redis, shared by all workers."""
+
+    def __init__(self, prefix: str = "alerts:suppress"):
+        self.prefix = prefix
+
+    async def check_and_set(self, rules: Iterable[SuppressionRule], value: Optional[float]) -> List[bool]:
+        from app.core.redis_client import get_redis
+
+        rules = list(rules)
+        if not rules:
+            return []
+        redis = await get_redis()
+        args = ["" if value is None else repr(float(value))]
+        for _, window, min_change in rules:
+            args.extend([int(window * 1000), min_change])
+        keys = [f"{self.prefix}:{key}" for key, _, _ in rules]
+        results = await redis.eval(_CHECK_AND_SET, len(keys), *keys, *args)
+        return [bool(result) for result in results]
+
+    def clear(self):
+        pass
+
+
+class AlertSuppressor:
+    """Decides whether a signal should notify, globally and per user."""
+
+    def __init__(self, backend=None, window_seconds: float = 300, min_change_percent: float = 20.0):
+        self.backend = backend or MemorySuppressionBackend()
+        self.window_seconds = window_seconds
+        self.min_change_percent = min_change_percent
+
+    async def allow_signal(self, signal_type: str, coin_name: str, value: Optional[float]) -> bool:
+        """Global check, done before loading any users."""
+        if self.window_seconds <= 0:
+            return True
+        rule = (f"{signal_type}:{coin_name}", self.window_seconds, self.min_change_percent)
+        try:
+            return (await self.backend.check_and_set([rule], value))[0]
+        except Exception as e:
+            # Fail open: a suppression outage must not drop alerts
+            print(f"Alert suppression check failed: {e}")
+            return True
+
+    async def allow_users(
+        self,
+        signal_type: str,
+        coin_name: str,
+        value: Optional[float],
+        user_rules: Dict[int, Tuple[float, float]],
+    ) -> set:
+        """User ids whose own window and threshold let this signal through."""
+        rules = [
+            (f"{signal_type}:{coin_name}:{user_id}", window, min_change)
+            for user_id, (window, min_change) in user_rules.items()
+        ]
+        try:
+            results = await self.backend.check_and_set(rules, value)
+        except Exception as e:
+            print(f"Alert suppression check failed: {e}")
+            return set(user_rules)
+        return {user_id for user_id, allow in zip(user_rules, results) if allow}
+
+
+def _create_suppressor() -> AlertSuppressor:
+    backend = RedisSuppressionBackend() if settings.alert_suppression_backend == "redis" else None
+    return AlertSuppressor(
+        backend=backend,
+        window_seconds=settings.alert_suppression_window_seconds,
+        min_change_percent=settings.alert_suppression_min_change_percent,
+    )
+
+
+# Global suppressor instance
+alert_suppressor = _create_suppressor()
@@ -0,0 +1,81 @@
+"""Time series downsampling for signal history charts.
+
+Points are ``(timestamp, value)`` pairs with timestamps in epoch seconds,
+ordered by time. ``TimeBuckets`` averages points into fixed-width time
+buckets as they stream in; ``lttb`` implements Largest-Triangle-Three-Buckets,
+which keeps the visual shape (peaks included) at a fixed point count.
+"""
+from typing import Iterable, List, Sequence, Tuple
+
+Point = Tuple[float, float]
+
+
+class TimeBuckets:
+    """Streaming time-bucket averages over ``[start, end)`` split into ``count`` buckets."""
+
+    def __init__(self, start: float, end: float, count: int):
+        self.start = start
+        self.width = max(end - start, 1e-9) / count
+        self.count = count
+        self._sums: dict = {}
+
+    def add(self, timestamp: float, value: float):
+        index = min(int((timestamp - self.start) / self.width), self.count - 1)
+        if index < 0:
+            return
+        entry = self._sums.get(index)
+        if entry is None:
+            self._sums[index] = [timestamp, value, 1]
+        else:
+            entry[0] += timestamp
+            entry[1] += value
+            entry[2] += 1
+
+    def points(self) -> List[Point]:
+        """Average time and value of each non-empty bucket, in time order."""
+        return [
+            (time_sum / n, value_sum / n)
+            for _, (time_sum, value_sum, n) in sorted(self._sums.items())
+        ]
+
+
+def bucket_average(points: Iterable[Point], start: float, end: float, count: int) -> List[Point]:
+    """Average points into ``count`` equal time buckets."""
+    buckets = TimeBuckets(start, end, count)
+    for timestamp, value in points:
+        buckets.add(timestamp, value)
+    return buckets.points()
+
+
+def lttb(points: Sequence[Point], threshold: int) -> List[Point]:
+    """Downsample to ``threshold`` points with Largest-Triangle-Three-Buckets."""
+    size = len(points)
+    if threshold >= size or threshold < 3:
+        return list(points)
+
+    sampled = [points[0]]
+    # Interior points are split into threshold - 2 buckets; first and last are kept
+    every = (size - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third triangle vertex
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, size)
+        next_points = points[next_start:next_end] or points[-1:]
+        avg_x = sum(p[0] for p in next_points) / len(next_points)
+        avg_y = sum(p[1] for p in next_points) / len(next_points)
+
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        ax, ay = points[a]
+        best_area, best_index = -1.0, start
+        for index in range(start, end):
+            x, y = points[index]
+            area = abs((ax - avg_x) * (y - ay) - (ax - x) * (avg_y - ay))
+            if area > best_area:
+                best_area, best_index = area, index
+        sampled.append(points[best_index])
+        a = best_index
+
+    sampled.append(points[-1])
+    return sampled
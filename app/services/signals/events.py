@@ -0,0 +1,111 @@
+"""Fan-out of persisted signals to the API processes.
+
+The API process keeps the leaderboard, the recent-signals cache and the
+WebSocket connections in memory. When it persists a signal itself they are
+fed directly. A standalone ingestion worker (``python -m
+app.tasks.ingest_worker``) calls ``enable_publishing`` instead, so that each
+signal it persists is published on ``signal_events_channel``; every API
+process runs ``run_signal_event_listener`` while the ingestion stream is
+enabled and applies those events as if the signal had been created locally.
+
+Pub/sub is fire-and-forget: an API process that is down or reconnecting
+misses the events of that window. The leaderboard and recent signals are
+warmed from the database at startup, the WebSocket replay log is not.
+"""
+import asyncio
+import json
+from typing import Any, Dict, Optional
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.core.redis_client import get_redis
+from app.core.tracing import SignalTrace
+from app.services.signals.leaderboard import leaderboard
+from app.services.signals.recent import recent_signals
+from app.services.websocket.router import broadcast_new_signal
+
+logger = get_logger(__name__)
+
+_publishing = False
+
+
+def enable_publishing():
+    """Publish persisted signals instead of applying them in this process."""
+    global _publishing
+    _publishing = True
+
+
+async def apply_signal(
+    signal_type: str,
+    payload: Dict[str, Any],
+    signal_data: Dict[str, Any],
+    trace: Optional[SignalTrace] = None,
+):
+    """Feed a persisted signal to the in-memory caches and WebSocket clients."""
+    leaderboard.add(signal_type, payload)
+    recent_signals.add(signal_type, payload)
+    await broadcast_new_signal(signal_type, signal_data, trace=trace)
+
+
+async def fan_out_signal(
+    signal_type: str,
+    payload: Dict[str, Any],
+    signal_data: Dict[str, Any],
+    trace: SignalTrace,
+):
+    """Apply a persisted signal locally, or publish it from a standalone worker."""
+    if not _publishing:
+        await apply_signal(signal_type, payload, signal_data, trace)
+        return
+
+    event = {
+        "signal_type": signal_type,
+        "payload": payload,
+        "data": signal_data,
+        "trace_id": trace.trace_id,
+        "source_ts": trace.source_ts,
+    }
+    try:
+        redis = await get_redis()
+        await redis.publish(settings.signal_events_channel, json.dumps(event))
+    except Exception as e:
+        # The signal is committed; only live delivery is lost
+        logger.error("Error publishing signal event", trace_id=trace.trace_id, error=str(e))
+
+
+async def handle_signal_event(raw: str):
+    """Apply a signal event received from the channel."""
+    event = json.loads(raw)
+    trace = SignalTrace(
+        event["signal_type"],
+        source_ts=event.get("source_ts"),
+        trace_id=event.get("trace_id"),
+    )
+    await apply_signal(event["signal_type"], event["payload"], event["data"], trace)
+
+
+async def run_signal_event_listener():
+    """Consume signal events published by standalone ingestion workers."""
+    while True:
+        pubsub = None
+        try:
+            redis = await get_redis()
+            pubsub = redis.pubsub(ignore_subscribe_messages=True)
+            await pubsub.subscribe(settings.signal_events_channel)
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                try:
+                    await handle_signal_event(message["data"])
+                except Exception as e:
+                    logger.error("Error applying signal event", error=str(e))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Signal event subscription lost, reconnecting", error=str(e))
+            await asyncio.sleep(1)
+        finally:
+            if pubsub is not None:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
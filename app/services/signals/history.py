@@ -0,0 +1,123 @@
+"""Downsampled per-coin signal history for charts.
+
+Reads ``(created_at, metric)`` pairs for one coin through the
+``(coin_name, created_at)`` index as a stream and reduces them to at most the
+requested number of points, so a chart over weeks stays a few hundred points.
+
+Bucket averages are computed as rows stream in. LTTB needs the whole series,
+so it holds at most ``history_lttb_max_raw_points`` raw rows; past that it
+runs over the per-minute (or, beyond their retention, per-hour) averages of
+the stats rollups instead.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.signal import SignalStatsHour, SignalStatsMinute
+from app.services.signals.downsample import TimeBuckets, lttb
+from app.services.signals.latest import SIGNAL_SCHEMAS
+from app.services.signals.leaderboard import SCORE_FIELDS
+from app.services.signals.rollups import hour_bucket, minute_bucket
+
+DOWNSAMPLE_METHODS = ("average", "lttb")
+
+
+def _epoch(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+async def _rollup_series(
+    db: AsyncSession,
+    signal_type: str,
+    coin_name: str,
+    since: datetime,
+    until: datetime,
+) -> Tuple[List[tuple], int, str]:
+    """Per-bucket metric averages from the stats rollups.
+
+    Returns the series, the number of signals it covers and its source.
+    """
+    minute_floor = datetime.now(timezone.utc) - timedelta(hours=settings.stats_minute_retention_hours)
+    if since >= minute_floor:
+        model, start, source = SignalStatsMinute, minute_bucket(since), "minute_rollups"
+    else:
+        model, start, source = SignalStatsHour, hour_bucket(since), "hour_rollups"
+    result = await db.execute(
+        select(model.bucket_start, model.value_sum, model.value_count)
+        .where(
+            model.signal_type == signal_type,
+            model.coin_name == coin_name,
+            model.bucket_start >= start,
+            model.bucket_start <= until,
+            model.value_count > 0,
+        )
+        .order_by(model.bucket_start)
+    )
+    series, covered = [], 0
+    for bucket_start, value_sum, value_count in result:
+        covered += value_count
+        series.append((_epoch(bucket_start), float(value_sum) / value_count))
+    return series, covered, source
+
+
+async def fetch_signal_history(
+    db: AsyncSession,
+    signal_type: str,
+    coin_name: str,
+    since: datetime,
+    until: datetime,
+    points: int,
+    method: str = "average",
+) -> Dict[str, Any]:
+    """Time series of the signal type's metric for a coin, downsampled to ``points``."""
+    model, _ = SIGNAL_SCHEMAS[signal_type]
+    metric = getattr(model, SCORE_FIELDS[signal_type])
+    query = (
+        select(model.created_at, metric)
+        .where(
+            model.coin_name == coin_name,
+            model.created_at >= since,
+            model.created_at <= until,
+            metric.is_not(None),
+        )
+        .order_by(model.created_at)
+    )
+
+    raw_points = 0
+    source = "raw"
+    buckets = TimeBuckets(_epoch(since), _epoch(until), points)
+    series: List[tuple] = []
+    result = await db.stream(query)
+    async for created_at, value in result:
+        raw_points += 1
+        point = (_epoch(created_at), float(value))
+        if method == "average":
+            buckets.add(*point)
+        elif raw_points > settings.history_lttb_max_raw_points:
+            source = "rollups"
+            break
+        else:
+            series.append(point)
+    await result.close()
+
+    if method == "average":
+        series = buckets.points()
+    else:
+        if source == "rollups":
+            series, raw_points, source = await _rollup_series(db, signal_type, coin_name, since, until)
+        series = lttb(series, points)
+
+    return {
+        "signal_type": signal_type,
+        "coin_name": coin_name,
+        "metric": SCORE_FIELDS[signal_type],
+        "method": method,
+        # 'raw', or 'minute_rollups' / 'hour_rollups' for LTTB over long ranges
+        "source": source,
+        "raw_points": raw_points,
+        # [epoch milliseconds, value] pairs, oldest first
+        "data": [[round(timestamp * 1000), round(value, 8)] for timestamp, value in series],
+    }
@@ -0,0 +1,110 @@
+"""Latest signal per coin, maintained on insert.
+
+``latest_signals`` keeps one row per ``(signal_type, coin_name)`` holding the
+newest signal as response JSON. It is upserted in the same transaction as the
+signal itself, so "current opportunities" is an index lookup instead of a
+scan over signal history.
+"""
+from typing import Any, Dict, List, Optional
+from sqlalchemy import select, delete, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import upsert_insert
+from app.models.signal import (
+    SignalMEXCSpotFutures,
+    SignalFundingRate,
+    SignalMEXCDEX,
+    LatestSignal,
+)
+from app.schemas.signal import (
+    MEXCSpotFuturesSignalResponse,
+    FundingRateSignalResponse,
+    MEXCDEXSignalResponse,
+)
+
+SIGNAL_SCHEMAS = {
+    "mexc_spot_futures": (SignalMEXCSpotFutures, MEXCSpotFuturesSignalResponse),
+    "funding_rate": (SignalFundingRate, FundingRateSignalResponse),
+    "mexc_dex": (SignalMEXCDEX, MEXCDEXSignalResponse),
+}
+
+
+def signal_payload(signal_type: str, signal) -> Dict[str, Any]:
+    """Serialize a persisted signal the way the list endpoints return it."""
+    _, schema = SIGNAL_SCHEMAS[signal_type]
+    return schema.model_validate(signal).model_dump(mode="json")
+
+
+async def upsert_latest_signal(db: AsyncSession, signal_type: str, signal) -> Dict[str, Any]:
+    """Record a flushed signal as the newest for its coin, without committing.
+
+    Returns the stored payload.
+    """
+    payload = signal_payload(signal_type, signal)
+    values = {
+        "signal_type": signal_type,
+        "coin_name": signal.coin_name,
+        "signal_id": signal.id,
+        "payload": payload,
+        "created_at": signal.created_at,
+    }
+    statement = upsert_insert(db, LatestSignal).values(**values)
+    statement = statement.on_conflict_do_update(
+        index_elements=[LatestSignal.signal_type, LatestSignal.coin_name],
+        set_={
+            "signal_id": statement.excluded.signal_id,
+            "payload": statement.excluded.payload,
+            "created_at": statement.excluded.created_at,
+            "updated_at": statement.excluded.created_at,
+        },
+        # Never let a late, older signal replace a newer one
+        where=LatestSignal.created_at <= statement.excluded.created_at,
+    )
+    await db.execute(statement)
+    return payload
+
+
+async def rebuild_latest_signal(db: AsyncSession, signal_type: str, coin_name: str) -> Optional[Dict[str, Any]]:
+    """Recompute a coin's latest row from history, e.g. after a delete, without committing.
+
+    Returns the new latest payload, or None if the coin has no signals left.
+    """
+    model, _ = SIGNAL_SCHEMAS[signal_type]
+    await db.execute(
+        delete(LatestSignal).where(
+            LatestSignal.signal_type == signal_type,
+            LatestSignal.coin_name == coin_name,
+        )
+    )
+    result = await db.execute(
+        select(model)
+        .where(model.coin_name == coin_name)
+        .order_by(desc(model.created_at), desc(model.id))
+        .limit(1)
+    )
+    signal = result.scalar_one_or_none()
+    if signal is None:
+        return None
+    return await upsert_latest_signal(db, signal_type, signal)
+
+
+async def fetch_latest_signals(
+    db: AsyncSession,
+    signal_type: Optional[str] = None,
+    coin_name: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Latest signal per coin, newest first."""
+    query = select(
+        LatestSignal.signal_type,
+        LatestSignal.coin_name,
+        LatestSignal.signal_id,
+        LatestSignal.created_at,
+        LatestSignal.payload.label("signal"),
+    )
+    if signal_type:
+        query = query.where(LatestSignal.signal_type == signal_type)
+    if coin_name:
+        query = query.where(LatestSignal.coin_name == coin_name)
+    query = query.order_by(desc(LatestSignal.created_at))
+
+    result = await db.execute(query)
+    return [dict(row) for row in result.mappings()]
@@ -0,0 +1,136 @@
+"""In-memory top-N opportunity leaderboard.
+
+Keeps the newest signal per coin for each signal type, ranked by the type's
+score field, and expires entries older than a time window. It is fed from the
+signal creation path and read by the leaderboard endpoint and WebSocket
+snapshots without touching the database.
+"""
+import heapq
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.signal import LatestSignal
+
+# Field each signal type is ranked by
+SCORE_FIELDS = {
+    "mexc_spot_futures": "spread",
+    "funding_rate": "hourly_profit",
+    "mexc_dex": "spread_percent",
+}
+
+
+class Leaderboard:
+    """Newest signal per coin, ranked by score, with time-based eviction."""
+
+    def __init__(self, window_seconds: int, size: int):
+        self.window_seconds = window_seconds
+        self.size = size
+        # signal_type -> coin_name -> entry
+        self._entries: Dict[str, Dict[str, dict]] = {signal_type: {} for signal_type in SCORE_FIELDS}
+        # Min-heap of (added_at, signal_type, coin_name, signal_id); stale items are skipped on pop
+        self._expiry: List[Tuple[float, str, str, int]] = []
+
+    def add(self, signal_type: str, signal: Dict[str, Any], added_at: Optional[float] = None) -> bool:
+        """Record a signal as the current one for its coin. Returns False if it has no score.
+
+        A signal without a score still replaces the coin's entry: the coin is
+        dropped rather than ranked by an older signal.
+        """
+        value = signal.get(SCORE_FIELDS[signal_type])
+        if value is None:
+            self._entries[signal_type].pop(signal["coin_name"], None)
+            return False
+
+        added_at = time.time() if added_at is None else added_at
+        coin_name = signal["coin_name"]
+        self._entries[signal_type][coin_name] = {
+            "coin_name": coin_name,
+            "score": float(value),
+            "signal_id": signal["id"],
+            "added_at": added_at,
+            "signal": signal,
+        }
+        heapq.heappush(self._expiry, (added_at, signal_type, coin_name, signal["id"]))
+        return True
+
+    def discard(self, signal_type: str, signal_id: int, replacement: Optional[Dict[str, Any]] = None) -> bool:
+        """Drop a deleted signal. Returns False if it was not on the leaderboard.
+
+        ``replacement`` is the coin's newest remaining signal; it is ranked
+        from its own creation time, so it only stays if inside the window.
+        """
+        entries = self._entries[signal_type]
+        coin_name = next((coin for coin, entry in entries.items() if entry["signal_id"] == signal_id), None)
+        if coin_name is None:
+            return False
+        del entries[coin_name]
+        if replacement is not None:
+            created_at = datetime.fromisoformat(replacement["created_at"])
+            if created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            self.add(signal_type, replacement, added_at=created_at.timestamp())
+        return True
+
+    def evict(self, now: Optional[float] = None) -> int:
+        """Drop entries older than the window. Returns how many were removed."""
+        cutoff = (time.time() if now is None else now) - self.window_seconds
+        removed = 0
+        while self._expiry and self._expiry[0][0] < cutoff:
+            _, signal_type, coin_name, signal_id = heapq.heappop(self._expiry)
+            entry = self._entries[signal_type].get(coin_name)
+            # A newer signal for the coin has its own heap item
+            if entry and entry["signal_id"] == signal_id:
+                del self._entries[signal_type][coin_name]
+                removed += 1
+        return removed
+
+    def top(self, signal_type: str, limit: Optional[int] = None, now: Optional[float] = None) -> List[dict]:
+        """Best entries of a signal type, highest score first."""
+        self.evict(now)
+        entries = heapq.nlargest(
+            limit or self.size,
+            self._entries[signal_type].values(),
+            key=lambda entry: entry["score"],
+        )
+        return [
+            {key: value for key, value in entry.items() if key != "added_at"}
+            for entry in entries
+        ]
+
+    def snapshot(self, signal_type: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, List[dict]]:
+        """Top entries per signal type, or for one type only."""
+        signal_types = [signal_type] if signal_type else list(SCORE_FIELDS)
+        return {name: self.top(name, limit) for name in signal_types}
+
+    def clear(self):
+        """Remove all entries."""
+        for entries in self._entries.values():
+            entries.clear()
+        self._expiry.clear()
+
+    async def warm(self, db: AsyncSession) -> int:
+        """Load signals still inside the window from latest_signals, e.g. after a restart."""
+        since = datetime.now(timezone.utc) - timedelta(seconds=self.window_seconds)
+        result = await db.execute(
+            select(LatestSignal.signal_type, LatestSignal.payload, LatestSignal.created_at)
+            .where(LatestSignal.created_at >= since)
+            .order_by(LatestSignal.created_at)
+        )
+        loaded = 0
+        for signal_type, payload, created_at in result:
+            if signal_type not in SCORE_FIELDS:
+                continue
+            if created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            loaded += self.add(signal_type, payload, added_at=created_at.timestamp())
+        return loaded
+
+
+# Global leaderboard instance
+leaderboard = Leaderboard(
+    window_seconds=settings.leaderboard_window_seconds,
+    size=settings.leaderboard_size,
+)
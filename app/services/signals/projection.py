@@ -0,0 +1,75 @@
+"""Column projection fast path for signal list queries.
+
+List endpoints select only the columns of the response schema and serialize
+the row mappings straight to JSON, skipping ORM identity-map hydration and
+per-field Pydantic validation. ``FastJSONResponse`` encodes ``Decimal`` and
+``datetime`` the way the Pydantic response models do, so the output is
+byte-compatible with them.
+"""
+from typing import Any, Dict, List, Sequence, Type
+from pydantic import BaseModel
+from sqlalchemy import select, func, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.responses import FastJSONResponse
+from app.models.signal import (
+    SignalMEXCSpotFutures,
+    SignalFundingRate,
+    SignalMEXCDEX,
+)
+from app.schemas.signal import (
+    MEXCSpotFuturesSignalResponse,
+    FundingRateSignalResponse,
+    MEXCDEXSignalResponse,
+)
+
+
+def columns_for(model, schema: Type[BaseModel]) -> list:
+    """Model columns matching the fields of a response schema, in schema order."""
+    return [getattr(model, name) for name in schema.model_fields]
+
+
+SIGNAL_LIST_COLUMNS = {
+    SignalMEXCSpotFutures: columns_for(SignalMEXCSpotFutures, MEXCSpotFuturesSignalResponse),
+    SignalFundingRate: columns_for(SignalFundingRate, FundingRateSignalResponse),
+    SignalMEXCDEX: columns_for(SignalMEXCDEX, MEXCDEXSignalResponse),
+}
+
+
+async def fetch_signal_rows(
+    db: AsyncSession,
+    model,
+    conditions: Sequence,
+    limit: int,
+    offset: int,
+) -> tuple[List[Dict[str, Any]], int]:
+    """Fetch a page of signals as plain dicts, newest first, plus the total count."""
+    count_query = select(func.count()).select_from(model).where(*conditions)
+    total = (await db.execute(count_query)).scalar() or 0
+
+    query = (
+        select(*SIGNAL_LIST_COLUMNS[model])
+        .where(*conditions)
+        .order_by(desc(model.created_at))
+        .offset(offset)
+        .limit(limit)
+    )
+    result = await db.execute(query)
+    keys = list(result.keys())
+    rows = [dict(zip(keys, row)) for row in result]
+    return rows, total
+
+
+async def signal_list_response(
+    db: AsyncSession,
+    model,
+    conditions: Sequence,
+    limit: int,
+    offset: int,
+) -> FastJSONResponse:
+    """Build the JSON response of a signal list endpoint."""
+    rows, total = await fetch_signal_rows(db, model, conditions, limit, offset)
+    content = {
+        "data": rows,
+        "pagination": {"total": total, "limit": limit, "offset": offset},
+    }
+    return FastJSONResponse(content)
@@ -0,0 +1,57 @@
+"""In-memory cache of the newest signals per type.
+
+Fed from the signal creation path and warmed from the database at startup,
+so WebSocket snapshots on connect are served without any SQL.
+"""
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.services.signals.latest import SIGNAL_SCHEMAS, signal_payload
+
+
+class RecentSignals:
+    """The last ``size`` signal payloads of each type, newest first."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._signals: Dict[str, Deque[Dict[str, Any]]] = {
+            signal_type: deque(maxlen=size) for signal_type in SIGNAL_SCHEMAS
+        }
+
+    def add(self, signal_type: str, payload: Dict[str, Any]):
+        self._signals[signal_type].appendleft(payload)
+
+    def discard(self, signal_type: str, signal_id: int):
+        """Drop a deleted signal."""
+        signals = self._signals[signal_type]
+        for payload in signals:
+            if payload["id"] == signal_id:
+                signals.remove(payload)
+                return
+
+    def latest(self, signal_type: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        signals = self._signals[signal_type]
+        return list(signals)[:limit] if limit else list(signals)
+
+    def clear(self):
+        for signals in self._signals.values():
+            signals.clear()
+
+    async def warm(self, db: AsyncSession) -> int:
+        """Load the newest signals of every type, e.g. after a restart."""
+        loaded = 0
+        for signal_type, (model, _) in SIGNAL_SCHEMAS.items():
+            result = await db.execute(
+                select(model).order_by(desc(model.created_at), desc(model.id)).limit(self.size)
+            )
+            signals = self._signals[signal_type]
+            signals.clear()
+            signals.extend(signal_payload(signal_type, signal) for signal in result.scalars())
+            loaded += len(signals)
+        return loaded
+
+
+# Global recent signals cache
+recent_signals = RecentSignals(size=settings.recent_signals_size)
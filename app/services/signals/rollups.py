@@ -0,0 +1,184 @@
+"""Per-coin signal statistics from incrementally maintained rollups.
+
+Every inserted signal is added to a per-minute and a per-hour bucket for its
+coin (count, sum, max and last of the type's metric, first and last seen).
+Window queries sum whole hours from the hour table and the partial leading
+hour from the minute table, so they read at most a few hundred small rows
+instead of grouping raw signal history.
+"""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+from sqlalchemy import select, delete, case
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.database import upsert_insert
+from app.models.signal import SignalStatsMinute, SignalStatsHour
+from app.services.signals.leaderboard import SCORE_FIELDS
+
+STATS_WINDOWS = {
+    "1h": timedelta(hours=1),
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+}
+
+AVG_QUANTUM = Decimal("0.00000001")
+
+
+def _utc(value: datetime) -> datetime:
+    """Normalize a timestamp to aware UTC (SQLite returns naive UTC)."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def minute_bucket(value: datetime) -> datetime:
+    return _utc(value).replace(second=0, microsecond=0)
+
+
+def hour_bucket(value: datetime) -> datetime:
+    return _utc(value).replace(minute=0, second=0, microsecond=0)
+
+
+async def _upsert_bucket(db: AsyncSession, model, bucket_start: datetime, values: Dict[str, Any]):
+    table = model.__table__
+    statement = upsert_insert(db, model).values(bucket_start=bucket_start, **values)
+    excluded = statement.excluded
+    newer = excluded.last_seen >= table.c.last_seen
+    statement = statement.on_conflict_do_update(
+        index_elements=[model.signal_type, model.coin_name, model.bucket_start],
+        set_={
+            "signal_count": table.c.signal_count + 1,
+            "value_count": table.c.value_count + excluded.value_count,
+            "value_sum": case(
+                (table.c.value_sum.is_(None), excluded.value_sum),
+                (excluded.value_sum.is_(None), table.c.value_sum),
+                else_=table.c.value_sum + excluded.value_sum,
+            ),
+            # Portable GREATEST/LEAST: NULL comparisons fall through to else_
+            "value_max": case(
+                (table.c.value_max.is_(None), excluded.value_max),
+                (excluded.value_max > table.c.value_max, excluded.value_max),
+                else_=table.c.value_max,
+            ),
+            "last_value": case((newer, excluded.last_value), else_=table.c.last_value),
+            "first_seen": case(
+                (excluded.first_seen < table.c.first_seen, excluded.first_seen),
+                else_=table.c.first_seen,
+            ),
+            "last_seen": case((newer, excluded.last_seen), else_=table.c.last_seen),
+        },
+    )
+    await db.execute(statement)
+
+
+async def record_signal_stats(db: AsyncSession, signal_type: str, signal) -> None:
+    """Add a flushed signal to its minute and hour buckets, without committing."""
+    value = getattr(signal, SCORE_FIELDS[signal_type])
+    seen = _utc(signal.created_at)
+    values = {
+        "signal_type": signal_type,
+        "coin_name": signal.coin_name,
+        "signal_count": 1,
+        "value_count": 0 if value is None else 1,
+        "value_sum": value,
+        "value_max": value,
+        "last_value": value,
+        "first_seen": seen,
+        "last_seen": seen,
+    }
+    await _upsert_bucket(db, SignalStatsMinute, minute_bucket(seen), values)
+    await _upsert_bucket(db, SignalStatsHour, hour_bucket(seen), values)
+
+
+def _merge(stats: Dict[str, dict], bucket) -> None:
+    """Fold one bucket row into the running per-coin stats."""
+    first_seen, last_seen = _utc(bucket.first_seen), _utc(bucket.last_seen)
+    entry = stats.get(bucket.coin_name)
+    if entry is None:
+        stats[bucket.coin_name] = {
+            "coin_name": bucket.coin_name,
+            "count": bucket.signal_count,
+            "value_count": bucket.value_count,
+            "value_sum": bucket.value_sum,
+            "max": bucket.value_max,
+            "last": bucket.last_value,
+            "first_seen": first_seen,
+            "last_seen": last_seen,
+        }
+        return
+
+    entry["count"] += bucket.signal_count
+    entry["value_count"] += bucket.value_count
+    if bucket.value_sum is not None:
+        entry["value_sum"] = bucket.value_sum + (entry["value_sum"] or 0)
+    if bucket.value_max is not None and (entry["max"] is None or bucket.value_max > entry["max"]):
+        entry["max"] = bucket.value_max
+    if first_seen < entry["first_seen"]:
+        entry["first_seen"] = first_seen
+    if last_seen >= entry["last_seen"]:
+        entry["last_seen"] = last_seen
+        entry["last"] = bucket.last_value
+
+
+async def fetch_signal_stats(
+    db: AsyncSession,
+    signal_type: str,
+    window: str,
+    coin_name: Optional[str] = None,
+    now: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """Per-coin stats over a window, most active coins first."""
+    now = _utc(now or datetime.now(timezone.utc))
+    since = minute_bucket(now - STATS_WINDOWS[window])
+    # Whole hours come from the hour table, the partial leading hour from minutes
+    hours_from = hour_bucket(since)
+    if hours_from < since:
+        hours_from += timedelta(hours=1)
+
+    ranges = [
+        (SignalStatsMinute, since, hours_from),
+        (SignalStatsHour, hours_from, None),
+    ]
+    stats: Dict[str, dict] = {}
+    for model, start, end in ranges:
+        query = select(model).where(
+            model.signal_type == signal_type,
+            model.bucket_start >= start,
+        )
+        if end is not None:
+            if end <= start:
+                continue
+            query = query.where(model.bucket_start < end)
+        if coin_name:
+            query = query.where(model.coin_name == coin_name)
+        for bucket in (await db.execute(query)).scalars():
+            _merge(stats, bucket)
+
+    results = []
+    for entry in stats.values():
+        value_count, value_sum = entry.pop("value_count"), entry.pop("value_sum")
+        entry["avg"] = (
+            (Decimal(value_sum) / value_count).quantize(AVG_QUANTUM)
+            if value_count and value_sum is not None
+            else None
+        )
+        results.append(entry)
+    results.sort(key=lambda entry: (entry["count"], entry["last_seen"]), reverse=True)
+    return results
+
+
+async def prune_signal_stats(db: AsyncSession, now: Optional[datetime] = None) -> None:
+    """Delete buckets older than their retention and commit."""
+    now = _utc(now or datetime.now(timezone.utc))
+    await db.execute(
+        delete(SignalStatsMinute).where(
+            SignalStatsMinute.bucket_start < now - timedelta(hours=settings.stats_minute_retention_hours)
+        )
+    )
+    await db.execute(
+        delete(SignalStatsHour).where(
+            SignalStatsHour.bucket_start < now - timedelta(days=settings.stats_hour_retention_days)
+        )
+    )
+    await db.commit()
@@ -1,10 +1,10 @@
 """Signals Service API routes."""
 from typing import Optional
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc, delete
-from datetime import datetime
+from sqlalchemy import select, delete
 from app.core.database import get_db
 from app.core.dependencies import require_vip
 from app.models.user import User
@@ -13,15 +13,25 @@ from app.models.signal import (
     SignalFundingRate,
     SignalMEXCDEX,
 )
-from app.schemas.signal import (
-    MEXCSpotFuturesSignalResponse,
-    FundingRateSignalResponse,
-    MEXCDEXSignalResponse,
-    SignalListResponse,
-)
+from app.core.responses import FastJSONResponse
+from app.schemas.signal import SignalListResponse, LatestSignalListResponse
+from app.services.signals.latest import fetch_latest_signals, rebuild_latest_signal
+from app.services.signals.recent import recent_signals
+from app.services.signals.leaderboard import leaderboard, SCORE_FIELDS
+from app.services.signals.rollups import fetch_signal_stats
+from app.services.signals.history import fetch_signal_history
+from app.services.signals.projection import signal_list_response
 
 router = APIRouter(prefix="/api/v1/signals", tags=["signals"])
 
+# URL slugs of the signal types
+SIGNAL_TYPE_SLUGS = {
+    "mexc-spot-futures": "mexc_spot_futures",
+    "funding-rate": "funding_rate",
+    "mexc-dex": "mexc_dex",
+}
+SIGNAL_TYPE_SLUG_PATTERN = "^(mexc-spot-futures|funding-rate|mexc-dex)$"
+
 
 @router.get("/mexc-spot-futures", response_model=SignalListResponse)
 async def get_mexc_spot_futures_signals(
@@ -34,52 +44,20 @@ async def get_mexc_spot_futures_signals(
     user: User = Depends(require_vip),
 ):
     """Get MEXC Spot & Futures signals (VIP only)."""
-    query = select(SignalMEXCSpotFutures)
+    conditions = []
 
     if min_spread is not None:
-        query = query.where(SignalMEXCSpotFutures.spread >= Decimal(str(min_spread)))
+        conditions.append(SignalMEXCSpotFutures.spread >= Decimal(str(min_spread)))
 
     if position and position != "ALL":
-        query = query.where(SignalMEXCSpotFutures.position == position)
+        conditions.append(SignalMEXCSpotFutures.position == position)
 
     if search:
         search_lower = search.lower()
-        query = query.where(SignalMEXCSpotFutures.coin_name.ilike(f"%{search_lower}%"))
-
-    # Sort by created_at DESC (newest first)
-    query = query.order_by(desc(SignalMEXCSpotFutures.created_at))
-
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Pagination
-    query = query.offset(offset).limit(limit)
-
-    result = await db.execute(query)
-    items = result.scalars().all()
-
-    return SignalListResponse(
-        data=[
-            MEXCSpotFuturesSignalResponse(
-                id=item.id,
-                coin_name=item.coin_name,
-                position=item.position,
-                spread=item.spread,
-                mexc_spot_price=item.mexc_spot_price,
-                mexc_futures_price=item.mexc_futures_price,
-                spot_url=item.spot_url,
-                futures_url=item.futures_url,
-                deposit_enabled=item.deposit_enabled,
-                withdrawal_enabled=item.withdrawal_enabled,
-                dex_url=item.dex_url,
-                created_at=item.created_at,
-            )
-            for item in items
-        ],
-        pagination={"total": total, "limit": limit, "offset": offset},
-    )
+        conditions.append(SignalMEXCSpotFutures.coin_name.ilike(f"%{search_lower}%"))
+
+    # Newest first, selected as plain columns and rendered straight to JSON
+    return await signal_list_response(db, SignalMEXCSpotFutures, conditions, limit, offset)
 
 
 @router.get("/funding-rate", response_model=SignalListResponse)
@@ -92,67 +70,17 @@ async def get_funding_rate_signals(
     user: User = Depends(require_vip),
 ):
     """Get Funding Rate Spread signals (VIP only)."""
-    query = select(SignalFundingRate)
+    conditions = []
 
     if min_profit is not None:
-        query = query.where(
-            SignalFundingRate.hourly_profit >= Decimal(str(min_profit))
-        )
+        conditions.append(SignalFundingRate.hourly_profit >= Decimal(str(min_profit)))
 
     if search:
         search_lower = search.lower()
-        query = query.where(SignalFundingRate.coin_name.ilike(f"%{search_lower}%"))
-
-    # Sort by created_at DESC (newest first)
-    query = query.order_by(desc(SignalFundingRate.created_at))
-
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Pagination
-    query = query.offset(offset).limit(limit)
-
-    result = await db.execute(query)
-    items = result.scalars().all()
-
-    return SignalListResponse(
-        data=[
-            FundingRateSignalResponse(
-                id=item.id,
-                coin_name=item.coin_name,
-                hourly_profit=item.hourly_profit,
-                gate_rate=item.gate_rate,
-                gate_url=item.gate_url,
-                gate_interval=item.gate_interval,
-                gate_position=item.gate_position,
-                binance_rate=item.binance_rate,
-                binance_url=item.binance_url,
-                binance_interval=item.binance_interval,
-                binance_position=item.binance_position,
-                mexc_rate=item.mexc_rate,
-                mexc_url=item.mexc_url,
-                mexc_interval=item.mexc_interval,
-                mexc_position=item.mexc_position,
-                ourbit_rate=item.ourbit_rate,
-                ourbit_url=item.ourbit_url,
-                ourbit_interval=item.ourbit_interval,
-                ourbit_position=item.ourbit_position,
-                bitget_rate=item.bitget_rate,
-                bitget_url=item.bitget_url,
-                bitget_interval=item.bitget_interval,
-                bitget_position=item.bitget_position,
-                bybit_rate=item.bybit_rate,
-                bybit_url=item.bybit_url,
-                bybit_interval=item.bybit_interval,
-                bybit_position=item.bybit_position,
-                created_at=item.created_at,
-            )
-            for item in items
-        ],
-        pagination={"total": total, "limit": limit, "offset": offset},
-    )
+        conditions.append(SignalFundingRate.coin_name.ilike(f"%{search_lower}%"))
+
+    # Newest first, selected as plain columns and rendered straight to JSON
+    return await signal_list_response(db, SignalFundingRate, conditions, limit, offset)
 
 
 @router.get("/mexc-dex", response_model=SignalListResponse)
@@ -165,54 +93,95 @@ async def get_mexc_dex_signals(
     user: User = Depends(require_vip),
 ):
     """Get MEXC & DEX Price Spread signals (VIP only)."""
-    query = select(SignalMEXCDEX)
+    conditions = []
 
     if min_spread is not None:
-        query = query.where(
-            SignalMEXCDEX.spread_percent >= Decimal(str(min_spread))
-        )
+        conditions.append(SignalMEXCDEX.spread_percent >= Decimal(str(min_spread)))
 
     if search:
         search_lower = search.lower()
-        query = query.where(SignalMEXCDEX.coin_name.ilike(f"%{search_lower}%"))
-
-    # Sort by created_at DESC (newest first)
-    query = query.order_by(desc(SignalMEXCDEX.created_at))
-
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Pagination
-    query = query.offset(offset).limit(limit)
-
-    result = await db.execute(query)
-    items = result.scalars().all()
-
-    return SignalListResponse(
-        data=[
-            MEXCDEXSignalResponse(
-                id=item.id,
-                coin_name=item.coin_name,
-                spread_percent=item.spread_percent,
-                mexc_price=item.mexc_price,
-                mexc_url=item.mexc_url,
-                dex_price=item.dex_price,
-                dexscreener_url=item.dexscreener_url,
-                max_size_usd=item.max_size_usd,
-                deposit_enabled=item.deposit_enabled,
-                withdrawal_enabled=item.withdrawal_enabled,
-                deposit_url=item.deposit_url,
-                withdrawal_url=item.withdrawal_url,
-                token_contract=item.token_contract,
-                token_chain=item.token_chain,
-                created_at=item.created_at,
-            )
-            for item in items
-        ],
-        pagination={"total": total, "limit": limit, "offset": offset},
+        conditions.append(SignalMEXCDEX.coin_name.ilike(f"%{search_lower}%"))
+
+    # Newest first, selected as plain columns and rendered straight to JSON
+    return await signal_list_response(db, SignalMEXCDEX, conditions, limit, offset)
+
+
+@router.get("/latest", response_model=LatestSignalListResponse)
+async def get_latest_signals(
+    signal_type: Optional[str] = Query(None, regex="^(mexc_spot_futures|funding_rate|mexc_dex)$"),
+    coin: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(require_vip),
+):
+    """Get the newest signal per coin for each signal type (VIP only)."""
+    rows = await fetch_latest_signals(db, signal_type=signal_type, coin_name=coin)
+    return FastJSONResponse({"data": rows})
+
+
+@router.get("/leaderboard")
+async def get_leaderboard(
+    signal_type: Optional[str] = Query(None, regex="^(mexc_spot_futures|funding_rate|mexc_dex)$"),
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    user: User = Depends(require_vip),
+):
+    """Get the best current opportunities per signal type from memory (VIP only)."""
+    return FastJSONResponse({
+        "window_seconds": leaderboard.window_seconds,
+        "data": leaderboard.snapshot(signal_type, limit),
+    })
+
+
+@router.get("/{signal_type_slug}/stats")
+async def get_signal_stats(
+    signal_type_slug: str = Path(..., regex=SIGNAL_TYPE_SLUG_PATTERN),
+    window: str = Query("24h", regex="^(1h|24h|7d)$"),
+    coin: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(require_vip),
+):
+    """Get per-coin signal statistics over a time window (VIP only)."""
+    signal_type = SIGNAL_TYPE_SLUGS[signal_type_slug]
+    rows = await fetch_signal_stats(db, signal_type, window, coin_name=coin)
+    return FastJSONResponse({
+        "signal_type": signal_type,
+        "window": window,
+        "metric": SCORE_FIELDS[signal_type],
+        "data": rows,
+    })
+
+
+@router.get("/{signal_type_slug}/history")
+async def get_signal_history(
+    signal_type_slug: str = Path(..., regex=SIGNAL_TYPE_SLUG_PATTERN),
+    coin: str = Query(..., min_length=1),
+    since: Optional[datetime] = Query(None),
+    until: Optional[datetime] = Query(None),
+    points: int = Query(300, ge=10, le=1000),
+    method: str = Query("average", regex="^(average|lttb)$"),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(require_vip),
+):
+    """Get a coin's downsampled metric history for charting (VIP only).
+
+    ``lttb`` over more raw signals than the server holds in memory runs on
+    the per-minute or per-hour rollups instead; ``source`` tells which.
+    """
+    until = until or datetime.now(timezone.utc)
+    since = since or until - timedelta(days=7)
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if until.tzinfo is None:
+        until = until.replace(tzinfo=timezone.utc)
+    if since >= until:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="since must be earlier than until",
+        )
+
+    history = await fetch_signal_history(
+        db, SIGNAL_TYPE_SLUGS[signal_type_slug], coin, since, until, points, method
     )
+    return FastJSONResponse(history)
 
 
 @router.delete("/{signal_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -248,5 +217,8 @@ async def delete_signal(
 
     # Delete the signal (SQLAlchemy 2.0 async)
     await db.execute(delete(model).where(model.id == signal_id))
+    latest = await rebuild_latest_signal(db, signal_type, signal.coin_name)
     await db.commit()
+    recent_signals.discard(signal_type, signal_id)
+    leaderboard.discard(signal_type, signal_id, replacement=latest)
 
@@ -1,17 +1,100 @@
 """Signals Service business logic."""
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import inspect, select
+from app.core.database import upsert_insert
 from app.models.signal import (
     SignalMEXCSpotFutures,
     SignalFundingRate,
     SignalMEXCDEX,
 )
-from app.services.websocket.router import broadcast_new_signal, broadcast_signal_update
+from app.core.tracing import SignalTrace
+from app.services.signals.events import fan_out_signal
+from app.services.signals.latest import upsert_latest_signal
+from app.services.signals.rollups import record_signal_stats
+from app.services.analytics.backtest import record_signal_prices
+from app.services.websocket.router import broadcast_signal_update
 from app.services.notifications.service import notification_service
 
 
+async def _insert_signal(db: AsyncSession, signal):
+    """Insert a signal, once per source message.
+
+    A signal from the ingestion stream carries its entry id in
+    ``source_message_id``; a redelivered entry hits the unique constraint and
+    nothing is inserted. Returns the persisted signal, or None in that case.
+    """
+    if signal.source_message_id is None:
+        db.add(signal)
+        await db.flush()
+        await db.refresh(signal)
+        return signal
+
+    model = type(signal)
+    values = {
+        attr.key: getattr(signal, attr.key)
+        for attr in inspect(model).column_attrs
+        if getattr(signal, attr.key) is not None
+    }
+    statement = (
+        upsert_insert(db, model)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=[model.source_message_id])
+        .returning(model.id)
+    )
+    signal_id = (await db.execute(statement)).scalar()
+    if signal_id is None:
+        return None
+    return await db.get(model, signal_id)
+
+
+async def _persist_signal(
+    db: AsyncSession,
+    signal_type: str,
+    signal,
+    trace: SignalTrace,
+) -> Optional[Tuple[Any, Dict[str, Any]]]:
+    """Insert a signal with its latest row, stats rollups and observed prices in one transaction.
+
+    Returns the persisted signal and its latest-signal payload, or None if
+    the signal's source message was already persisted.
+    """
+    with trace.stage("insert"):
+        signal = await _insert_signal(db, signal)
+        if signal is None:
+            await db.rollback()
+            return None
+        payload = await upsert_latest_signal(db, signal_type, signal)
+        await record_signal_stats(db, signal_type, signal)
+        record_signal_prices(db, signal_type, signal)
+        await db.commit()
+
+    return signal, payload
+
+
+async def _dispatch_signal(
+    db: AsyncSession,
+    signal_type: str,
+    signal_id: int,
+    payload: Dict[str, Any],
+    signal_data: Dict[str, Any],
+    trace: SignalTrace,
+):
+    """Broadcast a persisted signal and notify users, timing each stage."""
+    # Feed the leaderboard, recent signals and WebSocket clients
+    with trace.stage("broadcast"):
+        await fan_out_signal(signal_type, payload, signal_data, trace)
+
+    # Send notifications to users
+    with trace.stage("notify"):
+        await notification_service.notify_users_about_signal(
+            db, signal_type, signal_id, signal_data
+        )
+
+    trace.finish()
+
+
 async def create_mexc_spot_futures_signal(
     db: AsyncSession,
     coin_name: str,
@@ -24,8 +107,11 @@ async def create_mexc_spot_futures_signal(
     deposit_enabled: bool = True,
     withdrawal_enabled: bool = True,
     dex_url: Optional[str] = None,
-) -> SignalMEXCSpotFutures:
+    source_message_id: Optional[str] = None,
+    trace: Optional[SignalTrace] = None,
+) -> Optional[SignalMEXCSpotFutures]:
     """Create a new MEXC Spot & Futures signal."""
+    trace = trace or SignalTrace("mexc_spot_futures")
     signal = SignalMEXCSpotFutures(
         coin_name=coin_name,
         position=position,
@@ -37,10 +123,12 @@ async def create_mexc_spot_futures_signal(
         deposit_enabled=deposit_enabled,
         withdrawal_enabled=withdrawal_enabled,
         dex_url=dex_url,
+        source_message_id=source_message_id,
     )
-    db.add(signal)
-    await db.commit()
-    await db.refresh(signal)
+    persisted = await _persist_signal(db, "mexc_spot_futures", signal, trace)
+    if persisted is None:
+        return None
+    signal, payload = persisted
 
     # Prepare signal data for notifications
     signal_data = {
@@ -53,13 +141,7 @@ async def create_mexc_spot_futures_signal(
         "created_at": signal.created_at.isoformat() if signal.created_at else None,
     }
 
-    # Broadcast to WebSocket clients
-    await broadcast_new_signal("mexc_spot_futures", signal_data)
-
-    # Send notifications to users
-    await notification_service.notify_users_about_signal(
-        db, "mexc_spot_futures", signal.id, signal_data
-    )
+    await _dispatch_signal(db, "mexc_spot_futures", signal.id, payload, signal_data, trace)
 
     return signal
 
@@ -68,13 +150,16 @@ async def create_funding_rate_signal(
     db: AsyncSession,
     coin_name: str,
     hourly_profit: Optional[Decimal] = None,
+    trace: Optional[SignalTrace] = None,
     **kwargs,
-) -> SignalFundingRate:
+) -> Optional[SignalFundingRate]:
     """Create a new Funding Rate signal."""
+    trace = trace or SignalTrace("funding_rate")
     signal = SignalFundingRate(coin_name=coin_name, hourly_profit=hourly_profit, **kwargs)
-    db.add(signal)
-    await db.commit()
-    await db.refresh(signal)
+    persisted = await _persist_signal(db, "funding_rate", signal, trace)
+    if persisted is None:
+        return None
+    signal, payload = persisted
 
     # Prepare signal data for notifications
     signal_data = {
@@ -84,13 +169,7 @@ async def create_funding_rate_signal(
         "created_at": signal.created_at.isoformat() if signal.created_at else None,
     }
 
-    # Broadcast to WebSocket clients
-    await broadcast_new_signal("funding_rate", signal_data)
-
-    # Send notifications to users
-    await notification_service.notify_users_about_signal(
-        db, "funding_rate", signal.id, signal_data
-    )
+    await _dispatch_signal(db, "funding_rate", signal.id, payload, signal_data, trace)
 
     return signal
 
@@ -101,9 +180,11 @@ async def create_mexc_dex_signal(
     spread_percent: Optional[Decimal] = None,
     mexc_price: Optional[Decimal] = None,
     dex_price: Optional[Decimal] = None,
+    trace: Optional[SignalTrace] = None,
     **kwargs,
-) -> SignalMEXCDEX:
+) -> Optional[SignalMEXCDEX]:
     """Create a new MEXC & DEX signal."""
+    trace = trace or SignalTrace("mexc_dex")
     signal = SignalMEXCDEX(
         coin_name=coin_name,
         spread_percent=spread_percent,
@@ -111,9 +192,10 @@ async def create_mexc_dex_signal(
         dex_price=dex_price,
         **kwargs,
     )
-    db.add(signal)
-    await db.commit()
-    await db.refresh(signal)
+    persisted = await _persist_signal(db, "mexc_dex", signal, trace)
+    if persisted is None:
+        return None
+    signal, payload = persisted
 
     # Prepare signal data for notifications
     signal_data = {
@@ -125,13 +207,7 @@ async def create_mexc_dex_signal(
         "created_at": signal.created_at.isoformat() if signal.created_at else None,
     }
 
-    # Broadcast to WebSocket clients
-    await broadcast_new_signal("mexc_dex", signal_data)
-
-    # Send notifications to users
-    await notification_service.notify_users_about_signal(
-        db, "mexc_dex", signal.id, signal_data
-    )
+    await _dispatch_signal(db, "mexc_dex", signal.id, payload, signal_data, trace)
 
     return signal
 
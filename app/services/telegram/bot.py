@@ -4,19 +4,10 @@ from typing import Optional
 from telegram import Update
 from telegram.ext import Application, MessageHandler, filters, ContextTypes
 from app.core.config import settings
-from app.core.database import AsyncSessionLocal
 from app.core.logging_config import get_logger
-from app.services.telegram.parsers import (
-    detect_signal_type,
-    MEXCSpotFuturesParser,
-    FundingRateParser,
-    MEXCDEXParser,
-)
-from app.services.signals.service import (
-    create_mexc_spot_futures_signal,
-    create_funding_rate_signal,
-    create_mexc_dex_signal,
-)
+from app.services.telegram.parsers import detect_signal_type
+from app.services.telegram.handler import handle_signal_message
+from app.services.telegram.stream import publish_signal_message
 
 logger = get_logger(__name__)
 
@@ -48,51 +39,36 @@ class TelegramBot:
         if not signal_type:
             return
 
-        # Parse signal based on type
-        parsed_data = None
-        async with AsyncSessionLocal() as db:
+        # Hand the raw message to the durable ingestion stream when enabled;
+        # fall back to inline processing if Redis is unavailable.
+        if settings.ingest_stream_enabled:
             try:
-                if signal_type == 'mexc_spot_futures':
-                    parser = MEXCSpotFuturesParser()
-                    parsed_data = parser.parse(message_text)
-                    if parsed_data:
-                        await create_mexc_spot_futures_signal(db, **parsed_data)
-                        logger.info(
-                            "Created MEXC Spot & Futures signal",
-                            coin_name=parsed_data.get('coin_name'),
-                            spread=parsed_data.get('spread'),
-                        )
-
-                elif signal_type == 'funding_rate':
-                    parser = FundingRateParser()
-                    parsed_data = parser.parse(message_text)
-                    if parsed_data:
-                        await create_funding_rate_signal(db, **parsed_data)
-                        logger.info(
-                            "Created Funding Rate signal",
-                            coin_name=parsed_data.get('coin_name'),
-                            hourly_profit=parsed_data.get('hourly_profit'),
-                        )
-
-                elif signal_type == 'mexc_dex':
-                    parser = MEXCDEXParser()
-                    parsed_data = parser.parse(message_text)
-                    if parsed_data:
-                        await create_mexc_dex_signal(db, **parsed_data)
-                        logger.info(
-                            "Created MEXC & DEX signal",
-                            coin_name=parsed_data.get('coin_name'),
-                            spread_percent=parsed_data.get('spread_percent'),
-                        )
-
+                await publish_signal_message(
+                    message_text,
+                    chat_id,
+                    message_id=update.message.message_id,
+                    message_date=update.message.date.timestamp() if update.message.date else None,
+                )
+                return
             except Exception as e:
-                logger.error(
-                    "Error processing Telegram message",
+                logger.warning(
+                    "Failed to publish message to ingestion stream, processing inline",
                     error=str(e),
-                    signal_type=signal_type,
-                    exc_info=True,
                 )
-                # Log error but don't crash
+
+        try:
+            await handle_signal_message(
+                message_text,
+                message_date=update.message.date.timestamp() if update.message.date else None,
+            )
+        except Exception as e:
+            logger.error(
+                "Error processing Telegram message",
+                error=str(e),
+                signal_type=signal_type,
+                exc_info=True,
+            )
+            # Log error but don't crash
 
     def setup_handlers(self):
         """Setup message handlers."""
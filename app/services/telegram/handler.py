@@ -0,0 +1,100 @@
+"""Signal message handling shared by the Telegram bot and the ingestion worker."""
+from typing import Optional
+from app.core.database import AsyncSessionLocal
+from app.core.logging_config import get_logger
+from app.core.tracing import SignalTrace
+from app.services.telegram.parsers import (
+    detect_signal_type,
+    MEXCSpotFuturesParser,
+    FundingRateParser,
+    MEXCDEXParser,
+)
+from app.services.signals.service import (
+    create_mexc_spot_futures_signal,
+    create_funding_rate_signal,
+    create_mexc_dex_signal,
+)
+
+logger = get_logger(__name__)
+
+
+async def handle_signal_message(
+    message_text: str,
+    message_date: Optional[float] = None,
+    trace_id: Optional[str] = None,
+    source_message_id: Optional[str] = None,
+) -> Optional[str]:
+    """Parse a signal message and persist it.
+
+    ``message_date`` is the Unix timestamp of the Telegram post and is used
+    as the origin for end-to-end latency; ``trace_id`` is kept when the
+    message was already assigned one upstream (e.g. by the ingestion stream).
+    A message with a ``source_message_id`` that was already persisted is
+    skipped.
+
+    Returns the signal type if a signal was created, otherwise None.
+    Errors are propagated so that callers can decide whether to retry.
+    """
+    signal_type = detect_signal_type(message_text)
+    if not signal_type:
+        return None
+
+    trace = SignalTrace(signal_type, source_ts=message_date, trace_id=trace_id)
+    trace.observe_queue_delay()
+
+    async with AsyncSessionLocal() as db:
+        if signal_type == 'mexc_spot_futures':
+            with trace.stage("parse"):
+                parsed_data = MEXCSpotFuturesParser().parse(message_text)
+            if not parsed_data:
+                return None
+            signal = await create_mexc_spot_futures_signal(
+                db, **parsed_data, source_message_id=source_message_id, trace=trace
+            )
+            if signal is None:
+                return None
+            logger.info(
+                "Created MEXC Spot & Futures signal",
+                trace_id=trace.trace_id,
+                coin_name=parsed_data.get('coin_name'),
+                spread=parsed_data.get('spread'),
+            )
+
+        elif signal_type == 'funding_rate':
+            with trace.stage("parse"):
+                parsed_data = FundingRateParser().parse(message_text)
+            if not parsed_data:
+                return None
+            signal = await create_funding_rate_signal(
+                db, **parsed_data, source_message_id=source_message_id, trace=trace
+            )
+            if signal is None:
+                return None
+            logger.info(
+                "Created Funding Rate signal",
+                trace_id=trace.trace_id,
+                coin_name=parsed_data.get('coin_name'),
+                hourly_profit=parsed_data.get('hourly_profit'),
+            )
+
+        elif signal_type == 'mexc_dex':
+            with trace.stage("parse"):
+                parsed_data = MEXCDEXParser().parse(message_text)
+            if not parsed_data:
+                return None
+            signal = await create_mexc_dex_signal(
+                db, **parsed_data, source_message_id=source_message_id, trace=trace
+            )
+            if signal is None:
+                return None
+            logger.info(
+                "Created MEXC & DEX signal",
+                trace_id=trace.trace_id,
+                coin_name=parsed_data.get('coin_name'),
+                spread_percent=parsed_data.get('spread_percent'),
+            )
+
+        else:
+            return None
+
+    return signal_type
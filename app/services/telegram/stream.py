@@ -0,0 +1,172 @@
+"""Durable signal ingestion log on Redis Streams.
+
+The Telegram bot appends raw signal messages to a stream and returns
+immediately. ``IngestStreamConsumer`` reads the stream through a consumer
+group, persists each message via ``handle_signal_message`` and acknowledges
+it only after the signal is committed; the entry id is stored with the
+signal, so a redelivered entry is never persisted twice. Entries left
+pending by a crashed consumer are reclaimed after ``ingest_claim_idle_ms``;
+entries that keep failing are moved to a dead-letter stream after
+``ingest_max_deliveries``.
+"""
+import asyncio
+import os
+import socket
+import time
+import uuid
+from typing import Any, Dict, Optional
+from redis.exceptions import ResponseError
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.core.redis_client import get_redis
+from app.services.telegram.handler import handle_signal_message
+
+logger = get_logger(__name__)
+
+
+async def publish_signal_message(
+    text: str,
+    chat_id: str,
+    message_id: Optional[int] = None,
+    message_date: Optional[float] = None,
+) -> str:
+    """Append a raw Telegram message to the ingestion stream.
+
+    The entry is assigned its trace id here so that latency tracing covers
+    the time spent in the stream.
+    """
+    redis = await get_redis()
+    fields = {
+        "trace_id": uuid.uuid4().hex,
+        "text": text,
+        "chat_id": chat_id,
+        "message_id": str(message_id or ""),
+        "message_date": str(message_date or ""),
+        "received_at": str(time.time()),
+    }
+    return await redis.xadd(
+        settings.ingest_stream_name,
+        fields,
+        maxlen=settings.ingest_stream_maxlen,
+        approximate=True,
+    )
+
+
+class IngestStreamConsumer:
+    """Consumer-group worker that persists signals from the ingestion stream."""
+
+    def __init__(self, consumer_name: Optional[str] = None):
+        self.stream = settings.ingest_stream_name
+        self.group = settings.ingest_consumer_group
+        self.dead_letter_stream = f"{self.stream}:dead"
+        self.consumer_name = consumer_name or f"{socket.gethostname()}-{os.getpid()}"
+        self._running = False
+        self._last_claim = 0.0
+
+    async def ensure_group(self):
+        """Create the consumer group (and the stream) if it does not exist."""
+        redis = await get_redis()
+        try:
+            await redis.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def process_entry(self, entry_id: str, fields: Dict[str, Any]) -> bool:
+        """Persist a single stream entry and acknowledge it on success.
+
+        The entry id is stored with the signal under a unique constraint, so
+        an entry redelivered after its signal was committed (the previous
+        consumer died before acknowledging) inserts nothing and is acknowledged.
+        """
+        redis = await get_redis()
+        try:
+            message_date = fields.get("message_date")
+            await handle_signal_message(
+                fields.get("text", ""),
+                message_date=float(message_date) if message_date else None,
+                trace_id=fields.get("trace_id") or None,
+                source_message_id=entry_id,
+            )
+        except Exception as e:
+            logger.error(
+                "Error processing ingestion entry",
+                entry_id=entry_id,
+                error=str(e),
+                exc_info=True,
+            )
+            return False
+
+        await redis.xack(self.stream, self.group, entry_id)
+        return True
+
+    async def reclaim_pending(self):
+        """Dead-letter poisoned entries and claim entries abandoned by other consumers."""
+        redis = await get_redis()
+        min_idle = settings.ingest_claim_idle_ms
+
+        pending = await redis.xpending_range(
+            self.stream,
+            self.group,
+            min="-",
+            max="+",
+            count=settings.ingest_batch_size,
+            idle=min_idle,
+        )
+        for entry in pending:
+            if entry["times_delivered"] < settings.ingest_max_deliveries:
+                continue
+            entry_id = entry["message_id"]
+            for _, fields in await redis.xrange(self.stream, min=entry_id, max=entry_id):
+                await redis.xadd(self.dead_letter_stream, {**fields, "entry_id": entry_id})
+            await redis.xack(self.stream, self.group, entry_id)
+            logger.warning(
+                "Moved ingestion entry to dead-letter stream",
+                entry_id=entry_id,
+                deliveries=entry["times_delivered"],
+            )
+
+        result = await redis.xautoclaim(
+            self.stream,
+            self.group,
+            self.consumer_name,
+            min_idle_time=min_idle,
+            start_id="0-0",
+            count=settings.ingest_batch_size,
+        )
+        for entry_id, fields in result[1]:
+            if fields:
+                await self.process_entry(entry_id, fields)
+
+    async def run(self):
+        """Consume the stream until ``stop`` is called."""
+        await self.ensure_group()
+        self._running = True
+        logger.info("Ingestion consumer started", consumer=self.consumer_name, stream=self.stream)
+
+        redis = await get_redis()
+        while self._running:
+            try:
+                if time.monotonic() - self._last_claim >= settings.ingest_claim_idle_ms / 1000:
+                    self._last_claim = time.monotonic()
+                    await self.reclaim_pending()
+
+                response = await redis.xreadgroup(
+                    self.group,
+                    self.consumer_name,
+                    {self.stream: ">"},
+                    count=settings.ingest_batch_size,
+                    block=settings.ingest_block_ms,
+                )
+                for _, entries in response or []:
+                    for entry_id, fields in entries:
+                        await self.process_entry(entry_id, fields)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Ingestion consumer error", error=str(e), exc_info=True)
+                await asyncio.sleep(1)
+
+    def stop(self):
+        """Ask the consumer loop to exit after the current batch."""
+        self._running = False
@@ -72,16 +72,21 @@ async def get_user_preferences(
         mexc_spot_futures_sound=preferences.mexc_spot_futures_sound,
         mexc_spot_futures_browser_notif=preferences.mexc_spot_futures_browser_notif,
         mexc_spot_futures_email_notif=preferences.mexc_spot_futures_email_notif,
+        mexc_spot_futures_email_digest=preferences.mexc_spot_futures_email_digest or "immediate",
         funding_rate_enabled=preferences.funding_rate_enabled,
         funding_rate_min_profit=str(preferences.funding_rate_min_profit),
         funding_rate_sound=preferences.funding_rate_sound,
         funding_rate_browser_notif=preferences.funding_rate_browser_notif,
         funding_rate_email_notif=preferences.funding_rate_email_notif,
+        funding_rate_email_digest=preferences.funding_rate_email_digest or "immediate",
         mexc_dex_enabled=preferences.mexc_dex_enabled,
         mexc_dex_min_spread=str(preferences.mexc_dex_min_spread),
         mexc_dex_sound=preferences.mexc_dex_sound,
         mexc_dex_browser_notif=preferences.mexc_dex_browser_notif,
         mexc_dex_email_notif=preferences.mexc_dex_email_notif,
+        mexc_dex_email_digest=preferences.mexc_dex_email_digest or "immediate",
+        alert_suppression_seconds=preferences.alert_suppression_seconds,
+        alert_min_change_percent=preferences.alert_min_change_percent,
     )
 
 
@@ -120,16 +125,21 @@ async def update_user_preferences(
         mexc_spot_futures_sound=preferences.mexc_spot_futures_sound,
         mexc_spot_futures_browser_notif=preferences.mexc_spot_futures_browser_notif,
         mexc_spot_futures_email_notif=preferences.mexc_spot_futures_email_notif,
+        mexc_spot_futures_email_digest=preferences.mexc_spot_futures_email_digest or "immediate",
         funding_rate_enabled=preferences.funding_rate_enabled,
         funding_rate_min_profit=str(preferences.funding_rate_min_profit),
         funding_rate_sound=preferences.funding_rate_sound,
         funding_rate_browser_notif=preferences.funding_rate_browser_notif,
         funding_rate_email_notif=preferences.funding_rate_email_notif,
+        funding_rate_email_digest=preferences.funding_rate_email_digest or "immediate",
         mexc_dex_enabled=preferences.mexc_dex_enabled,
         mexc_dex_min_spread=str(preferences.mexc_dex_min_spread),
         mexc_dex_sound=preferences.mexc_dex_sound,
         mexc_dex_browser_notif=preferences.mexc_dex_browser_notif,
         mexc_dex_email_notif=preferences.mexc_dex_email_notif,
+        mexc_dex_email_digest=preferences.mexc_dex_email_digest or "immediate",
+        alert_suppression_seconds=preferences.alert_suppression_seconds,
+        alert_min_change_percent=preferences.alert_min_change_percent,
     )
 
 
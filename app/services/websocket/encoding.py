@@ -0,0 +1,77 @@
+"""Wire encodings for WebSocket frames.
+
+JSON text frames are the default. Clients can negotiate MessagePack binary
+frames with the ``msgpack`` subprotocol or ``?encoding=msgpack``. A message is
+encoded at most once per encoding, however many connections receive it.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Union
+import msgpack
+from fastapi import WebSocket
+from app.core.responses import dumps
+
+ENCODINGS = ("json", "msgpack")
+MSGPACK_SUBPROTOCOL = "msgpack"
+
+Payload = Union[str, bytes]
+
+# Packed {"type": "batch", "messages": ...} without the array of messages
+_MSGPACK_BATCH_PREFIX = msgpack.packb({"type": "batch", "messages": []})[:-1]
+
+
+def _msgpack_default(value: Any) -> Any:
+    """Encode types msgpack does not handle the way JSON frames carry them."""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not MessagePack serializable")
+
+
+def encode(message: dict, encoding: str) -> Payload:
+    """A message as a JSON string or MessagePack bytes."""
+    if encoding == "msgpack":
+        return msgpack.packb(message, default=_msgpack_default)
+    return dumps(message).decode()
+
+
+def encode_batch(payloads: List[Payload], encoding: str) -> Payload:
+    """One ``batch`` frame from already encoded messages, without re-encoding them."""
+    if encoding == "msgpack":
+        packer = msgpack.Packer()
+        return _MSGPACK_BATCH_PREFIX + packer.pack_array_header(len(payloads)) + b"".join(payloads)
+    return '{"type":"batch","messages":[' + ",".join(payloads) + "]}"
+
+
+class EncodedMessage:
+    """A message with its encodings cached."""
+
+    __slots__ = ("message", "_payloads")
+
+    def __init__(self, message: dict):
+        self.message = message
+        self._payloads: Dict[str, Payload] = {}
+
+    def payload(self, encoding: str) -> Payload:
+        payload = self._payloads.get(encoding)
+        if payload is None:
+            payload = self._payloads[encoding] = encode(self.message, encoding)
+        return payload
+
+
+def negotiate_encoding(subprotocols: Iterable[str], encoding: Optional[str]) -> Optional[str]:
+    """Encoding the client asked for, or None if it is not supported."""
+    if MSGPACK_SUBPROTOCOL in subprotocols:
+        return "msgpack"
+    if encoding is None:
+        return "json"
+    return encoding if encoding in ENCODINGS else None
+
+
+async def send_payload(websocket: WebSocket, payload: Payload):
+    """Send text for JSON and a binary frame for MessagePack."""
+    if isinstance(payload, bytes):
+        await websocket.send_bytes(payload)
+    else:
+        await websocket.send_text(payload)
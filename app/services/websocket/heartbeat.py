@@ -0,0 +1,56 @@
+"""Timer wheel for server-driven WebSocket heartbeats.
+
+Connections are spread over ``interval / tick`` slots. One task advances the
+wheel every tick and only looks at the connections in the current slot, so
+each connection is visited once per interval and the pings are spread evenly
+instead of going out in one burst. Any message from the client counts as
+proof of life; a connection silent for longer than the timeout is stale.
+"""
+import time
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+
+class HeartbeatWheel:
+    """Round-robin slots of connections with their last-seen times."""
+
+    def __init__(self, interval: float, timeout: float, tick: float = 1.0):
+        self.interval = interval
+        self.timeout = timeout
+        self.tick = tick
+        self._slots: List[Set[Hashable]] = [set() for _ in range(max(1, round(interval / tick)))]
+        self._slot_of: Dict[Hashable, int] = {}
+        self._last_seen: Dict[Hashable, float] = {}
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    def add(self, connection: Hashable, now: Optional[float] = None):
+        """Schedule a connection; its first check is one full interval away."""
+        self.remove(connection)
+        self._slots[self._cursor].add(connection)
+        self._slot_of[connection] = self._cursor
+        self._last_seen[connection] = time.monotonic() if now is None else now
+
+    def remove(self, connection: Hashable):
+        slot = self._slot_of.pop(connection, None)
+        if slot is not None:
+            self._slots[slot].discard(connection)
+        self._last_seen.pop(connection, None)
+
+    def touch(self, connection: Hashable, now: Optional[float] = None):
+        """Record that the client sent something."""
+        if connection in self._last_seen:
+            self._last_seen[connection] = time.monotonic() if now is None else now
+
+    def advance(self, now: Optional[float] = None) -> Tuple[list, list]:
+        """Move to the next slot. Returns its connections to ping and the stale ones."""
+        now = time.monotonic() if now is None else now
+        self._cursor = (self._cursor + 1) % len(self._slots)
+        alive, stale = [], []
+        for connection in self._slots[self._cursor]:
+            if now - self._last_seen[connection] > self.timeout:
+                stale.append(connection)
+            else:
+                alive.append(connection)
+        return alive, stale
@@ -1,12 +1,105 @@
 """WebSocket connection manager."""
-from typing import Dict, Set
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
 from fastapi import WebSocket, WebSocketDisconnect
 import json
+import time
 import asyncio
+from app.core.config import settings
+from app.core.metrics import ws_connections_reaped_total, ws_connections_rejected_total
 from app.core.security import decode_token
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.user import User, Subscription
+from app.services.signals.leaderboard import SCORE_FIELDS
+from app.services.websocket.encoding import EncodedMessage, Payload, encode, encode_batch, send_payload
+from app.services.websocket.heartbeat import HeartbeatWheel
+from app.services.websocket.replay import FrameLog
+
+# Subscription threshold applied to each signal type's score field
+THRESHOLD_FIELDS = {
+    "mexc_spot_futures": "min_spread",
+    "funding_rate": "min_profit",
+    "mexc_dex": "min_spread",
+}
+
+
+def _optional_float(value: Any, name: str) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"{name} must be a number")
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number")
+
+
+class SignalFilter:
+    """Signal types, coins and score thresholds a connection subscribed to.
+
+    ``None`` means no restriction: a fresh connection receives everything.
+    """
+
+    def __init__(
+        self,
+        signal_types: Optional[Iterable[str]] = None,
+        coins: Optional[Iterable[str]] = None,
+        min_spread: Optional[float] = None,
+        min_profit: Optional[float] = None,
+    ):
+        self.signal_types = frozenset(signal_types) if signal_types else frozenset(SCORE_FIELDS)
+        self.coins = frozenset(coin.upper() for coin in coins) if coins else None
+        self.min_spread = min_spread
+        self.min_profit = min_profit
+
+    @classmethod
+    def from_message(cls, message: dict) -> "SignalFilter":
+        """Build a filter from a client ``subscribe`` message. Raises ValueError."""
+        signal_types = message.get("signal_types")
+        if signal_types is not None:
+            if not isinstance(signal_types, list) or not all(item in SCORE_FIELDS for item in signal_types):
+                raise ValueError(f"signal_types must be a list of: {', '.join(SCORE_FIELDS)}")
+        coins = message.get("coins")
+        if coins is not None:
+            if not isinstance(coins, list) or not all(isinstance(item, str) and item for item in coins):
+                raise ValueError("coins must be a list of coin names")
+        return cls(
+            signal_types=signal_types,
+            coins=coins,
+            min_spread=_optional_float(message.get("min_spread"), "min_spread"),
+            min_profit=_optional_float(message.get("min_profit"), "min_profit"),
+        )
+
+    def threshold(self, signal_type: str) -> Optional[float]:
+        return getattr(self, THRESHOLD_FIELDS[signal_type])
+
+    def matches(self, signal_type: str, coin_name: Optional[str], value: Optional[float]) -> bool:
+        """Whether a signal passes the filter. A frame without a coin only needs its type."""
+        if signal_type not in self.signal_types:
+            return False
+        if coin_name is None:
+            return True
+        if self.coins is not None and coin_name.upper() not in self.coins:
+            return False
+        minimum = self.threshold(signal_type)
+        return minimum is None or (value is not None and value >= minimum)
+
+    def to_dict(self) -> dict:
+        return {
+            "signal_types": sorted(self.signal_types),
+            "coins": sorted(self.coins) if self.coins is not None else None,
+            "min_spread": self.min_spread,
+            "min_profit": self.min_profit,
+        }
+
+
+def signal_score(signal_type: str, signal_data: dict) -> Optional[float]:
+    """The signal's score field as a float, used for threshold filters."""
+    value = signal_data.get(SCORE_FIELDS[signal_type])
+    try:
+        return None if value is None else float(value)
+    except (TypeError, ValueError):
+        return None
 
 
 class ConnectionManager:
@@ -17,14 +110,58 @@ class ConnectionManager:
         self.active_connections: Dict[int, Set[WebSocket]] = {}
         # Map websocket -> user_id
         self.websocket_to_user: Dict[WebSocket, int] = {}
+        # Map websocket -> monotonic connect time
+        self.connected_at: Dict[WebSocket, float] = {}
+        # Map websocket -> its signal filter
+        self.filters: Dict[WebSocket, SignalFilter] = {}
+        # signal_type -> coin name (None for all coins) -> subscribed connections
+        self._index: Dict[str, Dict[Optional[str], Set[WebSocket]]] = {
+            signal_type: {} for signal_type in SCORE_FIELDS
+        }
+        # Sequence numbers and recent frames for resuming clients
+        self.frame_log = FrameLog(settings.ws_replay_buffer_size)
+        # Wire encoding per connection ("json" unless negotiated otherwise)
+        self.encodings: Dict[WebSocket, str] = {}
+        # Connections being resumed -> live frames held back until replay ends
+        self._resuming: Dict[WebSocket, List[Payload]] = {}
+        # Coalescing window in seconds per connection that negotiated one
+        self._coalesce: Dict[WebSocket, float] = {}
+        # Frames waiting for the connection's window to close, and its flush task
+        self._batches: Dict[WebSocket, List[Payload]] = {}
+        self._flush_tasks: Dict[WebSocket, asyncio.Task] = {}
+        # Server heartbeat schedule, driven by run_heartbeats()
+        self.heartbeats = HeartbeatWheel(
+            interval=settings.ws_heartbeat_interval_seconds or 1,
+            timeout=settings.ws_heartbeat_timeout_seconds,
+        )
 
-    async def connect(self, websocket: WebSocket, user_id: int):
-        """Register WebSocket connection (accept should be called before this)."""
-        if user_id not in self.active_connections:
-            self.active_connections[user_id] = set()
-        
-        self.active_connections[user_id].add(websocket)
+    def at_capacity(self) -> bool:
+        """Whether this worker holds its maximum number of connections."""
+        return len(self.websocket_to_user) >= settings.ws_max_connections
+
+    async def connect(self, websocket: WebSocket, user_id: int, encoding: str = "json", heartbeat: bool = True):
+        """Register WebSocket connection (accept should be called before this).
+
+        A user at the per-user cap has their oldest connection closed to make room.
+        Connections that cannot answer pings (SSE streams) pass ``heartbeat=False``.
+        """
+        user_connections = self.active_connections.get(user_id, set())
+        while user_connections and len(user_connections) >= settings.ws_max_connections_per_user:
+            oldest = min(user_connections, key=lambda connection: self.connected_at.get(connection, 0))
+            self.disconnect(oldest)
+            ws_connections_rejected_total.labels(reason="user_limit").inc()
+            try:
+                await asyncio.wait_for(oldest.close(code=1008, reason="Connection limit reached"), 1)
+            except Exception:
+                pass
+
+        self.active_connections.setdefault(user_id, set()).add(websocket)
         self.websocket_to_user[websocket] = user_id
+        self.connected_at[websocket] = time.monotonic()
+        self.encodings[websocket] = encoding
+        self._set_filter(websocket, SignalFilter())
+        if heartbeat:
+            self.heartbeats.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
         """Remove WebSocket connection."""
@@ -36,27 +173,213 @@ class ConnectionManager:
         
         if websocket in self.websocket_to_user:
             del self.websocket_to_user[websocket]
+        self.connected_at.pop(websocket, None)
+        self._unindex(websocket)
+        self.encodings.pop(websocket, None)
+        self.heartbeats.remove(websocket)
+        self._resuming.pop(websocket, None)
+        self._coalesce.pop(websocket, None)
+        self._batches.pop(websocket, None)
+        task = self._flush_tasks.pop(websocket, None)
+        if task:
+            task.cancel()
+
+    def subscribe(self, websocket: WebSocket, signal_filter: SignalFilter, coalesce_ms: int = 0) -> bool:
+        """Replace a connection's signal filter and coalescing window.
+
+        Returns False if the connection is not registered.
+        """
+        if websocket not in self.websocket_to_user:
+            return False
+        self._set_filter(websocket, signal_filter)
+        if coalesce_ms > 0:
+            self._coalesce[websocket] = coalesce_ms / 1000
+        else:
+            self._coalesce.pop(websocket, None)
+        return True
+
+    def _set_filter(self, websocket: WebSocket, signal_filter: SignalFilter):
+        self._unindex(websocket)
+        self.filters[websocket] = signal_filter
+        coins = signal_filter.coins if signal_filter.coins is not None else (None,)
+        for signal_type in signal_filter.signal_types:
+            buckets = self._index[signal_type]
+            for coin in coins:
+                buckets.setdefault(coin, set()).add(websocket)
+
+    def _unindex(self, websocket: WebSocket):
+        signal_filter = self.filters.pop(websocket, None)
+        if signal_filter is None:
+            return
+        coins = signal_filter.coins if signal_filter.coins is not None else (None,)
+        for signal_type in signal_filter.signal_types:
+            buckets = self._index[signal_type]
+            for coin in coins:
+                bucket = buckets.get(coin)
+                if bucket is not None:
+                    bucket.discard(websocket)
+                    if not bucket:
+                        del buckets[coin]
+
+    def subscribers(
+        self,
+        signal_type: str,
+        coin_name: Optional[str] = None,
+        value: Optional[float] = None,
+    ) -> List[WebSocket]:
+        """Connections whose filter accepts the signal.
+
+        Without ``coin_name`` every connection subscribed to the signal type
+        is returned and thresholds are not applied.
+        """
+        buckets = self._index.get(signal_type)
+        if not buckets:
+            return []
+        if coin_name is None:
+            return list(set().union(*buckets.values()))
+
+        candidates = list(buckets.get(None, ()))
+        candidates.extend(buckets.get(coin_name.upper(), ()))
+        return [
+            websocket for websocket in candidates
+            if self.filters[websocket].matches(signal_type, coin_name, value)
+        ]
+
+    def _encoding(self, websocket: WebSocket) -> str:
+        return self.encodings.get(websocket, "json")
+
+    async def _deliver(self, websocket: WebSocket, encoded: EncodedMessage):
+        """Send a frame now, or queue it behind a resume or coalescing window."""
+        payload = encoded.payload(self._encoding(websocket))
+        pending = self._resuming.get(websocket)
+        if pending is not None:
+            pending.append(payload)
+            return
+        window = self._coalesce.get(websocket)
+        if not window:
+            await send_payload(websocket, payload)
+            return
+        batch = self._batches.get(websocket)
+        if batch is None:
+            self._batches[websocket] = [payload]
+            self._flush_tasks[websocket] = asyncio.create_task(self._flush_after(websocket, window))
+        else:
+            batch.append(payload)
+
+    async def _flush_after(self, websocket: WebSocket, window: float):
+        await asyncio.sleep(window)
+        self._flush_tasks.pop(websocket, None)
+        try:
+            await self._flush(websocket)
+        except Exception:
+            self.disconnect(websocket)
+
+    async def _flush(self, websocket: WebSocket):
+        """Send the connection's queued frames, several of them as one batch frame."""
+        batch = self._batches.pop(websocket, None)
+        if not batch:
+            return
+        if len(batch) == 1:
+            await send_payload(websocket, batch[0])
+        else:
+            await send_payload(websocket, encode_batch(batch, self._encoding(websocket)))
+
+    async def _send_to(self, websockets: Iterable[WebSocket], encoded: EncodedMessage) -> int:
+        sent = 0
+        disconnected = []
+        for websocket in websockets:
+            try:
+                await self._deliver(websocket, encoded)
+                sent += 1
+            except Exception:
+                disconnected.append(websocket)
+        for websocket in disconnected:
+            self.disconnect(websocket)
+        return sent
+
+    async def broadcast_signal(self, signal_type: str, signal_data: dict, message: dict) -> int:
+        """Send a signal frame to matching connections only. Returns how many got it.
+
+        The frame gets the next ``seq``, is encoded once per wire encoding and
+        is kept for replay even if nobody is subscribed right now.
+        """
+        coin_name = signal_data.get("coin_name", "")
+        value = signal_score(signal_type, signal_data)
+        frame = self.frame_log.append(signal_type, coin_name, value, message)
+        websockets = self.subscribers(signal_type, coin_name, value)
+        if not websockets:
+            return 0
+        return await self._send_to(websockets, frame.encoded)
+
+    async def broadcast_to_signal_type(self, signal_type: str, message: dict) -> int:
+        """Send a sequenced frame to every connection subscribed to a signal type."""
+        frame = self.frame_log.append(signal_type, None, None, message)
+        websockets = self.subscribers(signal_type)
+        if not websockets:
+            return 0
+        return await self._send_to(websockets, frame.encoded)
+
+    async def resume(
+        self,
+        websocket: WebSocket,
+        last_seq: Optional[int],
+        epoch: Optional[str],
+        build_snapshot: Callable[[SignalFilter], dict],
+    ) -> Optional[int]:
+        """Catch a reconnecting client up on the frames it missed.
+
+        Frames after ``last_seq`` that pass the connection's filter are replayed
+        and the count is returned. If the gap is no longer in the buffer, or the
+        epoch is from another process, ``build_snapshot`` is sent instead and
+        None is returned. Live frames broadcast meanwhile are held back and sent
+        afterwards, so the client sees everything in order.
+        """
+        signal_filter = self.filters.get(websocket)
+        if signal_filter is None:
+            return None
+        frames = None
+        if isinstance(last_seq, int) and epoch == self.frame_log.epoch:
+            frames = self.frame_log.since(last_seq)
+
+        pending: List[Payload] = []
+        self._resuming[websocket] = pending
+        replayed = 0
+        try:
+            # Frames already waiting in a coalescing window go out first
+            task = self._flush_tasks.pop(websocket, None)
+            if task:
+                task.cancel()
+            await self._flush(websocket)
+            if frames is None:
+                snapshot = build_snapshot(signal_filter)
+                await send_payload(websocket, encode(snapshot, self._encoding(websocket)))
+            else:
+                encoding = self._encoding(websocket)
+                for frame in frames:
+                    if signal_filter.matches(frame.signal_type, frame.coin_name, frame.value):
+                        await send_payload(websocket, frame.encoded.payload(encoding))
+                        replayed += 1
+            while pending:
+                await send_payload(websocket, pending.pop(0))
+        except Exception:
+            self.disconnect(websocket)
+            raise
+        finally:
+            self._resuming.pop(websocket, None)
+        return None if frames is None else replayed
 
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send message to specific WebSocket connection."""
         try:
-            await websocket.send_json(message)
+            await send_payload(websocket, encode(message, self._encoding(websocket)))
         except Exception:
             self.disconnect(websocket)
 
     async def broadcast_to_user(self, user_id: int, message: dict):
         """Broadcast message to all connections of a specific user."""
         if user_id in self.active_connections:
-            disconnected = set()
-            for websocket in self.active_connections[user_id]:
-                try:
-                    await websocket.send_json(message)
-                except Exception:
-                    disconnected.add(websocket)
-            
-            # Remove disconnected websockets
-            for ws in disconnected:
-                self.disconnect(ws)
+            websockets = list(self.active_connections[user_id])
+            await self._send_to(websockets, EncodedMessage(message))
 
     async def send_notification(self, user_id: int, notification: dict):
         """Send notification to specific user via WebSocket."""
@@ -79,6 +402,51 @@ class ConnectionManager:
             if user_id in self.active_connections:
                 await self.broadcast_to_user(user_id, message)
 
+    def touch(self, websocket: WebSocket):
+        """Record a message from the client for the heartbeat."""
+        self.heartbeats.touch(websocket)
+
+    async def _ping(self, websocket: WebSocket, message: dict, timeout: float) -> bool:
+        try:
+            payload = encode(message, self._encoding(websocket))
+            await asyncio.wait_for(send_payload(websocket, payload), timeout)
+            return True
+        except Exception:
+            return False
+
+    async def _reap(self, websocket: WebSocket, reason: str):
+        self.disconnect(websocket)
+        ws_connections_reaped_total.labels(reason=reason).inc()
+        try:
+            await asyncio.wait_for(websocket.close(code=1001, reason="Heartbeat timeout"), 1)
+        except Exception:
+            pass
+
+    async def heartbeat(self, now: Optional[float] = None) -> int:
+        """Advance the heartbeat wheel one tick. Returns how many connections were reaped.
+
+        Stale connections in the current slot are closed, the rest are pinged
+        concurrently so one stuck socket cannot hold up the others.
+        """
+        alive, stale = self.heartbeats.advance(now)
+        message = {"type": "ping", "ts": time.time()}
+        results = await asyncio.gather(*(self._ping(websocket, message, self.heartbeats.tick) for websocket in alive))
+        failed = [websocket for websocket, ok in zip(alive, results) if not ok]
+        for websocket in stale:
+            await self._reap(websocket, "timeout")
+        for websocket in failed:
+            await self._reap(websocket, "send_failed")
+        return len(stale) + len(failed)
+
+    async def run_heartbeats(self):
+        """Drive server heartbeats from a single task until cancelled."""
+        while True:
+            await asyncio.sleep(self.heartbeats.tick)
+            try:
+                await self.heartbeat()
+            except Exception as e:
+                print(f"WebSocket heartbeat error: {e}")
+
     async def get_user_from_token(self, token: str, db: AsyncSession) -> User | None:
         """Get user from JWT token."""
         payload = decode_token(token)
@@ -0,0 +1,59 @@
+"""Sequence numbers and a replay buffer for broadcast frames.
+
+Every broadcast frame gets the next ``seq`` of this process and is kept, with its
+encodings cached, in a bounded ring buffer. A reconnecting client sends the last ``seq``
+it saw together with the ``epoch`` from its ``connected`` frame and receives
+only the frames it missed. The epoch changes on every restart, so a sequence
+number from another process is never trusted.
+"""
+import uuid
+from collections import deque
+from itertools import islice
+from typing import Deque, List, NamedTuple, Optional
+from app.services.websocket.encoding import EncodedMessage
+
+
+class Frame(NamedTuple):
+    """A broadcast frame and what subscription filters need to route it."""
+
+    seq: int
+    signal_type: str
+    # None for frames that are not about a single coin (signal updates)
+    coin_name: Optional[str]
+    value: Optional[float]
+    encoded: EncodedMessage
+
+
+class FrameLog:
+    """Assigns sequence numbers and keeps the newest frames for replay."""
+
+    def __init__(self, size: int):
+        self.epoch = uuid.uuid4().hex[:16]
+        self.seq = 0
+        self._frames: Deque[Frame] = deque(maxlen=size)
+
+    def append(
+        self,
+        signal_type: str,
+        coin_name: Optional[str],
+        value: Optional[float],
+        message: dict,
+    ) -> Frame:
+        """Number a message and keep it. Sets ``message["seq"]``."""
+        self.seq += 1
+        message["seq"] = self.seq
+        frame = Frame(self.seq, signal_type, coin_name, value, EncodedMessage(message))
+        if self._frames.maxlen:
+            self._frames.append(frame)
+        return frame
+
+    def since(self, last_seq: int) -> Optional[List[Frame]]:
+        """Frames after ``last_seq``, or None if some of them are no longer kept."""
+        if last_seq > self.seq or last_seq < 0:
+            return None
+        if last_seq == self.seq:
+            return []
+        if not self._frames or last_seq < self._frames[0].seq - 1:
+            return None
+        return list(islice(self._frames, last_seq - self._frames[0].seq + 1, None))
+
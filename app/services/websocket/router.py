@@ -1,76 +1,311 @@
 """WebSocket routes for real-time signal updates."""
+from typing import Dict, Optional, Set
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
+from sqlalchemy import select
+from app.core.config import settings
 from app.core.database import AsyncSessionLocal
-from app.services.websocket.manager import manager
+from app.core.metrics import ws_connections_rejected_total
+from app.core.security import decode_token
+from app.core.tracing import SignalTrace
+from app.models.user import Subscription, User
+from app.services.signals.leaderboard import leaderboard, SCORE_FIELDS
+from app.services.signals.recent import recent_signals
+from app.services.websocket.encoding import MSGPACK_SUBPROTOCOL, negotiate_encoding
+from app.services.websocket.manager import SignalFilter, manager, signal_score
+import asyncio
 import json
+import time
 
 router = APIRouter()
 
 
+def parse_coalesce_ms(value) -> int:
+    """Validate the coalescing window a client asked for. Raises ValueError."""
+    if value is None:
+        return 0
+    if isinstance(value, bool) or not isinstance(value, int) or not 0 <= value <= settings.ws_max_coalesce_ms:
+        raise ValueError(f"coalesce_ms must be an integer from 0 to {settings.ws_max_coalesce_ms}")
+    return value
+
+
+# Deferred subscription checks: bounded concurrency and a short-lived cache of
+# users already confirmed as VIP, so reconnects do not query again
+_vip_checks = asyncio.Semaphore(settings.ws_auth_check_concurrency)
+_vip_confirmed_until: Dict[int, float] = {}
+_pending_checks: Set[asyncio.Task] = set()
+
+
+def retry_after_reason() -> str:
+    return f"Server busy, retry after {settings.ws_retry_after_seconds}s"
+
+
+async def reject(websocket: WebSocket, code: int, reason: str, metric_reason: str):
+    """Close a connection refused by admission control."""
+    ws_connections_rejected_total.labels(reason=metric_reason).inc()
+    await websocket.close(code=code, reason=reason)
+
+
+async def check_vip(user_id: int) -> str:
+    """"vip", "not_vip" or "unauthorized" for a user, in one query.
+
+    Only an active VIP subscription counts; cancelled or expired ones are "not_vip".
+    """
+    if _vip_confirmed_until.get(user_id, 0) > time.monotonic():
+        return "vip"
+    async with _vip_checks:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(User.is_active, Subscription.plan, Subscription.status)
+                .outerjoin(Subscription, Subscription.user_id == User.id)
+                .where(User.id == user_id)
+            )
+            row = result.first()
+    if row is None or not row.is_active:
+        return "unauthorized"
+    if row.plan != "vip" or row.status != "active":
+        return "not_vip"
+    _vip_confirmed_until[user_id] = time.monotonic() + settings.ws_auth_cache_seconds
+    return "vip"
+
+
+async def verify_connection(websocket: WebSocket, user_id: int):
+    """Close a connection admitted on its plan claim if the database disagrees."""
+    try:
+        status = await check_vip(user_id)
+    except Exception as e:
+        # Fail open: a database hiccup must not drop connected clients
+        print(f"Deferred WebSocket auth check failed: {e}")
+        return
+    if status != "vip" and websocket in manager.websocket_to_user:
+        manager.disconnect(websocket)
+        reason = "Unauthorized" if status == "unauthorized" else "VIP subscription required"
+        try:
+            await reject(websocket, 1008, reason, status)
+        except Exception:
+            pass
+
+
+def schedule_vip_check(websocket: WebSocket, user_id: int):
+    task = asyncio.create_task(verify_connection(websocket, user_id))
+    _pending_checks.add(task)
+    task.add_done_callback(_pending_checks.discard)
+
+
+async def revalidate_connections() -> int:
+    """Close connections of users who no longer have an active VIP subscription.
+
+    One query for all connected users. Returns the number of users dropped.
+    """
+    user_ids = list(manager.active_connections)
+    if not user_ids:
+        return 0
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Subscription.user_id)
+            .join(User, User.id == Subscription.user_id)
+            .where(
+                Subscription.user_id.in_(user_ids),
+                Subscription.plan == "vip",
+                Subscription.status == "active",
+                User.is_active.is_(True),
+            )
+        )
+        active = set(result.scalars().all())
+
+    confirmed_until = time.monotonic() + settings.ws_auth_cache_seconds
+    dropped = 0
+    for user_id in user_ids:
+        if user_id in active:
+            _vip_confirmed_until[user_id] = confirmed_until
+            continue
+        _vip_confirmed_until.pop(user_id, None)
+        websockets = list(manager.active_connections.get(user_id, ()))
+        if not websockets:
+            continue
+        dropped += 1
+        for websocket in websockets:
+            manager.disconnect(websocket)
+            try:
+                await reject(websocket, 1008, "VIP subscription required", "not_vip")
+            except Exception:
+                pass
+    return dropped
+
+
+async def run_revalidation():
+    """Re-check connected users' subscriptions from a single task until cancelled."""
+    while True:
+        await asyncio.sleep(settings.ws_auth_recheck_seconds)
+        try:
+            await revalidate_connections()
+        except Exception as e:
+            # Fail open, like the deferred check: keep clients through a database hiccup
+            print(f"WebSocket subscription re-check failed: {e}")
+
+
+def build_snapshot(signal_filter: SignalFilter) -> dict:
+    """Recent signals per type that pass the filter, plus the current leaderboard.
+
+    Served from memory, without SQL. Everything up to ``seq`` is reflected
+    and frames after it are delivered live.
+    """
+    data = {}
+    for signal_type in sorted(signal_filter.signal_types):
+        data[signal_type] = [
+            signal for signal in recent_signals.latest(signal_type)
+            if signal_filter.matches(signal_type, signal["coin_name"], signal_score(signal_type, signal))
+        ]
+    return {
+        "type": "snapshot",
+        "epoch": manager.frame_log.epoch,
+        "seq": manager.frame_log.seq,
+        "data": data,
+        "leaderboard": {
+            "window_seconds": leaderboard.window_seconds,
+            "data": leaderboard.snapshot(),
+        },
+    }
+
+
 @router.websocket("/ws/signals")
 async def websocket_signals(
     websocket: WebSocket,
     token: str = Query(...),
+    encoding: Optional[str] = Query(None),
+    snapshot: bool = Query(True),
 ):
-    """WebSocket endpoint for real-time signal updates."""
-    user = None
+    """WebSocket endpoint for real-time signal updates.
+
+    Frames are JSON text unless the client negotiates MessagePack binary frames
+    with the ``msgpack`` subprotocol or ``?encoding=msgpack``. Right after the
+    greeting the client gets a snapshot of recent signals and the leaderboard,
+    unless it connects with ``?snapshot=false`` (e.g. to resume instead).
+    """
     try:
         # Accept connection first (required by FastAPI)
-        await websocket.accept()
-        
-        # Authenticate user AFTER accepting connection
-        async with AsyncSessionLocal() as db:
-            # Authenticate user
-            user = await manager.get_user_from_token(token, db)
-            if not user:
-                # Close connection if unauthorized
-                await websocket.close(code=1008, reason="Unauthorized")
-                return
+        subprotocols = websocket.scope.get("subprotocols", [])
+        wire_encoding = negotiate_encoding(subprotocols, encoding)
+        await websocket.accept(
+            subprotocol=MSGPACK_SUBPROTOCOL if MSGPACK_SUBPROTOCOL in subprotocols else None
+        )
+        if wire_encoding is None:
+            await websocket.close(code=1003, reason="Unsupported encoding")
+            return
 
-            # Check if user has VIP subscription
-            from app.models.user import Subscription
-            from sqlalchemy import select
+        # Shed load before any auth work so a reconnect storm does not reach the database
+        if manager.at_capacity():
+            await reject(websocket, 1013, retry_after_reason(), "capacity")
+            return
 
-            result = await db.execute(
-                select(Subscription).where(Subscription.user_id == user.id)
-            )
-            subscription = result.scalar_one_or_none()
-            plan = subscription.plan if subscription else "free"
+        # Authenticate user AFTER accepting connection
+        payload = decode_token(token)
+        if not payload or payload.get("type") != "access" or not str(payload.get("sub", "")).isdigit():
+            await reject(websocket, 1008, "Unauthorized", "unauthorized")
+            return
+        user_id = int(payload["sub"])
+        # Only a vip claim is trusted up front (and verified right after connecting).
+        # Any other claim may predate an upgrade, since access tokens are long-lived,
+        # so those tokens are checked against the database now.
+        vip_claim = payload.get("plan") == "vip"
 
-            if plan != "vip":
-                await websocket.close(code=1008, reason="VIP subscription required")
+        if not vip_claim:
+            status = await check_vip(user_id)
+            if status != "vip":
+                reason = "Unauthorized" if status == "unauthorized" else "VIP subscription required"
+                await reject(websocket, 1008, reason, status)
                 return
 
+        # Re-checked right before registering, with no await in between
+        if manager.at_capacity():
+            await reject(websocket, 1013, retry_after_reason(), "capacity")
+            return
+
         # Register connection in manager (this doesn't call accept again)
-        await manager.connect(websocket, user.id)
+        await manager.connect(websocket, user_id, wire_encoding)
+        if vip_claim:
+            # The claim may be stale (subscription cancelled or expired since login)
+            schedule_vip_check(websocket, user_id)
 
         # Send welcome message
         await manager.send_personal_message(
             {
                 "type": "connected",
                 "message": "Connected to CryptoTracker real-time signals",
-                "user_id": user.id,
+                "user_id": user_id,
+                "epoch": manager.frame_log.epoch,
+                "seq": manager.frame_log.seq,
+                "encoding": wire_encoding,
             },
             websocket,
         )
+        if snapshot:
+            await manager.send_personal_message(build_snapshot(SignalFilter()), websocket)
 
         # Keep connection alive and handle ping/pong
         while True:
             try:
                 # Wait for message from client (ping/pong or other)
                 data = await websocket.receive_text()
+                # Any client message keeps the connection alive for the heartbeat
+                manager.touch(websocket)
                 message = json.loads(data)
 
                 if message.get("type") == "pong":
-                    # Respond to ping
-                    await manager.send_personal_message(
-                        {"type": "pong"}, websocket
-                    )
+                    # Answer to a server ping, nothing to send back
+                    continue
                 elif message.get("type") == "ping":
                     # Client sent ping, respond with pong
                     await manager.send_personal_message(
                         {"type": "pong"}, websocket
                     )
+                elif message.get("type") == "get_leaderboard":
+                    # Snapshot of the in-memory leaderboard
+                    signal_type = message.get("signal_type")
+                    if signal_type not in SCORE_FIELDS:
+                        signal_type = None
+                    limit = message.get("limit")
+                    if not isinstance(limit, int) or not 1 <= limit <= 100:
+                        limit = None
+                    await manager.send_personal_message(
+                        {
+                            "type": "leaderboard",
+                            "window_seconds": leaderboard.window_seconds,
+                            "data": leaderboard.snapshot(signal_type, limit),
+                        },
+                        websocket,
+                    )
+                elif message.get("type") == "subscribe":
+                    # Replace the connection's signal filter
+                    try:
+                        signal_filter = SignalFilter.from_message(message)
+                        coalesce_ms = parse_coalesce_ms(message.get("coalesce_ms"))
+                    except ValueError as e:
+                        await manager.send_personal_message(
+                            {"type": "error", "message": str(e)}, websocket
+                        )
+                        continue
+                    manager.subscribe(websocket, signal_filter, coalesce_ms)
+                    await manager.send_personal_message(
+                        {
+                            "type": "subscribed",
+                            "filter": signal_filter.to_dict(),
+                            "coalesce_ms": coalesce_ms,
+                        },
+                        websocket,
+                    )
+                elif message.get("type") == "resume":
+                    # Replay missed frames, or a snapshot if the gap is too old
+                    last_seq = message.get("last_seq")
+                    if isinstance(last_seq, bool):
+                        last_seq = None
+                    replayed = await manager.resume(
+                        websocket, last_seq, message.get("epoch"), build_snapshot
+                    )
+                    if replayed is not None:
+                        await manager.send_personal_message(
+                            {"type": "resumed", "replayed": replayed, "seq": manager.frame_log.seq},
+                            websocket,
+                        )
 
             except WebSocketDisconnect:
                 # Client closed the connection - exit loop and clean up
@@ -101,36 +336,43 @@ async def websocket_signals(
         manager.disconnect(websocket)
 
 
-async def broadcast_new_signal(signal_type: str, signal_data: dict):
-    """Broadcast new signal to all connected VIP users."""
-    from app.core.database import AsyncSessionLocal
+async def broadcast_new_signal(
+    signal_type: str,
+    signal_data: dict,
+    trace: Optional[SignalTrace] = None,
+):
+    """Broadcast new signal to connected VIP users whose filter matches it.
 
+    Connections are admitted only with an active VIP subscription and
+    ``run_revalidation`` closes those whose subscription was cancelled or
+    expired since, so no lookup is done per signal. When a trace is given,
+    the frame carries ``trace_id``, ``source_ts``
+    (Telegram post time) and ``sent_at`` so clients can measure delivery lag.
+    """
     try:
-        async with AsyncSessionLocal() as db:
-            message = {
-                "type": "new_signal",
-                "signal_type": signal_type,
-                "data": signal_data,
-            }
-            await manager.broadcast_to_vip_users(message, db)
+        message = {
+            "type": "new_signal",
+            "signal_type": signal_type,
+            "data": signal_data,
+        }
+        if trace:
+            message.update(trace.frame_fields())
+        await manager.broadcast_signal(signal_type, signal_data, message)
     except Exception as e:
         # Log error but don't crash the application
         print(f"Error broadcasting new signal: {e}")
 
 
 async def broadcast_signal_update(signal_type: str, signal_id: int, updates: dict):
-    """Broadcast signal update to all connected VIP users."""
-    from app.core.database import AsyncSessionLocal
-
+    """Broadcast signal update to connected VIP users subscribed to its type."""
     try:
-        async with AsyncSessionLocal() as db:
-            message = {
-                "type": "signal_update",
-                "signal_type": signal_type,
-                "signal_id": signal_id,
-                "data": updates,
-            }
-            await manager.broadcast_to_vip_users(message, db)
+        message = {
+            "type": "signal_update",
+            "signal_type": signal_type,
+            "signal_id": signal_id,
+            "data": updates,
+        }
+        await manager.broadcast_to_signal_type(signal_type, message)
     except Exception as e:
         # Log error but don't crash the application
         print(f"Error broadcasting signal update: {e}")
@@ -0,0 +1,163 @@
+"""Server-Sent Events stream of signals for clients that cannot use WebSockets.
+
+An SSE stream is registered with the ``ConnectionManager`` like a socket, so
+it gets the same ``new_signal``, ``signal_update`` and ``notification`` frames
+from the same broadcast path, the same filters and the same replay buffer.
+Event ids are ``<epoch>-<seq>``; a reconnecting ``EventSource`` sends the last
+one back in ``Last-Event-ID`` and receives only the missed frames.
+"""
+import asyncio
+from typing import AsyncIterator, Optional
+import orjson
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from app.core.config import settings
+from app.core.metrics import ws_connections_rejected_total
+from app.core.security import decode_token
+from app.services.websocket.manager import SignalFilter, manager
+from app.services.websocket.router import build_snapshot, check_vip, schedule_vip_check
+
+router = APIRouter(tags=["websocket"])
+
+# Frames an SSE client may fall behind by before it is dropped
+SSE_QUEUE_SIZE = 1000
+
+
+class SSEConnection:
+    """Stands in for a WebSocket in the connection manager, queueing frames for the stream."""
+
+    def __init__(self, queue_size: int = SSE_QUEUE_SIZE):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.closed = False
+
+    async def send_text(self, data: str):
+        if self.closed:
+            raise RuntimeError("SSE stream closed")
+        try:
+            self.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            # Too slow to keep up; the manager disconnects it
+            self.closed = True
+            raise RuntimeError("SSE client too slow")
+
+    async def send_bytes(self, data: bytes):
+        raise RuntimeError("SSE streams carry JSON only")
+
+    async def close(self, code: int = 1000, reason: Optional[str] = None):
+        self.closed = True
+        try:
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+
+
+def format_event(data: str) -> str:
+    """One SSE event from an encoded frame; sequenced frames get an id."""
+    message = orjson.loads(data)
+    lines = []
+    if "seq" in message:
+        lines.append(f"id: {manager.frame_log.epoch}-{message['seq']}")
+    lines.append(f"event: {message.get('type', 'message')}")
+    lines.append(f"data: {data}")
+    return "\n".join(lines) + "\n\n"
+
+
+def parse_event_id(event_id: Optional[str]) -> tuple[Optional[str], Optional[int]]:
+    """``(epoch, seq)`` from a Last-Event-ID value, or Nones."""
+    if event_id:
+        epoch, _, seq = event_id.strip().rpartition("-")
+        if epoch and seq.isdigit():
+            return epoch, int(seq)
+    return None, None
+
+
+async def sse_events(
+    connection: SSEConnection,
+    last_event_id: Optional[str] = None,
+    snapshot: bool = True,
+    keepalive_seconds: float = 15,
+) -> AsyncIterator[str]:
+    """Event stream of a registered connection; disconnects it when the client goes away."""
+    try:
+        yield f"retry: {settings.ws_retry_after_seconds * 1000}\n\n"
+        epoch, last_seq = parse_event_id(last_event_id)
+        if last_event_id:
+            await manager.resume(connection, last_seq, epoch, build_snapshot)
+        elif snapshot:
+            await manager.send_personal_message(build_snapshot(manager.filters[connection]), connection)
+
+        while not connection.closed or not connection.queue.empty():
+            try:
+                data = await asyncio.wait_for(connection.queue.get(), keepalive_seconds)
+            except asyncio.TimeoutError:
+                # Comment line: keeps proxies from timing out an idle stream
+                yield ": keepalive\n\n"
+                continue
+            if data is None:
+                break
+            yield format_event(data)
+    finally:
+        manager.disconnect(connection)
+
+
+def _split(value: Optional[str]) -> Optional[list]:
+    return [item.strip() for item in value.split(",") if item.strip()] if value else None
+
+
+@router.get("/sse/signals")
+async def sse_signals(
+    token: str = Query(...),
+    signal_types: Optional[str] = Query(None, description="Comma-separated signal types"),
+    coins: Optional[str] = Query(None, description="Comma-separated coin names"),
+    min_spread: Optional[float] = Query(None),
+    min_profit: Optional[float] = Query(None),
+    snapshot: bool = Query(True),
+    last_event_id: Optional[str] = Header(None),
+):
+    """Server-Sent Events stream of signals and notifications (VIP only).
+
+    Takes the access token as a query parameter, since ``EventSource`` cannot
+    send headers, and the subscription filter as query parameters.
+    """
+    if manager.at_capacity():
+        ws_connections_rejected_total.labels(reason="capacity").inc()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server busy",
+            headers={"Retry-After": str(settings.ws_retry_after_seconds)},
+        )
+
+    payload = decode_token(token)
+    if not payload or payload.get("type") != "access" or not str(payload.get("sub", "")).isdigit():
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+    user_id = int(payload["sub"])
+    # Same admission as /ws/signals: only a vip claim skips the database check
+    vip_claim = payload.get("plan") == "vip"
+    if not vip_claim:
+        plan_status = await check_vip(user_id)
+        if plan_status == "unauthorized":
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+        if plan_status != "vip":
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="VIP subscription required")
+
+    try:
+        signal_filter = SignalFilter.from_message({
+            "signal_types": _split(signal_types),
+            "coins": _split(coins),
+            "min_spread": min_spread,
+            "min_profit": min_profit,
+        })
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+    connection = SSEConnection()
+    await manager.connect(connection, user_id, heartbeat=False)
+    manager.subscribe(connection, signal_filter)
+    if vip_claim:
+        schedule_vip_check(connection, user_id)
+
+    return StreamingResponse(
+        sse_events(connection, last_event_id, snapshot),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,51 @@
+"""Email outbox delivery worker.
+
+Runs in-process next to the API (see ``app.main``) or as a standalone
+process, in which case set ``EMAIL_WORKER_IN_PROCESS=false`` for the API:
+
+    python -m app.tasks.email_worker
+"""
+import asyncio
+from typing import Optional
+from app.core.logging_config import setup_logging, get_logger
+from app.services.notifications.email import email_service
+from app.services.notifications.outbox import EmailOutboxWorker
+
+logger = get_logger(__name__)
+
+
+async def start_email_worker() -> tuple[EmailOutboxWorker, asyncio.Task]:
+    """Start the outbox worker in background."""
+    worker = EmailOutboxWorker()
+    task = asyncio.create_task(worker.run())
+    return worker, task
+
+
+async def stop_email_worker(worker: Optional[EmailOutboxWorker], task: Optional[asyncio.Task]):
+    """Stop the outbox worker and close its SMTP connections."""
+    if worker:
+        worker.stop()
+    if task:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await email_service.close()
+
+
+async def main():
+    """Run the outbox worker as a standalone process."""
+    setup_logging()
+    worker = EmailOutboxWorker()
+    try:
+        await worker.run()
+    finally:
+        await email_service.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.info("Email worker stopped")
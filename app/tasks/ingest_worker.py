@@ -0,0 +1,56 @@
+"""Signal ingestion worker.
+
+Runs in-process next to the API (see ``app.main``) or as a standalone
+process so that parsing and persistence can be scaled separately:
+
+    python -m app.tasks.ingest_worker
+
+A standalone worker has no WebSocket clients or in-memory caches of its
+own; it publishes persisted signals to the API processes (see
+``app.services.signals.events``).
+"""
+import asyncio
+from typing import Optional
+from app.core.logging_config import setup_logging, get_logger
+from app.core.redis_client import close_redis
+from app.services.signals.events import enable_publishing
+from app.services.telegram.stream import IngestStreamConsumer
+
+logger = get_logger(__name__)
+
+
+async def start_ingest_worker() -> tuple[IngestStreamConsumer, asyncio.Task]:
+    """Start the ingestion consumer in background."""
+    consumer = IngestStreamConsumer()
+    task = asyncio.create_task(consumer.run())
+    return consumer, task
+
+
+async def stop_ingest_worker(consumer: Optional[IngestStreamConsumer], task: Optional[asyncio.Task]):
+    """Stop the ingestion consumer."""
+    if consumer:
+        consumer.stop()
+    if task:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+async def main():
+    """Run the ingestion consumer as a standalone process."""
+    setup_logging()
+    enable_publishing()
+    consumer = IngestStreamConsumer()
+    try:
+        await consumer.run()
+    finally:
+        await close_redis()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.info("Ingestion worker stopped")
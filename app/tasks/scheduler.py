@@ -3,6 +3,8 @@ import asyncio
 from datetime import datetime, timedelta
 from app.tasks.market_data import sync_coinmarketcap_task
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.services.signals.rollups import prune_signal_stats
 
 
 async def run_periodic_tasks():
@@ -15,6 +17,13 @@ async def run_periodic_tasks():
         except Exception as e:
             print(f"Error in periodic task: {e}")
 
+        try:
+            # Drop signal stats buckets past their retention
+            async with AsyncSessionLocal() as db:
+                await prune_signal_stats(db)
+        except Exception as e:
+            print(f"Error pruning signal stats: {e}")
+
         # Wait 5 minutes before next sync
         await asyncio.sleep(300)  # 5 minutes
 
@@ -0,0 +1,148 @@
+"""Benchmark: emails per second, connection per email vs the SMTP pool.
+
+Sends signal emails to a local aiosmtpd server three ways: one
+``aiosmtplib.send`` per email in sequence (how notifications were sent
+before the pool), through the pool one at a time, and through the pool with
+concurrent senders. ``--setup-delay-ms`` delays the server's EHLO reply to
+model what a remote provider adds to every new connection (network round
+trips, TLS handshake, AUTH); locally that cost is close to zero.
+
+    python -m benchmarks.bench_email --emails 500 --pool-size 4 --setup-delay-ms 50
+"""
+import argparse
+import asyncio
+import json
+import socket
+import sys
+import time
+from benchmarks.common import configure_environment
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--emails", type=int, default=500, help="Emails sent per mode")
+    parser.add_argument("--pool-size", type=int, default=4, help="Pooled connections / concurrent sends")
+    parser.add_argument("--max-messages", type=int, default=100, help="Messages per pooled connection")
+    parser.add_argument("--setup-delay-ms", type=float, default=0, help="Extra delay per new connection")
+    return parser.parse_args(argv)
+
+
+class SinkHandler:
+    """Accepts every message; slows down connection setup on request."""
+
+    def __init__(self, setup_delay: float):
+        self.setup_delay = setup_delay
+        self.messages = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        session.host_name = hostname
+        if self.setup_delay:
+            await asyncio.sleep(self.setup_delay)
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages += 1
+        return "250 OK"
+
+
+def make_messages(count: int) -> list:
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+    from app.services.notifications.email import email_service
+
+    signal_data = {"spread": 2.5, "position": "long", "mexc_spot_price": 1.01, "mexc_futures_price": 1.035}
+    subject, html, text = email_service.generate_signal_email_html("mexc_spot_futures", "NB", signal_data)
+    messages = []
+    for i in range(count):
+        message = MIMEMultipart("alternative")
+        message["Subject"] = subject
+        message["From"] = "noreply@cryptotracker.com"
+        message["To"] = f"user{i}@example.com"
+        message.attach(MIMEText(text, "plain"))
+        message.attach(MIMEText(html, "html"))
+        messages.append(message)
+    return messages
+
+
+async def send_per_message(messages, port: int) -> int:
+    import aiosmtplib
+
+    for message in messages:
+        await aiosmtplib.send(message, hostname="127.0.0.1", port=port)
+    return len(messages)
+
+
+async def send_pooled(messages, port: int, size: int, max_messages: int, concurrency: int) -> int:
+    from app.services.notifications.smtp_pool import SMTPPool
+
+    pool = SMTPPool("127.0.0.1", port, size=size, max_messages=max_messages)
+    queue = list(reversed(messages))
+
+    async def sender():
+        while queue:
+            await pool.send_message(queue.pop())
+
+    await asyncio.gather(*(sender() for _ in range(concurrency)))
+    await pool.close()
+    return pool.connections_opened
+
+
+async def measure(name: str, run, count: int) -> dict:
+    started = time.perf_counter()
+    connections = await run
+    elapsed = time.perf_counter() - started
+    return {
+        "mode": name,
+        "emails": count,
+        "connections": connections,
+        "seconds": round(elapsed, 3),
+        "emails_per_second": round(count / elapsed, 1),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from aiosmtpd.controller import Controller
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    handler = SinkHandler(args.setup_delay_ms / 1000)
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    messages = make_messages(args.emails)
+    try:
+        results = [
+            await measure("connection_per_email", send_per_message(messages, port), args.emails),
+            await measure(
+                "pooled_sequential",
+                send_pooled(messages, port, args.pool_size, args.max_messages, 1),
+                args.emails,
+            ),
+            await measure(
+                "pooled_concurrent",
+                send_pooled(messages, port, args.pool_size, args.max_messages, args.pool_size),
+                args.emails,
+            ),
+        ]
+    finally:
+        controller.stop()
+    return {
+        "config": {
+            "pool_size": args.pool_size,
+            "max_messages": args.max_messages,
+            "setup_delay_ms": args.setup_delay_ms,
+            "received": handler.messages,
+        },
+        "results": results,
+    }
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    configure_environment()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Benchmark: per-recipient vs render-once signal emails.
+
+Prepares one signal email for N recipients two ways and reports the CPU
+time: rendering the HTML/text bodies and building and serializing the MIME
+message again for every recipient (how signal emails were built before),
+and rendering once with ``RenderedEmail`` so each recipient only adds a
+``To`` header to the shared bytes.
+
+    python -m benchmarks.bench_email_render --recipients 1000
+"""
+import argparse
+import json
+import sys
+import time
+from email.policy import SMTP as SMTP_POLICY
+from benchmarks.common import configure_environment
+
+SIGNAL_DATA = {
+    "mexc_spot_futures": {"spread": 2.5, "position": "LONG", "mexc_spot_price": 1.01, "mexc_futures_price": 1.035},
+    "funding_rate": {"hourly_profit": 0.42},
+    "mexc_dex": {"spread_percent": 3.1, "mexc_price": 0.052, "dex_price": 0.0536},
+}
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--recipients", type=int, default=1000, help="Recipients per signal")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per mode; the best is reported")
+    return parser.parse_args(argv)
+
+
+def per_recipient(signal_type: str, recipients: list) -> int:
+    from app.services.notifications.email import email_service
+
+    total = 0
+    for to_email in recipients:
+        subject, html, text = email_service.generate_signal_email_html(
+            signal_type, "NB", SIGNAL_DATA[signal_type]
+        )
+        message = email_service.build_message(to_email, subject, html, text)
+        total += len(message.as_bytes(policy=SMTP_POLICY))
+    return total
+
+
+def render_once(signal_type: str, recipients: list) -> int:
+    from app.services.notifications.email import email_service
+
+    rendered = email_service.render_signal_email(signal_type, "NB", SIGNAL_DATA[signal_type])
+    return sum(len(rendered.message_bytes(to_email)) for to_email in recipients)
+
+
+def best_of(func, repeat: int, *args) -> tuple[float, int]:
+    timings, size = [], 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings), size
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    configure_environment()
+    recipients = [f"user{i}@example.com" for i in range(args.recipients)]
+
+    report = {"recipients": args.recipients, "signal_types": {}}
+    for signal_type in SIGNAL_DATA:
+        before, before_bytes = best_of(per_recipient, args.repeat, signal_type, recipients)
+        after, after_bytes = best_of(render_once, args.repeat, signal_type, recipients)
+        report["signal_types"][signal_type] = {
+            "per_recipient_ms": round(before * 1000, 2),
+            "render_once_ms": round(after * 1000, 2),
+            "per_recipient_us_each": round(before / args.recipients * 1e6, 2),
+            "render_once_us_each": round(after / args.recipients * 1e6, 2),
+            "speedup": round(before / after, 1),
+            "bytes_per_message": round(after_bytes / args.recipients),
+            "same_size": before_bytes == after_bytes,
+        }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
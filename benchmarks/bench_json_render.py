@@ -0,0 +1,192 @@
+"""Benchmark: stdlib JSONResponse vs orjson FastJSONResponse on the heaviest list endpoints.
+
+Runs the signal and market list endpoints in-process through the ASGI stack,
+alternating the stdlib encoder and ``FastJSONResponse``, checks the bodies
+are identical and reports response times, plus body rendering alone.
+
+    python -m benchmarks.bench_json_render --iterations 300
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from benchmarks.bench_signal_list import make_signals
+from benchmarks.common import configure_environment, percentile, ms
+
+ENDPOINTS = [
+    "/api/v1/signals/funding-rate?limit=100",
+    "/api/v1/signals/mexc-spot-futures?limit=100",
+    "/api/v1/signals/mexc-dex?limit=100",
+    "/api/v1/market/cryptocurrencies?limit=100",
+]
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=2000, help="Signals seeded per type")
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--database-url", default=None, help="Async SQLAlchemy URL (default: temporary SQLite)")
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    import httpx
+    from fastapi import FastAPI
+    from fastapi.responses import JSONResponse
+    from app.core.database import AsyncSessionLocal, Base, engine, get_db
+    from app.core.dependencies import get_current_user, require_vip
+    from app.core.responses import FastJSONResponse
+    from app.models.signal import (
+        SignalMEXCSpotFutures,
+        SignalFundingRate,
+        SignalMEXCDEX,
+        CoinMarketCapData,
+    )
+    from app.models.user import User
+    from app.services.market.router import router as market_router
+    from app.services.signals import projection
+    from app.services.signals.router import router as signals_router
+
+    class StdlibJSONResponse(JSONResponse):
+        """JSONResponse that encodes Decimal and datetime with json.dumps."""
+
+        def render(self, content) -> bytes:
+            def default(value):
+                if isinstance(value, Decimal):
+                    return str(value)
+                if isinstance(value, datetime):
+                    text = value.isoformat()
+                    return text[:-6] + "Z" if text.endswith("+00:00") else text
+                raise TypeError(type(value).__name__)
+
+            return json.dumps(
+                content, default=default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+            ).encode("utf-8")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        models = {
+            "mexc_spot_futures": SignalMEXCSpotFutures,
+            "funding_rate": SignalFundingRate,
+            "mexc_dex": SignalMEXCDEX,
+        }
+        db.add_all(make_signals(models, args.rows))
+        expires_at = datetime.utcnow() + timedelta(days=1)
+        for rank in range(1, 101):
+            db.add(CoinMarketCapData(
+                crypto_id=rank,
+                name=f"Coin {rank}",
+                symbol=f"C{rank}",
+                rank=rank,
+                price_usd=Decimal(str(round(random.uniform(0.01, 50000), 8))),
+                change_24h=Decimal(str(round(random.uniform(-20, 20), 4))),
+                change_7d=Decimal(str(round(random.uniform(-40, 40), 4))),
+                market_cap_usd=Decimal(str(round(random.uniform(1e6, 1e12), 2))),
+                volume_24h_usd=Decimal(str(round(random.uniform(1e5, 1e10), 2))),
+                market_cap_dominance=Decimal(str(round(random.uniform(0, 50), 4))),
+                expires_at=expires_at,
+            ))
+        await db.commit()
+
+    user = User(id=1, email="bench@example.com", password_hash="x", is_active=True)
+
+    def build_app(response_class) -> FastAPI:
+        app = FastAPI(default_response_class=response_class)
+        app.include_router(signals_router)
+        app.include_router(market_router)
+        app.dependency_overrides[require_vip] = lambda: user
+        app.dependency_overrides[get_current_user] = lambda: user
+        return app
+
+    async def measure(url: str) -> tuple[dict, dict]:
+        """Time both variants on alternating requests so drift affects them equally."""
+        clients = {
+            name: httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=build_app(response_class)),
+                base_url="http://bench",
+            )
+            for name, response_class in variants.items()
+        }
+        bodies = {name: None for name in variants}
+        timings = {name: [] for name in variants}
+        for iteration in range(args.iterations + 1):
+            for name, response_class in variants.items():
+                # Signal lists build their response directly; switch their class too.
+                projection.FastJSONResponse = response_class
+                started = time.perf_counter()
+                response = await clients[name].get(url)
+                elapsed = time.perf_counter() - started
+                assert response.status_code == 200
+                if iteration == 0:
+                    bodies[name] = response.content
+                else:
+                    timings[name].append(elapsed)
+        projection.FastJSONResponse = FastJSONResponse
+        for client in clients.values():
+            await client.aclose()
+        return bodies, timings
+
+    def measure_render(content) -> dict:
+        """Time body rendering alone, on raw rows with Decimal and datetime values."""
+        timings = {}
+        for name, response_class in variants.items():
+            values = []
+            for _ in range(args.iterations):
+                started = time.perf_counter()
+                response_class(content)
+                values.append(time.perf_counter() - started)
+            timings[name] = values
+        return timings
+
+    variants = {"stdlib": StdlibJSONResponse, "orjson": FastJSONResponse}
+    report = {
+        "database": engine.url.get_backend_name(),
+        "iterations": args.iterations,
+        "end_to_end": {},
+        "render_only": {},
+    }
+    for url in ENDPOINTS:
+        bodies, timings = await measure(url)
+        report["end_to_end"][url] = {
+            "identical_output": bodies["stdlib"] == bodies["orjson"],
+            "response_bytes": len(bodies["orjson"]),
+            **{
+                f"{name}_ms": {"p50": ms(percentile(values, 50)), "p99": ms(percentile(values, 99))}
+                for name, values in timings.items()
+            },
+            "speedup_p50": round(percentile(timings["stdlib"], 50) / percentile(timings["orjson"], 50), 2),
+        }
+
+    async with AsyncSessionLocal() as db:
+        for name, model in models.items():
+            rows, total = await projection.fetch_signal_rows(db, model, [], 100, 0)
+            content = {"data": rows, "pagination": {"total": total, "limit": 100, "offset": 0}}
+            timings = measure_render(content)
+            report["render_only"][name] = {
+                **{
+                    f"{variant}_ms": {"p50": ms(percentile(values, 50))}
+                    for variant, values in timings.items()
+                },
+                "speedup_p50": round(percentile(timings["stdlib"], 50) / percentile(timings["orjson"], 50), 2),
+            }
+
+    await engine.dispose()
+    return report
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure_environment(args.database_url)
+    report = asyncio.run(run(args))
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
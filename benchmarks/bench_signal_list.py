@@ -0,0 +1,169 @@
+"""Benchmark: ORM hydration + Pydantic vs column projection for signal lists.
+
+Seeds a database with signals and times one list page (count + page query +
+serialization) through the previous ORM path and the projection fast path,
+checking that both produce identical bytes.
+
+    python -m benchmarks.bench_signal_list --limit 100 --iterations 200
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from benchmarks.common import configure_environment, percentile, ms
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=5000, help="Signals seeded per type")
+    parser.add_argument("--limit", type=int, default=100, help="Page size")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--database-url", default=None, help="Async SQLAlchemy URL (default: temporary SQLite)")
+    return parser.parse_args(argv)
+
+
+def _decimal(low: float, high: float, places: int) -> Decimal:
+    return Decimal(str(round(random.uniform(low, high), places)))
+
+
+def make_signals(models, count: int) -> list:
+    """Generate realistic signal rows for every model."""
+    random.seed(7)
+    start = datetime(2025, 12, 1, tzinfo=timezone.utc)
+    coins = ["PIPPIN", "NB", "YEE", "GOAT", "ACT", "PNUT", "AIXBT", "VIRTUAL"]
+    signals = []
+    for i in range(count):
+        created_at = start + timedelta(seconds=30 * i)
+        coin = random.choice(coins)
+        signals.append(models["mexc_spot_futures"](
+            coin_name=coin,
+            position=random.choice(["LONG", "SHORT"]),
+            spread=_decimal(1, 15, 2),
+            mexc_spot_price=_decimal(0.001, 2, 8),
+            mexc_futures_price=_decimal(0.001, 2, 8),
+            spot_url=f"https://www.mexc.com/exchange/{coin}_USDT",
+            futures_url=f"https://futures.mexc.com/exchange/{coin}_USDT",
+            dex_url=f"https://dexscreener.com/bsc/0x{random.getrandbits(160):040x}",
+            created_at=created_at,
+        ))
+        funding = {}
+        for exchange in ("gate", "binance", "mexc", "ourbit", "bitget", "bybit"):
+            funding[f"{exchange}_rate"] = _decimal(-0.3, 0.1, 4)
+            funding[f"{exchange}_url"] = f"https://{exchange}.example.com/futures/{coin}_USDT"
+            funding[f"{exchange}_interval"] = random.choice(["1h", "4h", "8h"])
+            funding[f"{exchange}_position"] = random.choice(["LONG", "SHORT", None])
+        signals.append(models["funding_rate"](
+            coin_name=coin, hourly_profit=_decimal(0, 0.5, 4), created_at=created_at, **funding
+        ))
+        signals.append(models["mexc_dex"](
+            coin_name=coin,
+            spread_percent=_decimal(3, 20, 2),
+            mexc_price=_decimal(0.001, 1, 8),
+            mexc_url=f"https://futures.mexc.com/exchange/{coin}_USDT",
+            dex_price=_decimal(0.001, 1, 8),
+            dexscreener_url=f"https://dexscreener.com/ethereum/0x{random.getrandbits(160):040x}",
+            max_size_usd=_decimal(10, 5000, 2),
+            token_contract=f"0x{random.getrandbits(160):040x}",
+            token_chain="ETH",
+            created_at=created_at,
+        ))
+    return signals
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from sqlalchemy import select, func, desc
+    from app.core.database import AsyncSessionLocal, Base, engine
+    from app.models.signal import SignalMEXCSpotFutures, SignalFundingRate, SignalMEXCDEX
+    from app.schemas.signal import (
+        MEXCSpotFuturesSignalResponse,
+        FundingRateSignalResponse,
+        MEXCDEXSignalResponse,
+        SignalListResponse,
+    )
+    from app.services.signals.projection import signal_list_response
+
+    cases = {
+        "mexc_spot_futures": (SignalMEXCSpotFutures, MEXCSpotFuturesSignalResponse),
+        "funding_rate": (SignalFundingRate, FundingRateSignalResponse),
+        "mexc_dex": (SignalMEXCDEX, MEXCDEXSignalResponse),
+    }
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        db.add_all(make_signals({name: case[0] for name, case in cases.items()}, args.rows))
+        await db.commit()
+
+    async def orm_path(model, schema) -> bytes:
+        async with AsyncSessionLocal() as db:
+            query = select(model).order_by(desc(model.created_at))
+            total = (await db.execute(select(func.count()).select_from(query.subquery()))).scalar() or 0
+            items = (await db.execute(query.offset(0).limit(args.limit))).scalars().all()
+            response = SignalListResponse(
+                data=[
+                    schema(**{name: getattr(item, name) for name in schema.model_fields})
+                    for item in items
+                ],
+                pagination={"total": total, "limit": args.limit, "offset": 0},
+            )
+            return json.dumps(
+                response.model_dump(mode="json"),
+                ensure_ascii=False,
+                allow_nan=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+
+    async def projection_path(model, schema) -> bytes:
+        async with AsyncSessionLocal() as db:
+            response = await signal_list_response(db, model, [], args.limit, 0)
+            return response.body
+
+    async def measure(path, model, schema) -> list:
+        await path(model, schema)  # warm-up
+        timings = []
+        for _ in range(args.iterations):
+            started = time.perf_counter()
+            await path(model, schema)
+            timings.append(time.perf_counter() - started)
+        return timings
+
+    report = {
+        "database": engine.url.get_backend_name(),
+        "rows_per_type": args.rows,
+        "limit": args.limit,
+        "iterations": args.iterations,
+        "results": {},
+    }
+    for name, (model, schema) in cases.items():
+        orm_body = await orm_path(model, schema)
+        fast_body = await projection_path(model, schema)
+        orm = await measure(orm_path, model, schema)
+        fast = await measure(projection_path, model, schema)
+        report["results"][name] = {
+            "fields": len(schema.model_fields),
+            "identical_output": orm_body == fast_body,
+            "response_bytes": len(fast_body),
+            "orm_ms": {"p50": ms(percentile(orm, 50)), "p99": ms(percentile(orm, 99))},
+            "projection_ms": {"p50": ms(percentile(fast, 50)), "p99": ms(percentile(fast, 99))},
+            "speedup_p50": round(percentile(orm, 50) / percentile(fast, 50), 2),
+        }
+
+    await engine.dispose()
+    return report
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure_environment(args.database_url)
+    report = asyncio.run(run(args))
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Benchmark: JSON vs MessagePack WebSocket frames, with and without permessage-deflate.
+
+Builds realistic ``new_signal`` frames (and coalesced batches of them) from
+generated signals of all three types, encodes them the way the connection
+manager does and reports frame size and encode CPU per encoding. Compression
+is simulated like permessage-deflate (raw deflate, sync flush per message),
+with and without context takeover.
+
+    python -m benchmarks.bench_ws_encoding --frames 3000
+"""
+import argparse
+import json
+import sys
+import time
+import zlib
+from datetime import datetime
+from benchmarks.bench_signal_list import make_signals
+from benchmarks.common import configure_environment, percentile
+
+ENCODINGS = ("json", "msgpack")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--frames", type=int, default=3000, help="new_signal frames to encode")
+    parser.add_argument("--batch", type=int, default=8, help="Frames per coalesced batch")
+    parser.add_argument("--level", type=int, default=6, help="zlib compression level")
+    return parser.parse_args(argv)
+
+
+def deflate_sizes(payloads, level: int, context_takeover: bool) -> tuple[list, float]:
+    """Compressed size per message and total seconds, as permessage-deflate would send them."""
+    sizes = []
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    started = time.perf_counter()
+    for payload in payloads:
+        if not context_takeover:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        data = payload.encode() if isinstance(payload, str) else payload
+        compressed = compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        # The empty stored block ending every flushed message is not sent
+        sizes.append(len(compressed) - 4)
+    return sizes, time.perf_counter() - started
+
+
+def measure(messages, encoding: str, level: int) -> dict:
+    from app.services.websocket.encoding import encode
+
+    started = time.perf_counter()
+    payloads = [encode(message, encoding) for message in messages]
+    encode_seconds = time.perf_counter() - started
+    sizes = [len(payload.encode() if isinstance(payload, str) else payload) for payload in payloads]
+
+    report = {
+        "frames": len(payloads),
+        "bytes_mean": round(sum(sizes) / len(sizes), 1),
+        "bytes_p50": percentile(sizes, 50),
+        "encode_us_per_frame": round(encode_seconds / len(payloads) * 1e6, 2),
+    }
+    for name, takeover in (("deflate", True), ("deflate_no_context", False)):
+        compressed, seconds = deflate_sizes(payloads, level, takeover)
+        report[name] = {
+            "bytes_mean": round(sum(compressed) / len(compressed), 1),
+            "ratio": round(sum(compressed) / sum(sizes), 3),
+            "compress_us_per_frame": round(seconds / len(payloads) * 1e6, 2),
+            # Frames that come out larger than they went in
+            "frames_grown": sum(1 for raw, packed in zip(sizes, compressed) if packed >= raw),
+        }
+    return report
+
+
+def make_payloads(count: int) -> list:
+    """Generated signals of all three types as ``(signal_type, payload)``, as broadcast."""
+    from app.models.signal import SignalMEXCSpotFutures, SignalFundingRate, SignalMEXCDEX
+    from app.services.signals.latest import signal_payload
+
+    models = {
+        "mexc_spot_futures": SignalMEXCSpotFutures,
+        "funding_rate": SignalFundingRate,
+        "mexc_dex": SignalMEXCDEX,
+    }
+    type_by_model = {model: signal_type for signal_type, model in models.items()}
+    payloads = []
+    for signal_id, row in enumerate(make_signals(models, max(1, count // 3)), start=1):
+        row.id = signal_id
+        # Column defaults the database would have filled in
+        for column in row.__table__.columns:
+            if getattr(row, column.key) is None and column.default is not None and column.default.is_scalar:
+                setattr(row, column.key, column.default.arg)
+        signal_type = type_by_model[type(row)]
+        payloads.append((signal_type, signal_payload(signal_type, row)))
+    return payloads
+
+
+def run(args: argparse.Namespace) -> dict:
+    frames = []
+    for seq, (signal_type, payload) in enumerate(make_payloads(args.frames), start=1):
+        created_at = datetime.fromisoformat(payload["created_at"].replace("Z", "+00:00")).timestamp()
+        frames.append({
+            "type": "new_signal",
+            "signal_type": signal_type,
+            "data": payload,
+            "trace_id": f"{seq:032x}",
+            "source_ts": created_at,
+            "sent_at": created_at + 0.4,
+            "seq": seq,
+        })
+    batches = [
+        {"type": "batch", "messages": frames[i:i + args.batch]}
+        for i in range(0, len(frames), args.batch)
+    ]
+
+    return {
+        "frames": {encoding: measure(frames, encoding, args.level) for encoding in ENCODINGS},
+        f"batches_of_{args.batch}": {encoding: measure(batches, encoding, args.level) for encoding in ENCODINGS},
+    }
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    configure_environment()
+    print(json.dumps(run(args), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+"""Shared helpers for benchmarks and load tools."""
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+
+def configure_environment(database_url: Optional[str] = None, redis_url: Optional[str] = None) -> str:
+    """Point application settings at a benchmark database before app modules are imported.
+
+    Without a URL a temporary SQLite database is used.
+    """
+    if not database_url:
+        path = Path(tempfile.mkdtemp(prefix="bench-")) / "bench.db"
+        database_url = f"sqlite+aiosqlite:///{path}"
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("DATABASE_URL_SYNC", database_url)
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    os.environ["DEBUG"] = "false"
+    if redis_url:
+        os.environ["REDIS_URL"] = redis_url
+    return database_url
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def ms(value: Optional[float]) -> Optional[float]:
+    """Seconds to milliseconds, rounded for reports."""
+    return round(value * 1000, 3) if value is not None else None
@@ -0,0 +1,307 @@
+"""WebSocket capacity load test for /ws/signals.
+
+Starts the WebSocket router under uvicorn in a child process (temporary SQLite
+database with VIP users), opens authenticated connections in steps, injects
+signals through ``broadcast_new_signal`` via a benchmark-only endpoint of that
+process and writes a JSON report per step: connect time, delivery latency
+percentiles, server memory per connection and server CPU per signal.
+
+    python -m benchmarks.ws_load --steps 100,500,1000 --signals 50 --output ws_load.json
+
+Clients all run in this process, so at high connection counts their own
+parsing adds to the measured latency; ``client_cpu_seconds`` shows how busy
+they were. Reports from different releases can be diffed as is.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+from benchmarks.common import configure_environment, percentile, ms
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--steps", default="100,500,1000", help="Comma-separated connection counts")
+    parser.add_argument("--signals", type=int, default=50, help="Signals broadcast per step")
+    parser.add_argument("--interval-ms", type=float, default=20, help="Pause between injected signals")
+    parser.add_argument("--encoding", choices=["json", "msgpack"], default="json")
+    parser.add_argument("--connect-concurrency", type=int, default=50, help="Connections opened at once")
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds to wait for deliveries per step")
+    parser.add_argument("--database-url", default=None, help="Async SQLAlchemy URL (default: temporary SQLite)")
+    parser.add_argument("--output", type=Path, default=None, help="Write the report as JSON")
+    # Internal: run the server side of the test
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=0, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def rss_bytes() -> int:
+    """Resident memory of this process."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def cpu_seconds() -> float:
+    times = os.times()
+    return times.user + times.system
+
+
+def serve(port: int):
+    """Server side: the WebSocket router plus stats and injection endpoints."""
+    import uvicorn
+    from contextlib import asynccontextmanager
+    from fastapi import FastAPI
+    from app.core.config import settings
+    from app.services.websocket.manager import manager
+    from app.services.websocket.router import router, broadcast_new_signal
+    from benchmarks.bench_ws_encoding import make_payloads
+
+    payloads = make_payloads(300)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        heartbeat_task = None
+        if settings.ws_heartbeat_interval_seconds > 0:
+            heartbeat_task = asyncio.create_task(manager.run_heartbeats())
+        yield
+        if heartbeat_task:
+            heartbeat_task.cancel()
+
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(router)
+
+    @app.get("/_bench/stats")
+    async def stats():
+        return {
+            "connections": len(manager.websocket_to_user),
+            "rss_bytes": rss_bytes(),
+            "cpu_seconds": cpu_seconds(),
+        }
+
+    @app.post("/_bench/broadcast")
+    async def broadcast(count: int, interval_ms: float = 0):
+        fanout = []
+        cpu_started = cpu_seconds()
+        for i in range(count):
+            signal_type, payload = payloads[i % len(payloads)]
+            data = dict(payload, bench_ts=time.time())
+            started = time.perf_counter()
+            await broadcast_new_signal(signal_type, data)
+            fanout.append(time.perf_counter() - started)
+            if interval_ms:
+                await asyncio.sleep(interval_ms / 1000)
+        return {"fanout_seconds": fanout, "cpu_seconds": cpu_seconds() - cpu_started}
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+class LoadClient:
+    """One WebSocket connection that records signal delivery latency."""
+
+    def __init__(self, url: str, encoding: str):
+        self.url = url
+        self.encoding = encoding
+        self.latencies: List[float] = []
+        self.connect_seconds: Optional[float] = None
+        self.connection = None
+        self.task: Optional[asyncio.Task] = None
+
+    async def open(self):
+        import websockets
+
+        started = time.perf_counter()
+        self.connection = await websockets.connect(self.url, max_size=None, ping_interval=None)
+        greeting = self.decode(await self.connection.recv())
+        if greeting.get("type") != "connected":
+            raise RuntimeError(f"Unexpected greeting: {greeting}")
+        self.connect_seconds = time.perf_counter() - started
+        self.task = asyncio.create_task(self.receive())
+
+    def decode(self, frame) -> dict:
+        if isinstance(frame, bytes):
+            import msgpack
+
+            return msgpack.unpackb(frame)
+        return json.loads(frame)
+
+    async def receive(self):
+        async for frame in self.connection:
+            received_at = time.time()
+            message = self.decode(frame)
+            if message.get("type") == "new_signal":
+                sent_at = message["data"].get("bench_ts")
+                if sent_at:
+                    self.latencies.append(received_at - sent_at)
+            elif message.get("type") == "ping":
+                await self.connection.send(json.dumps({"type": "pong"}))
+
+    async def close(self):
+        if self.task:
+            self.task.cancel()
+        if self.connection:
+            await self.connection.close()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def create_users(count: int) -> List[str]:
+    """VIP users in the benchmark database and an access token for each."""
+    from app.core.database import AsyncSessionLocal, Base, engine
+    from app.core.security import create_access_token
+    from app.models.user import User, Subscription
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        run_tag = int(time.time())
+        users = [User(email=f"ws-load-{run_tag}-{i}@example.com", password_hash="x") for i in range(count)]
+        db.add_all(users)
+        await db.flush()
+        db.add_all(Subscription(user_id=user.id, plan="vip", status="active") for user in users)
+        await db.commit()
+        tokens = [
+            create_access_token({"sub": str(user.id), "email": user.email, "plan": "vip"})
+            for user in users
+        ]
+    await engine.dispose()
+    return tokens
+
+
+async def wait_for_server(http, process: subprocess.Popen, deadline: float):
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("Benchmark server exited")
+        try:
+            response = await http.get("/_bench/stats")
+            if response.status_code == 200:
+                return response.json()
+        except Exception:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("Benchmark server did not start")
+
+
+async def run(args: argparse.Namespace) -> dict:
+    import httpx
+
+    steps = sorted({int(step) for step in args.steps.split(",") if step.strip()})
+    tokens = await create_users(max(steps))
+
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.ws_load", "--serve", "--port", str(port),
+         "--database-url", args.database_url],
+        env=os.environ.copy(),
+    )
+    clients: List[LoadClient] = []
+    results = []
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=None) as http:
+            baseline = await wait_for_server(http, process, time.time() + 60)
+            semaphore = asyncio.Semaphore(args.connect_concurrency)
+
+            async def open_client(token: str) -> LoadClient:
+                url = f"ws://127.0.0.1:{port}/ws/signals?token={token}&encoding={args.encoding}"
+                client = LoadClient(url, args.encoding)
+                async with semaphore:
+                    await client.open()
+                return client
+
+            for step in steps:
+                new_clients = await asyncio.gather(*(open_client(token) for token in tokens[len(clients):step]))
+                clients.extend(new_clients)
+                await asyncio.sleep(1)
+                connected = (await http.get("/_bench/stats")).json()
+
+                for client in clients:
+                    client.latencies = []
+                client_cpu = cpu_seconds()
+                injected = (await http.post(
+                    "/_bench/broadcast", params={"count": args.signals, "interval_ms": args.interval_ms}
+                )).json()
+
+                expected = step * args.signals
+                deadline = time.time() + args.timeout
+                while time.time() < deadline and sum(len(client.latencies) for client in clients) < expected:
+                    await asyncio.sleep(0.05)
+                client_cpu = cpu_seconds() - client_cpu
+
+                latencies = [value for client in clients for value in client.latencies]
+                connect_times = [client.connect_seconds for client in new_clients]
+                fanout = injected["fanout_seconds"]
+                memory = connected["rss_bytes"] - baseline["rss_bytes"]
+                results.append({
+                    "connections": connected["connections"],
+                    "connect_ms": {
+                        "p50": ms(percentile(connect_times, 50)),
+                        "p99": ms(percentile(connect_times, 99)),
+                    },
+                    "server_rss_mb": round(connected["rss_bytes"] / 2 ** 20, 1),
+                    "rss_per_connection_kb": round(memory / step / 1024, 1),
+                    "delivered": len(latencies),
+                    "expected": expected,
+                    "delivery_latency_ms": {
+                        "p50": ms(percentile(latencies, 50)),
+                        "p95": ms(percentile(latencies, 95)),
+                        "p99": ms(percentile(latencies, 99)),
+                        "max": ms(max(latencies) if latencies else None),
+                    },
+                    "fanout_ms_per_signal": {
+                        "p50": ms(percentile(fanout, 50)),
+                        "p99": ms(percentile(fanout, 99)),
+                    },
+                    "server_cpu_ms_per_signal": round(injected["cpu_seconds"] / args.signals * 1000, 3),
+                    "client_cpu_seconds": round(client_cpu, 3),
+                })
+                print(f"{step} connections: {json.dumps(results[-1])}", file=sys.stderr)
+    finally:
+        await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
+        process.terminate()
+        process.wait(timeout=10)
+
+    return {
+        "config": {
+            "signals_per_step": args.signals,
+            "interval_ms": args.interval_ms,
+            "encoding": args.encoding,
+            "python": sys.version.split()[0],
+        },
+        "baseline_rss_mb": round(baseline["rss_bytes"] / 2 ** 20, 1),
+        "steps": results,
+    }
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    args.database_url = configure_environment(args.database_url)
+    if args.serve:
+        serve(args.port)
+        return 0
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,10 @@
 """Pytest configuration and fixtures."""
+import json
+import msgpack
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from app.core.database import Base
 from app.main import app
 
 
@@ -11,4 +15,54 @@ async def client():
         yield ac
 
 
+@pytest.fixture
+async def db():
+    """In-memory SQLite session with all tables created."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+class SessionFactory:
+    """Stands in for AsyncSessionLocal, handing out the test session."""
+
+    def __init__(self, session):
+        self.session = session
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self.session
+
+    async def __aexit__(self, *exc_info):
+        pass
+
 
+class FakeWebSocket:
+    """Records decoded frames, whether each was binary, and close calls."""
+
+    def __init__(self):
+        self.frames = []
+        self.binary = []
+        self.closed = None
+
+    async def send_text(self, data: str):
+        self.frames.append(json.loads(data))
+        self.binary.append(False)
+
+    async def send_bytes(self, data: bytes):
+        self.frames.append(msgpack.unpackb(data))
+        self.binary.append(True)
+
+    async def close(self, code: int = 1000, reason: str = None):
+        self.closed = code
+
+
+@pytest.fixture
+def fake_websocket():
+    """Factory for fake WebSocket connections."""
+    return FakeWebSocket
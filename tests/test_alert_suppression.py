@@ -0,0 +1,64 @@
+"""Tests for alert suppression windows."""
+import asyncio
+import pytest
+from app.services.notifications.suppression import (
+    AlertSuppressor,
+    MemorySuppressionBackend,
+    RedisSuppressionBackend,
+    is_material_change,
+)
+
+
+class TestAlertSuppression:
+    """Tests for global and per-user suppression."""
+
+    def test_material_change(self):
+        """Test relative change against the threshold."""
+        assert is_material_change(10.0, 12.0, 20.0)
+        assert not is_material_change(10.0, 11.0, 20.0)
+        assert not is_material_change(10.0, None, 20.0)
+        assert is_material_change(0.0, 1.0, 20.0)
+
+    async def test_repeat_suppressed_until_material_change(self):
+        """Test flicker is suppressed and the reference value stays put."""
+        suppressor = AlertSuppressor(MemorySuppressionBackend(), window_seconds=300, min_change_percent=20)
+        assert await suppressor.allow_signal("mexc_dex", "NB", 10.0)
+        assert not await suppressor.allow_signal("mexc_dex", "NB", 11.0)
+        # 11.5 is +15% from 11 but +15% from the notified 10 as well; 12.5 is +25% from 10
+        assert not await suppressor.allow_signal("mexc_dex", "NB", 11.5)
+        assert await suppressor.allow_signal("mexc_dex", "NB", 12.5)
+        # Other coins are independent
+        assert await suppressor.allow_signal("mexc_dex", "YEE", 10.0)
+
+    async def test_window_expiry(self):
+        """Test a signal notifies again once the window has passed."""
+        suppressor = AlertSuppressor(MemorySuppressionBackend(), window_seconds=0.01, min_change_percent=20)
+        assert await suppressor.allow_signal("mexc_dex", "NB", 10.0)
+        await asyncio.sleep(0.02)
+        assert await suppressor.allow_signal("mexc_dex", "NB", 10.0)
+
+    async def test_disabled_window(self):
+        """Test a zero global window lets everything through."""
+        suppressor = AlertSuppressor(MemorySuppressionBackend(), window_seconds=0)
+        assert await suppressor.allow_signal("mexc_dex", "NB", 10.0)
+        assert await suppressor.allow_signal("mexc_dex", "NB", 10.0)
+
+    async def test_per_user_rules(self):
+        """Test users with their own windows are checked independently."""
+        suppressor = AlertSuppressor(MemorySuppressionBackend(), window_seconds=300, min_change_percent=20)
+        rules = {1: (600, 20.0), 2: (600, 50.0)}
+        assert await suppressor.allow_users("mexc_dex", "NB", 10.0, rules) == {1, 2}
+        assert await suppressor.allow_users("mexc_dex", "NB", 13.0, rules) == {1}
+
+    async def test_redis_backend(self, monkeypatch):
+        """Test the Redis script matches the in-memory behaviour."""
+        pytest.importorskip("lupa")
+        import fakeredis.aioredis
+        from app.core import redis_client
+
+        monkeypatch.setattr(redis_client, "redis_client", fakeredis.aioredis.FakeRedis(decode_responses=True))
+        suppressor = AlertSuppressor(RedisSuppressionBackend(), window_seconds=300, min_change_percent=20)
+        assert await suppressor.allow_signal("mexc_dex", "NB", 10.0)
+        assert not await suppressor.allow_signal("mexc_dex", "NB", 11.0)
+        assert await suppressor.allow_signal("mexc_dex", "NB", 12.5)
+        assert not await suppressor.allow_signal("mexc_dex", "NB", None)
@@ -0,0 +1,107 @@
+"""Tests for the signal backtesting engine."""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+import numpy as np
+import pytest
+from app.models.signal import SignalMEXCDEX
+from app.services.analytics.backtest import record_signal_prices, run_backtest, simulate, summarize
+
+T0 = 1_700_000_000.0
+
+
+def series(*points):
+    """(minutes after T0, price) pairs as a price series."""
+    return np.array([T0 + minutes * 60 for minutes, _ in points]), np.array([price for _, price in points])
+
+
+class TestBacktest:
+    """Tests for trade simulation and statistics."""
+
+    def test_convergence_exit(self):
+        """Test a trade exits when the spread closes and earns the convergence."""
+        # A at 100, B at 110: long A, short B; B falls to 100.2 after 10 minutes
+        trades = simulate(
+            np.array(["NB"], dtype=object), np.array([T0]), np.array([100.0]), np.array([110.0]),
+            prices_a={"NB": series((0, 100.0))},
+            prices_b={"NB": series((0, 110.0), (10, 100.2))},
+            hold_minutes=60, exit_spread=0.5, fee_bps=0, max_staleness_minutes=60,
+        )
+        assert trades["traded"][0]
+        assert trades["exit_step"][0] == 10
+        assert trades["reason"][0] == 0
+        assert np.isclose(trades["pnl"][0], (1 - 100.2 / 110) * 100)
+
+    def test_stop_loss_and_timeout(self):
+        """Test stop-loss fires on divergence and timeout exits at the last price."""
+        trades = simulate(
+            np.array(["NB", "YEE"], dtype=object), np.array([T0, T0]),
+            np.array([100.0, 100.0]), np.array([110.0, 110.0]),
+            prices_a={"NB": series((0, 100.0)), "YEE": series((0, 100.0))},
+            prices_b={"NB": series((0, 110.0), (5, 125.0)), "YEE": series((0, 110.0), (30, 109.0))},
+            hold_minutes=30, exit_spread=0.5, stop_loss=5.0, fee_bps=10, max_staleness_minutes=60,
+        )
+        assert list(trades["reason"]) == [2, 3]
+        assert list(trades["exit_step"]) == [5, 30]
+
+        summary = summarize(trades)
+        assert summary["trades"] == 2
+        assert summary["exit_reasons"]["stop_loss"] == 1
+        assert summary["win_rate"] == 0.5
+
+    def test_stale_prices_are_not_carried_forward(self):
+        """Test a price older than max_staleness_minutes is not used for an exit."""
+        trades = simulate(
+            np.array(["NB"], dtype=object), np.array([T0]), np.array([100.0]), np.array([110.0]),
+            prices_a={"NB": series((0, 100.0))},
+            prices_b={"NB": series((0, 110.0), (10, 100.2))},
+            hold_minutes=60, exit_spread=0.5, fee_bps=0,
+        )
+        # Leg A was last seen at entry: from minute 6 on the path has no price
+        assert trades["reason"][0] == 3
+        assert trades["exit_step"][0] == 5
+
+    def test_no_price_data_is_skipped(self):
+        """Test signals without later prices are not traded."""
+        trades = simulate(
+            np.array(["NB"], dtype=object), np.array([T0]), np.array([100.0]), np.array([110.0]),
+            prices_a={}, prices_b={}, hold_minutes=30,
+        )
+        assert summarize(trades) == {"signals": 1, "trades": 0, "skipped_no_data": 1}
+
+    async def test_backtest_from_recorded_prices(self, db):
+        """Test prices recorded from signals feed later backtests."""
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for minutes, dex_price in ((0, "1.10"), (20, "1.002")):
+            signal = SignalMEXCDEX(
+                coin_name="NB", spread_percent=Decimal("10"), mexc_price=Decimal("1.00"),
+                dex_price=Decimal(dex_price), created_at=start + timedelta(minutes=minutes),
+            )
+            db.add(signal)
+            await db.flush()
+            record_signal_prices(db, "mexc_dex", signal)
+        await db.commit()
+
+        report = await run_backtest(
+            db, "mexc_dex", since=start, until=start + timedelta(minutes=1),
+            hold_minutes=60, fee_bps=0,
+        )
+        assert report["price_source"]["kind"] == "signal_observations"
+        summary = report["summary"]
+        assert summary["trades"] == 1
+        assert summary["exit_reasons"]["converged"] == 1
+        assert summary["avg_holding_minutes"] == 20
+
+    async def test_too_many_signals_rejected(self, db):
+        """Test a backtest over more than max_signals signals is refused, not truncated."""
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for minutes in (0, 1):
+            db.add(SignalMEXCDEX(
+                coin_name="NB", spread_percent=Decimal("10"), mexc_price=Decimal("1.00"),
+                dex_price=Decimal("1.10"), created_at=start + timedelta(minutes=minutes),
+            ))
+        await db.commit()
+
+        with pytest.raises(ValueError):
+            await run_backtest(db, "mexc_dex", since=start, until=start + timedelta(minutes=5), max_signals=1)
+        report = await run_backtest(db, "mexc_dex", since=start, until=start + timedelta(minutes=5), max_signals=2)
+        assert report["summary"]["signals"] == 2
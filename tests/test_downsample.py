@@ -0,0 +1,77 @@
+"""Tests for signal history downsampling."""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from app.core.config import settings
+from app.models.signal import SignalFundingRate
+from app.services.signals.downsample import bucket_average, lttb
+from app.services.signals.history import fetch_signal_history
+from app.services.signals.rollups import minute_bucket, record_signal_stats
+
+
+class TestDownsample:
+    """Tests for bucket averages and LTTB."""
+
+    def test_bucket_average(self):
+        """Test points are averaged per time bucket."""
+        points = [(0, 1.0), (1, 3.0), (5, 10.0), (9, 20.0)]
+        assert bucket_average(points, start=0, end=10, count=2) == [(0.5, 2.0), (7.0, 15.0)]
+
+    def test_lttb_keeps_ends_and_peak(self):
+        """Test LTTB returns the threshold count, both ends and the spike."""
+        points = [(float(i), 1.0) for i in range(1000)]
+        points[500] = (500.0, 50.0)
+
+        sampled = lttb(points, 50)
+        assert len(sampled) == 50
+        assert sampled[0] == points[0]
+        assert sampled[-1] == points[-1]
+        assert (500.0, 50.0) in sampled
+
+    def test_lttb_small_series_unchanged(self):
+        """Test series shorter than the threshold are returned as is."""
+        points = [(0.0, 1.0), (1.0, 2.0)]
+        assert lttb(points, 10) == points
+
+    async def test_history_from_database(self, db):
+        """Test history reads one coin's metric and downsamples it."""
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for i in range(120):
+            db.add(SignalFundingRate(
+                coin_name="NB" if i % 2 else "YEE",
+                hourly_profit=Decimal("0.0100") * (i % 7),
+                created_at=start + timedelta(minutes=i),
+            ))
+        await db.commit()
+
+        for method in ("average", "lttb"):
+            history = await fetch_signal_history(
+                db, "funding_rate", "NB", start, start + timedelta(hours=2), 20, method
+            )
+            assert history["raw_points"] == 60
+            assert history["source"] == "raw"
+            assert len(history["data"]) == 20
+            timestamps = [timestamp for timestamp, _ in history["data"]]
+            assert timestamps == sorted(timestamps)
+
+    async def test_lttb_over_rollups_past_raw_limit(self, db, monkeypatch):
+        """Test LTTB switches to rollup averages instead of holding every raw row."""
+        monkeypatch.setattr(settings, "history_lttb_max_raw_points", 50)
+        start = minute_bucket(datetime.now(timezone.utc) - timedelta(hours=3))
+        for i in range(120):
+            signal = SignalFundingRate(
+                coin_name="NB", hourly_profit=Decimal("0.0100") * (i % 7),
+                created_at=start + timedelta(minutes=i // 2, seconds=i % 2),
+            )
+            db.add(signal)
+            await db.flush()
+            await record_signal_stats(db, "funding_rate", signal)
+        await db.commit()
+
+        history = await fetch_signal_history(
+            db, "funding_rate", "NB", start, start + timedelta(hours=2), 20, "lttb"
+        )
+        assert history["source"] == "minute_rollups"
+        assert history["raw_points"] == 120
+        assert len(history["data"]) == 20
+        # Each minute bucket averages its two signals
+        assert history["data"][0] == [round(start.timestamp() * 1000), 0.005]
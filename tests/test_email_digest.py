@@ -0,0 +1,79 @@
+"""Tests for email digests."""
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select
+from app.core.config import settings
+from app.models.signal import EmailDigestItem, EmailOutbox
+from app.models.user import Subscription, User, UserPreferences
+from app.services.notifications.digest import send_due_digests
+from app.services.notifications.service import notification_service
+from app.services.notifications.suppression import alert_suppressor
+
+
+class TestSendDueDigests:
+    """Tests for send_due_digests."""
+
+    async def test_one_email_per_user_once_period_is_up(self, db):
+        """Test a user's waiting signals become one outbox email after the period."""
+        now = datetime.now(timezone.utc)
+        due = User(email="due@example.com", password_hash="x")
+        waiting = User(email="new@example.com", password_hash="x")
+        db.add_all([due, waiting])
+        await db.flush()
+        db.add_all([
+            EmailDigestItem(user_id=due.id, period="5m", signal_type="funding_rate", coin_name="NB",
+                            body="Hourly Profit: 0.4%", created_at=now - timedelta(minutes=6)),
+            EmailDigestItem(user_id=due.id, period="5m", signal_type="funding_rate", coin_name="YEE",
+                            body="Hourly Profit: 0.7%", created_at=now - timedelta(minutes=1)),
+            EmailDigestItem(user_id=waiting.id, period="5m", signal_type="funding_rate", coin_name="NB",
+                            body="Hourly Profit: 0.4%", created_at=now - timedelta(minutes=1)),
+        ])
+        await db.commit()
+
+        assert await send_due_digests(db, now) == 1
+
+        email = (await db.execute(select(EmailOutbox))).scalar_one()
+        assert email.to_email == "due@example.com"
+        assert email.subject == "2 new signals in the last 5 minutes"
+        assert "NB" in email.text_body and "YEE" in email.text_body
+        remaining = (await db.execute(select(EmailDigestItem.user_id))).scalars().all()
+        assert remaining == [waiting.id]
+
+
+async def add_vip(db, email, digest):
+    user = User(email=email, password_hash="x")
+    db.add(user)
+    await db.flush()
+    db.add(Subscription(user_id=user.id, plan="vip", status="active"))
+    db.add(UserPreferences(user_id=user.id, funding_rate_email_notif=True, funding_rate_email_digest=digest))
+    await db.commit()
+
+
+class TestSignalEmailRouting:
+    """Tests for email routing in notify_users_about_signal."""
+
+    async def notify(self, db, monkeypatch):
+        monkeypatch.setattr(alert_suppressor, "window_seconds", 0)
+        await add_vip(db, "digest@example.com", "5m")
+        await add_vip(db, "now@example.com", "immediate")
+        await notification_service.notify_users_about_signal(
+            db, "funding_rate", 1, {"id": 1, "coin_name": "NB", "hourly_profit": 0.4}
+        )
+
+    async def test_digest_or_outbox_per_preference(self, db, monkeypatch):
+        """Test digest subscribers get a digest item and the rest an outbox email."""
+        for name in ("smtp_host", "smtp_user", "smtp_password"):
+            monkeypatch.setattr(settings, name, "x")
+        await self.notify(db, monkeypatch)
+
+        outbox = (await db.execute(select(EmailOutbox.to_email))).scalars().all()
+        assert outbox == ["now@example.com"]
+        item = (await db.execute(select(EmailDigestItem))).scalar_one()
+        assert (item.period, item.coin_name) == ("5m", "NB")
+
+    async def test_nothing_queued_without_smtp(self, db, monkeypatch):
+        """Test no digest items pile up when SMTP is not configured."""
+        monkeypatch.setattr(settings, "smtp_host", "")
+        await self.notify(db, monkeypatch)
+
+        assert (await db.execute(select(EmailOutbox))).first() is None
+        assert (await db.execute(select(EmailDigestItem))).first() is None
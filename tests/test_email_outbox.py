@@ -0,0 +1,61 @@
+"""Tests for the email outbox worker."""
+from datetime import datetime, timezone
+from sqlalchemy import select
+from app.core.config import settings
+from app.models.signal import EmailOutbox
+from app.models.user import User
+from app.services.notifications.outbox import EmailOutboxWorker, queue_email
+
+
+class FlakySender:
+    """Fails for addresses in ``failing``, records the rest."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.sent = []
+
+    async def __call__(self, to_email, message):
+        if to_email in self.failing:
+            raise ConnectionError("SMTP unavailable")
+        assert message.startswith(f"To: {to_email}\r\n".encode())
+        self.sent.append(to_email)
+
+
+async def queue_for(db, *emails):
+    users = [User(email=email, password_hash="x") for email in emails]
+    db.add_all(users)
+    await db.flush()
+    for user in users:
+        queue_email(db, user, "New signal", "<p>signal</p>", "signal", "funding_rate", 1)
+    await db.commit()
+
+
+class TestEmailOutboxWorker:
+    """Tests for EmailOutboxWorker.deliver_batch."""
+
+    async def test_delivers_and_schedules_retry(self, db):
+        """Test sent rows are marked sent and a failure is retried later."""
+        await queue_for(db, "ok@example.com", "down@example.com")
+        sender = FlakySender(failing={"down@example.com"})
+
+        assert await EmailOutboxWorker(sender).deliver_batch(db) == 2
+
+        assert sender.sent == ["ok@example.com"]
+        rows = {row.to_email: row for row in (await db.execute(select(EmailOutbox))).scalars()}
+        assert rows["ok@example.com"].status == "sent"
+        failed = rows["down@example.com"]
+        assert (failed.status, failed.attempts, failed.last_error) == ("pending", 1, "SMTP unavailable")
+        assert failed.next_attempt_at.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc)
+
+        # Not due yet: the next batch is empty
+        assert await EmailOutboxWorker(sender).deliver_batch(db) == 0
+
+    async def test_dead_letter_after_last_attempt(self, db, monkeypatch):
+        """Test an email is marked dead once attempts run out."""
+        monkeypatch.setattr(settings, "email_outbox_max_attempts", 1)
+        await queue_for(db, "down@example.com")
+
+        await EmailOutboxWorker(FlakySender(failing={"down@example.com"})).deliver_batch(db)
+
+        row = (await db.execute(select(EmailOutbox))).scalar_one()
+        assert (row.status, row.attempts) == ("dead", 1)
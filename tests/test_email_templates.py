@@ -0,0 +1,23 @@
+"""Tests for render-once signal emails."""
+from email import message_from_bytes
+from email.policy import default
+from app.services.notifications.email import email_service
+
+
+class TestRenderedEmail:
+    """Tests for RenderedEmail."""
+
+    def test_recipients_share_the_payload(self):
+        """Test each recipient's message differs only in the To header."""
+        rendered = email_service.render_signal_email(
+            "mexc_spot_futures", "NB", {"spread": 2.5, "position": "LONG"}
+        )
+        first = rendered.message_bytes("a@example.com")
+        second = rendered.message_bytes("b@example.com")
+
+        assert first.split(b"\r\n", 1)[1] == second.split(b"\r\n", 1)[1]
+        message = message_from_bytes(second, policy=default)
+        assert message["To"] == "b@example.com"
+        assert message["Subject"] == "New MEXC Spot & Futures Signal: NB"
+        html = message.get_body(("html",)).get_content()
+        assert "Spread:</strong> 2.5%" in html
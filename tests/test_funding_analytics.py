@@ -0,0 +1,76 @@
+"""Tests for funding-rate arbitrage analytics."""
+import math
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+import numpy as np
+from app.models.signal import SignalFundingRate
+from app.services.analytics.funding import (
+    compute_funding_arbitrage,
+    funding_arbitrage,
+    parse_interval_hours,
+)
+
+NAN = np.nan
+
+
+class TestFundingArbitrage:
+    """Tests for hourly normalization and best pair selection."""
+
+    def test_parse_interval_hours(self):
+        """Test interval strings and the default for missing ones."""
+        assert parse_interval_hours("1h") == 1.0
+        assert parse_interval_hours("1.0h") == 1.0
+        assert parse_interval_hours("4h") == 4.0
+        assert parse_interval_hours(None) == 8.0
+
+    def test_best_pair_uses_hourly_rates(self):
+        """Test rates are compared per hour, not per funding interval."""
+        # gate -0.8%/8h = -0.1%/h, binance -0.2%/1h, mexc 0.3%/4h = 0.075%/h
+        rates = np.array([[-0.8, -0.2, 0.3, NAN, NAN, NAN]])
+        intervals = np.array([[8.0, 1.0, 4.0, 8.0, 8.0, 8.0]])
+
+        pairs = compute_funding_arbitrage(["NB"], rates, intervals)
+        assert pairs["long_index"][0] == 1  # binance
+        assert pairs["short_index"][0] == 2  # mexc
+        assert math.isclose(pairs["spread_hourly"][0], 0.275)
+
+    def test_latest_signal_per_coin_and_mean(self):
+        """Test each coin uses its newest signal and averages the window."""
+        rates = np.array([
+            [0.1, -0.1, NAN, NAN, NAN, NAN],
+            [0.5, NAN, NAN, NAN, NAN, NAN],
+            [0.3, -0.1, NAN, NAN, NAN, NAN],
+        ])
+        intervals = np.ones_like(rates)
+
+        pairs = compute_funding_arbitrage(["NB", "YEE", "NB"], rates, intervals)
+        assert list(pairs["coin_name"]) == ["NB", "YEE"]
+        assert math.isclose(pairs["spread_hourly"][0], 0.4)
+        assert math.isclose(pairs["mean_spread_hourly"][0], 0.3)
+        assert list(pairs["pairable"]) == [True, False]
+
+    async def test_funding_arbitrage_from_database(self, db):
+        """Test the window is loaded and ranked by spread."""
+        now = datetime(2026, 1, 10, tzinfo=timezone.utc)
+        db.add_all([
+            SignalFundingRate(
+                coin_name="NB", gate_rate=Decimal("-0.8"), gate_interval="8h",
+                bybit_rate=Decimal("0.1"), bybit_interval="1h", created_at=now - timedelta(hours=1),
+            ),
+            SignalFundingRate(
+                coin_name="YEE", mexc_rate=Decimal("-0.5"), mexc_interval="1h",
+                bitget_rate=Decimal("0.2"), bitget_interval="4h", created_at=now - timedelta(hours=2),
+            ),
+            SignalFundingRate(
+                coin_name="OLD", mexc_rate=Decimal("-5"), bybit_rate=Decimal("5"),
+                created_at=now - timedelta(days=3),
+            ),
+        ])
+        await db.commit()
+
+        rows = await funding_arbitrage(db, window_hours=24, now=now)
+        assert [row["coin_name"] for row in rows] == ["YEE", "NB"]
+        assert rows[0]["long_exchange"] == "mexc"
+        assert rows[0]["short_exchange"] == "bitget"
+        assert rows[0]["spread_hourly"] == 0.55
+        assert rows[0]["spread_annualized"] == 4818.0
@@ -0,0 +1,117 @@
+"""Tests for the Redis Streams ingestion consumer."""
+import fakeredis.aioredis
+import pytest
+from sqlalchemy import func, select
+from app.core import redis_client
+from app.core.config import settings
+from app.models.signal import SignalMEXCSpotFutures
+from app.services.signals import events
+from app.services.telegram import handler, stream
+from app.services.telegram.stream import IngestStreamConsumer, publish_signal_message
+from tests.conftest import SessionFactory
+
+SIGNAL = """Монета: NB
+SHORT
+Спред: 8.84%
+https://www.mexc.com/exchange/NB_USDT
+https://futures.mexc.com/exchange/NB_USDT
+Спот: 0.00666400
+Фючи: 0.00728000
+Депозит: ✅ Вывод: ✅"""
+
+
+@pytest.fixture
+async def redis(monkeypatch, db):
+    """Fake Redis and the test session wired into the ingestion path."""
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(redis_client, "redis_client", client)
+    monkeypatch.setattr(handler, "AsyncSessionLocal", SessionFactory(db))
+    monkeypatch.setattr(settings, "ingest_claim_idle_ms", 0)
+    applied = []
+
+    async def apply_signal(signal_type, payload, signal_data, trace=None):
+        applied.append(payload["id"])
+
+    monkeypatch.setattr(events, "apply_signal", apply_signal)
+    client.applied = applied
+    yield client
+    await client.aclose()
+
+
+async def read_one(redis, consumer: IngestStreamConsumer):
+    """Deliver the next new entry to ``consumer`` without processing it."""
+    response = await redis.xreadgroup(consumer.group, consumer.consumer_name, {consumer.stream: ">"}, count=1)
+    return response[0][1][0]
+
+
+async def pending_count(redis) -> int:
+    return (await redis.xpending(settings.ingest_stream_name, settings.ingest_consumer_group))["pending"]
+
+
+async def signal_count(db) -> int:
+    return (await db.execute(select(func.count()).select_from(SignalMEXCSpotFutures))).scalar()
+
+
+class TestIngestStreamConsumer:
+    """Tests for IngestStreamConsumer."""
+
+    async def test_ack_after_commit(self, redis, db, monkeypatch):
+        """Test an entry is acknowledged only once its signal is persisted."""
+        consumer = IngestStreamConsumer(consumer_name="a")
+        await consumer.ensure_group()
+        await publish_signal_message(SIGNAL, "chat", message_id=1)
+        entry_id, fields = await read_one(redis, consumer)
+
+        real_handle = stream.handle_signal_message
+        failures = [ConnectionError("database unavailable")]
+
+        async def flaky_handle(*args, **kwargs):
+            if failures:
+                raise failures.pop()
+            return await real_handle(*args, **kwargs)
+
+        monkeypatch.setattr(stream, "handle_signal_message", flaky_handle)
+        assert not await consumer.process_entry(entry_id, fields)
+        assert await pending_count(redis) == 1
+
+        assert await consumer.process_entry(entry_id, fields)
+        assert await pending_count(redis) == 0
+        row = (await db.execute(select(SignalMEXCSpotFutures))).scalar_one()
+        assert row.source_message_id == entry_id
+
+    async def test_reclaims_entry_of_dead_consumer_once(self, redis, db):
+        """Test a committed but unacknowledged entry is reclaimed without a duplicate."""
+        dead = IngestStreamConsumer(consumer_name="dead")
+        await dead.ensure_group()
+        await publish_signal_message(SIGNAL, "chat", message_id=1)
+        entry_id, fields = await read_one(redis, dead)
+        # The dead consumer committed the signal but never acknowledged it
+        await handler.handle_signal_message(fields["text"], source_message_id=entry_id)
+
+        alive = IngestStreamConsumer(consumer_name="alive")
+        await alive.reclaim_pending()
+
+        assert await pending_count(redis) == 0
+        assert await signal_count(db) == 1
+        assert len(redis.applied) == 1
+
+    async def test_dead_letter_after_max_deliveries(self, redis, db, monkeypatch):
+        """Test an entry that keeps failing moves to the dead-letter stream."""
+        monkeypatch.setattr(settings, "ingest_max_deliveries", 2)
+        consumer = IngestStreamConsumer(consumer_name="a")
+        await consumer.ensure_group()
+        await publish_signal_message("Монета: NB\nСпред: broken", "chat", message_id=1)
+        entry_id, _ = await read_one(redis, consumer)
+
+        async def fail(*args, **kwargs):
+            raise ValueError("unparseable")
+
+        monkeypatch.setattr(stream, "handle_signal_message", fail)
+        await consumer.reclaim_pending()  # second delivery, fails again
+        assert await pending_count(redis) == 1
+
+        await consumer.reclaim_pending()
+        assert await pending_count(redis) == 0
+        dead = await redis.xrange(consumer.dead_letter_stream)
+        assert [fields["entry_id"] for _, fields in dead] == [entry_id]
+
@@ -0,0 +1,61 @@
+"""Tests for the latest signal per coin table."""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from sqlalchemy import select
+from app.models.signal import LatestSignal, SignalMEXCDEX
+from app.services.signals.latest import (
+    fetch_latest_signals,
+    rebuild_latest_signal,
+    upsert_latest_signal,
+)
+
+
+async def add_signal(db, coin_name: str, spread: str, created_at: datetime) -> SignalMEXCDEX:
+    signal = SignalMEXCDEX(coin_name=coin_name, spread_percent=Decimal(spread), created_at=created_at)
+    db.add(signal)
+    await db.flush()
+    await upsert_latest_signal(db, "mexc_dex", signal)
+    await db.commit()
+    return signal
+
+
+class TestLatestSignals:
+    """Tests for latest_signals upserts and reads."""
+
+    async def test_newer_signal_replaces_row(self, db):
+        """Test one row per coin holding the newest signal."""
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        await add_signal(db, "NB", "5.00", start)
+        newest = await add_signal(db, "NB", "7.50", start + timedelta(minutes=1))
+        await add_signal(db, "YEE", "3.10", start)
+
+        rows = (await db.execute(select(LatestSignal))).scalars().all()
+        assert len(rows) == 2
+
+        latest = await fetch_latest_signals(db, signal_type="mexc_dex", coin_name="NB")
+        assert len(latest) == 1
+        assert latest[0]["signal_id"] == newest.id
+        assert latest[0]["signal"]["spread_percent"] == "7.50"
+
+    async def test_older_signal_does_not_replace_row(self, db):
+        """Test a late signal with an older timestamp is ignored."""
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        newest = await add_signal(db, "NB", "7.50", start)
+        await add_signal(db, "NB", "5.00", start - timedelta(minutes=5))
+
+        latest = await fetch_latest_signals(db, coin_name="NB")
+        assert latest[0]["signal_id"] == newest.id
+
+    async def test_rebuild_after_delete(self, db):
+        """Test the previous signal becomes latest when the newest is deleted."""
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        previous = await add_signal(db, "NB", "5.00", start)
+        newest = await add_signal(db, "NB", "7.50", start + timedelta(minutes=1))
+
+        await db.delete(newest)
+        await db.flush()
+        await rebuild_latest_signal(db, "mexc_dex", "NB")
+        await db.commit()
+
+        latest = await fetch_latest_signals(db, coin_name="NB")
+        assert latest[0]["signal_id"] == previous.id
@@ -0,0 +1,101 @@
+"""Tests for the in-memory opportunity leaderboard."""
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from app.models.signal import SignalMEXCSpotFutures
+from app.services.signals import router as signals_router
+from app.services.signals.latest import upsert_latest_signal
+from app.services.signals.leaderboard import Leaderboard
+
+
+def spot_signal(signal_id: int, coin_name: str, spread):
+    return {"id": signal_id, "coin_name": coin_name, "spread": spread}
+
+
+class TestLeaderboard:
+    """Tests for Leaderboard ranking and eviction."""
+
+    def test_ranked_by_score(self):
+        """Test entries come back highest score first, limited to N."""
+        board = Leaderboard(window_seconds=60, size=2)
+        board.add("mexc_spot_futures", spot_signal(1, "NB", "3.50"), added_at=100)
+        board.add("mexc_spot_futures", spot_signal(2, "YEE", "9.10"), added_at=100)
+        board.add("mexc_spot_futures", spot_signal(3, "GOAT", "5.00"), added_at=100)
+
+        top = board.top("mexc_spot_futures", now=110)
+        assert [entry["coin_name"] for entry in top] == ["YEE", "GOAT"]
+        assert top[0]["score"] == 9.1
+
+    def test_newest_signal_per_coin(self):
+        """Test a new signal replaces the coin's entry even with a lower score."""
+        board = Leaderboard(window_seconds=60, size=10)
+        board.add("mexc_spot_futures", spot_signal(1, "NB", "9.00"), added_at=100)
+        board.add("mexc_spot_futures", spot_signal(2, "NB", "2.00"), added_at=110)
+
+        top = board.top("mexc_spot_futures", now=120)
+        assert len(top) == 1
+        assert top[0]["signal_id"] == 2
+
+    def test_entries_expire_after_window(self):
+        """Test old entries are evicted, but not a coin refreshed since."""
+        board = Leaderboard(window_seconds=60, size=10)
+        board.add("mexc_spot_futures", spot_signal(1, "NB", "4.00"), added_at=100)
+        board.add("mexc_spot_futures", spot_signal(2, "YEE", "5.00"), added_at=100)
+        board.add("mexc_spot_futures", spot_signal(3, "YEE", "6.00"), added_at=150)
+
+        top = board.top("mexc_spot_futures", now=170)
+        assert [entry["signal_id"] for entry in top] == [3]
+
+    def test_signal_without_score_is_skipped(self):
+        """Test signals missing the score field are not ranked."""
+        board = Leaderboard(window_seconds=60, size=10)
+        assert not board.add("funding_rate", {"id": 1, "coin_name": "NB", "hourly_profit": None})
+        assert board.snapshot("funding_rate") == {"funding_rate": []}
+
+    def test_signal_without_score_drops_older_entry(self):
+        """Test a newer signal without a score removes the coin's stale entry."""
+        board = Leaderboard(window_seconds=60, size=10)
+        board.add("mexc_spot_futures", spot_signal(1, "NB", "9.00"), added_at=100)
+        board.add("mexc_spot_futures", spot_signal(2, "YEE", "3.00"), added_at=100)
+        assert not board.add("mexc_spot_futures", spot_signal(3, "NB", None), added_at=110)
+
+        top = board.top("mexc_spot_futures", now=120)
+        assert [entry["coin_name"] for entry in top] == ["YEE"]
+        # The old heap item for NB is skipped on eviction
+        assert board.evict(now=200) == 1
+
+
+class TestDeleteSignal:
+    """Tests for the leaderboard after a signal is deleted."""
+
+    async def test_deleted_signal_leaves_leaderboard(self, db, monkeypatch):
+        """Test deleting a coin's newest signal falls back to its previous one."""
+        board = Leaderboard(window_seconds=600, size=10)
+        monkeypatch.setattr(signals_router, "leaderboard", board)
+        now = datetime.now(timezone.utc)
+        signals = []
+        for coin_name, spread, minutes_ago in (("NB", "3.00", 5), ("NB", "9.00", 1), ("YEE", "4.00", 1)):
+            signal = SignalMEXCSpotFutures(
+                coin_name=coin_name, spread=Decimal(spread), created_at=now - timedelta(minutes=minutes_ago)
+            )
+            db.add(signal)
+            await db.flush()
+            payload = await upsert_latest_signal(db, "mexc_spot_futures", signal)
+            board.add("mexc_spot_futures", payload, added_at=time.time() - minutes_ago * 60)
+            signals.append(signal)
+        await db.commit()
+
+        await signals_router.delete_signal(signals[1].id, signal_type="mexc_spot_futures", db=db, user=None)
+
+        top = board.top("mexc_spot_futures")
+        assert [(entry["coin_name"], entry["signal_id"]) for entry in top] == [
+            ("YEE", signals[2].id),
+            ("NB", signals[0].id),
+        ]
+
+    def test_discard_unknown_signal(self):
+        """Test discarding a signal that is not ranked changes nothing."""
+        board = Leaderboard(window_seconds=60, size=10)
+        board.add("mexc_spot_futures", spot_signal(1, "NB", "4.00"), added_at=100)
+        assert not board.discard("mexc_spot_futures", 2)
+        assert [entry["signal_id"] for entry in board.top("mexc_spot_futures", now=110)] == [1]
@@ -0,0 +1,54 @@
+"""Tests for the recent signals cache and WebSocket snapshots."""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from app.models.signal import SignalMEXCDEX
+from app.services.signals.recent import RecentSignals, recent_signals
+from app.services.websocket.manager import SignalFilter
+from app.services.websocket.router import build_snapshot
+
+
+def dex_signal(signal_id: int, coin_name: str, spread_percent: str) -> dict:
+    return {"id": signal_id, "coin_name": coin_name, "spread_percent": spread_percent}
+
+
+class TestRecentSignals:
+    """Tests for RecentSignals."""
+
+    def test_newest_first_and_bounded(self):
+        """Test the cache keeps the last N signals, newest first, and drops deleted ones."""
+        cache = RecentSignals(size=2)
+        for signal_id in (1, 2, 3):
+            cache.add("mexc_dex", dex_signal(signal_id, "NB", "5.0"))
+        assert [signal["id"] for signal in cache.latest("mexc_dex")] == [3, 2]
+
+        cache.discard("mexc_dex", 3)
+        assert [signal["id"] for signal in cache.latest("mexc_dex")] == [2]
+
+    async def test_warm_from_database(self, db):
+        """Test warming loads the newest signals as broadcast payloads."""
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for i in range(5):
+            db.add(SignalMEXCDEX(
+                coin_name="NB", spread_percent=Decimal("5.00"), created_at=start + timedelta(minutes=i)
+            ))
+        await db.commit()
+
+        cache = RecentSignals(size=3)
+        assert await cache.warm(db) == 3
+        assert [signal["id"] for signal in cache.latest("mexc_dex")] == [5, 4, 3]
+        assert cache.latest("funding_rate") == []
+
+    def test_snapshot_applies_filter(self):
+        """Test the WebSocket snapshot filters recent signals and includes the leaderboard."""
+        recent_signals.clear()
+        recent_signals.add("mexc_dex", dex_signal(1, "NB", "12.0"))
+        recent_signals.add("mexc_dex", dex_signal(2, "YEE", "3.0"))
+        try:
+            snapshot = build_snapshot(SignalFilter(signal_types=["mexc_dex"], min_spread=10))
+        finally:
+            recent_signals.clear()
+
+        assert snapshot["type"] == "snapshot"
+        assert [signal["id"] for signal in snapshot["data"]["mexc_dex"]] == [1]
+        assert set(snapshot["data"]) == {"mexc_dex"}
+        assert "data" in snapshot["leaderboard"]
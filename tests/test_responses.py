@@ -0,0 +1,45 @@
+"""Tests for fast JSON response rendering."""
+from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+from fastapi.responses import JSONResponse
+from app.core.responses import FastJSONResponse
+
+
+class TestFastJSONResponse:
+    """Tests for FastJSONResponse."""
+
+    def test_matches_json_response(self):
+        """Test output is byte-compatible with JSONResponse for API payloads."""
+        content = {
+            "data": [
+                {
+                    "id": 1,
+                    "coin_name": "PIPPIN",
+                    "hourly_profit": "0.2711",
+                    "rate": -0.0422,
+                    "enabled": True,
+                    "url": None,
+                    "title": "Новый сигнал 🚀",
+                    "created_at": "2025-12-14T12:00:00Z",
+                }
+            ],
+            "pagination": {"total": 1, "limit": 30, "offset": 0},
+        }
+        assert FastJSONResponse(content).body == JSONResponse(content).body
+
+    def test_native_decimal_and_datetime(self):
+        """Test Decimal and datetime are encoded like Pydantic's JSON mode."""
+        content = {
+            "price": Decimal("0.00666400"),
+            "utc": datetime(2025, 12, 14, 12, 0, 0, 123456, tzinfo=timezone.utc),
+            "msk": datetime(2025, 12, 14, 15, 0, tzinfo=timezone(timedelta(hours=3))),
+        }
+        assert FastJSONResponse(content).body == (
+            b'{"price":"0.00666400",'
+            b'"utc":"2025-12-14T12:00:00.123456Z",'
+            b'"msk":"2025-12-14T15:00:00+03:00"}'
+        )
+
+    def test_non_string_keys(self):
+        """Test integer keys are stringified like json.dumps."""
+        assert FastJSONResponse({1: "a"}).body == JSONResponse({1: "a"}).body
@@ -0,0 +1,46 @@
+"""Tests for signal fan-out from standalone ingestion workers."""
+import asyncio
+import fakeredis.aioredis
+from app.core import redis_client
+from app.core.tracing import SignalTrace
+from app.services.signals import events
+from app.services.signals.leaderboard import Leaderboard
+from app.services.signals.recent import RecentSignals
+
+
+class TestSignalEvents:
+    """Tests for fan_out_signal and run_signal_event_listener."""
+
+    async def test_worker_signal_reaches_api_process(self, monkeypatch):
+        """Test a published signal feeds the listener's caches and broadcast."""
+        monkeypatch.setattr(redis_client, "redis_client", fakeredis.aioredis.FakeRedis(decode_responses=True))
+        monkeypatch.setattr(events, "leaderboard", Leaderboard(window_seconds=60, size=10))
+        monkeypatch.setattr(events, "recent_signals", RecentSignals(size=10))
+        broadcasts = []
+
+        async def broadcast(signal_type, signal_data, trace=None):
+            broadcasts.append((signal_type, signal_data, trace.trace_id))
+
+        monkeypatch.setattr(events, "broadcast_new_signal", broadcast)
+        listener = asyncio.create_task(events.run_signal_event_listener())
+        try:
+            redis = await redis_client.get_redis()
+            while not (await redis.pubsub_numsub(events.settings.signal_events_channel))[0][1]:
+                await asyncio.sleep(0.01)
+
+            # As a standalone worker: nothing is applied locally
+            monkeypatch.setattr(events, "_publishing", True)
+            payload = {"id": 7, "coin_name": "NB", "spread": "4.20"}
+            trace = SignalTrace("mexc_spot_futures", source_ts=100.0, trace_id="abc")
+            await events.fan_out_signal("mexc_spot_futures", payload, {"id": 7}, trace)
+
+            for _ in range(100):
+                if broadcasts:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            listener.cancel()
+
+        assert broadcasts == [("mexc_spot_futures", {"id": 7}, "abc")]
+        assert events.recent_signals.latest("mexc_spot_futures") == [payload]
+        assert events.leaderboard.top("mexc_spot_futures")[0]["signal_id"] == 7
@@ -0,0 +1,69 @@
+"""Tests for the signal list projection fast path."""
+import json
+from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+from app.models.signal import SignalFundingRate
+from app.schemas.signal import (
+    FundingRateSignalResponse,
+    MEXCSpotFuturesSignalResponse,
+    SignalListResponse,
+)
+from app.core.responses import dumps
+from app.services.signals.projection import SIGNAL_LIST_COLUMNS
+
+
+def pydantic_render(schema, rows, pagination) -> bytes:
+    """Render a list response the way FastAPI does for response_model endpoints."""
+    response = SignalListResponse(data=[schema(**row) for row in rows], pagination=pagination)
+    return json.dumps(
+        response.model_dump(mode="json"),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class TestSignalProjection:
+    """Tests for column projection and JSON rendering."""
+
+    def test_columns_follow_response_schema(self):
+        """Test projected columns match the response schema fields."""
+        names = [column.key for column in SIGNAL_LIST_COLUMNS[SignalFundingRate]]
+        assert names == list(FundingRateSignalResponse.model_fields)
+
+    def test_render_matches_pydantic_output(self):
+        """Test fast path output is byte-compatible with Pydantic serialization."""
+        rows = [
+            {
+                "id": 1,
+                "coin_name": "NB",
+                "position": "SHORT",
+                "spread": Decimal("8.84"),
+                "mexc_spot_price": Decimal("0.00666400"),
+                "mexc_futures_price": Decimal("0.00728000"),
+                "spot_url": "https://www.mexc.com/exchange/NB_USDT",
+                "futures_url": None,
+                "deposit_enabled": True,
+                "withdrawal_enabled": False,
+                "dex_url": None,
+                "created_at": datetime(2025, 12, 14, 12, 0, 0, 123456, tzinfo=timezone.utc),
+            },
+            {
+                "id": 2,
+                "coin_name": "МОНЕТА",
+                "position": None,
+                "spread": Decimal("1E+1"),
+                "mexc_spot_price": None,
+                "mexc_futures_price": None,
+                "spot_url": None,
+                "futures_url": None,
+                "deposit_enabled": True,
+                "withdrawal_enabled": True,
+                "dex_url": None,
+                "created_at": datetime(2025, 12, 14, 15, 0, tzinfo=timezone(timedelta(hours=3))),
+            },
+        ]
+        pagination = {"total": 2, "limit": 30, "offset": 0}
+
+        fast = dumps({"data": rows, "pagination": pagination})
+        assert fast == pydantic_render(MEXCSpotFuturesSignalResponse, rows, pagination)
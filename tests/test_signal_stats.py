@@ -0,0 +1,68 @@
+"""Tests for per-coin signal statistics rollups."""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from sqlalchemy import func, select
+from app.models.signal import SignalMEXCSpotFutures, SignalStatsMinute, SignalStatsHour
+from app.services.signals.rollups import fetch_signal_stats, prune_signal_stats, record_signal_stats
+
+NOW = datetime(2026, 1, 10, 12, 30, tzinfo=timezone.utc)
+
+
+async def add_signal(db, coin_name: str, spread, created_at: datetime):
+    signal = SignalMEXCSpotFutures(
+        coin_name=coin_name,
+        spread=None if spread is None else Decimal(spread),
+        created_at=created_at,
+    )
+    db.add(signal)
+    await db.flush()
+    await record_signal_stats(db, "mexc_spot_futures", signal)
+    await db.commit()
+
+
+class TestSignalStats:
+    """Tests for rollup maintenance and window queries."""
+
+    async def test_window_stats(self, db):
+        """Test count, max, avg, last and seen times over a window."""
+        await add_signal(db, "NB", "4.00", NOW - timedelta(minutes=50))
+        await add_signal(db, "NB", "8.00", NOW - timedelta(minutes=49, seconds=30))
+        await add_signal(db, "NB", "6.00", NOW - timedelta(minutes=5))
+        await add_signal(db, "NB", None, NOW - timedelta(minutes=4))
+        await add_signal(db, "NB", "9.00", NOW - timedelta(hours=3))
+
+        minutes = (await db.execute(select(func.count()).select_from(SignalStatsMinute))).scalar()
+        assert minutes == 4
+
+        stats = await fetch_signal_stats(db, "mexc_spot_futures", "1h", now=NOW)
+        assert len(stats) == 1
+        entry = stats[0]
+        assert entry["count"] == 4
+        assert entry["max"] == Decimal("8")
+        assert entry["avg"] == Decimal("6.00000000")
+        assert entry["last"] is None
+        assert entry["first_seen"] == NOW - timedelta(minutes=50)
+        assert entry["last_seen"] == NOW - timedelta(minutes=4)
+
+        day = await fetch_signal_stats(db, "mexc_spot_futures", "24h", now=NOW)
+        assert day[0]["count"] == 5
+        assert day[0]["max"] == Decimal("9")
+
+    async def test_partial_hour_excludes_older_minutes(self, db):
+        """Test the window edge is cut at minute precision, not at the hour."""
+        await add_signal(db, "NB", "5.00", NOW - timedelta(minutes=65))
+        await add_signal(db, "YEE", "3.00", NOW - timedelta(minutes=30))
+
+        stats = await fetch_signal_stats(db, "mexc_spot_futures", "1h", now=NOW)
+        assert [entry["coin_name"] for entry in stats] == ["YEE"]
+
+    async def test_prune_drops_expired_buckets(self, db):
+        """Test buckets past retention are deleted."""
+        await add_signal(db, "NB", "5.00", NOW - timedelta(days=3))
+        await add_signal(db, "NB", "5.00", NOW - timedelta(minutes=1))
+
+        await prune_signal_stats(db, now=NOW)
+
+        minutes = (await db.execute(select(func.count()).select_from(SignalStatsMinute))).scalar()
+        hours = (await db.execute(select(func.count()).select_from(SignalStatsHour))).scalar()
+        assert (minutes, hours) == (1, 2)
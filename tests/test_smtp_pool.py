@@ -0,0 +1,89 @@
+"""Tests for the pooled SMTP connections, against a local aiosmtpd server."""
+import socket
+from email.message import EmailMessage
+import pytest
+from aiosmtpd.controller import Controller
+from app.services.notifications.smtp_pool import SMTPPool
+
+
+class RecordingHandler:
+    """Accepts every message and records the recipients."""
+
+    def __init__(self):
+        self.recipients = []
+        self.sessions = set()
+
+    async def handle_DATA(self, server, session, envelope):
+        self.recipients.extend(envelope.rcpt_tos)
+        self.sessions.add(id(session))
+        return "250 OK"
+
+
+class LocalSMTPServer:
+    """aiosmtpd server on a free local port that can be restarted in place."""
+
+    def __init__(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+        self.hostname = "127.0.0.1"
+        self.handler = RecordingHandler()
+        self.controller = None
+
+    def start(self):
+        self.controller = Controller(self.handler, hostname=self.hostname, port=self.port)
+        self.controller.start()
+
+    def stop(self):
+        self.controller.stop()
+
+    def restart(self):
+        """Drop all client connections."""
+        self.stop()
+        self.start()
+
+
+@pytest.fixture
+def smtp_server():
+    server = LocalSMTPServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+def make_message(index: int) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "noreply@example.com"
+    message["To"] = f"user{index}@example.com"
+    message["Subject"] = "Signal"
+    message.set_content("New signal")
+    return message
+
+
+class TestSMTPPool:
+    """Tests for SMTPPool."""
+
+    async def test_reuses_and_recycles_connections(self, smtp_server):
+        """Test sends share connections, each replaced after max_messages."""
+        handler = smtp_server.handler
+        pool = SMTPPool(smtp_server.hostname, smtp_server.port, size=1, max_messages=3)
+        for i in range(7):
+            await pool.send_message(make_message(i))
+        await pool.close()
+
+        assert handler.recipients == [f"user{i}@example.com" for i in range(7)]
+        assert pool.connections_opened == 3
+        assert len(handler.sessions) == 3
+
+    async def test_reconnects_after_server_restart(self, smtp_server):
+        """Test a connection the server dropped is replaced and the send retried."""
+        handler = smtp_server.handler
+        pool = SMTPPool(smtp_server.hostname, smtp_server.port, size=2)
+        await pool.send_message(make_message(0))
+        smtp_server.restart()
+
+        await pool.send_message(make_message(1))
+        await pool.close()
+
+        assert handler.recipients == ["user0@example.com", "user1@example.com"]
+        assert pool.connections_opened == 2
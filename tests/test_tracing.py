@@ -0,0 +1,38 @@
+"""Tests for signal pipeline tracing."""
+import time
+from app.core.metrics import signal_stage_seconds
+from app.core.tracing import SignalTrace
+
+
+class TestSignalTrace:
+    """Tests for SignalTrace."""
+
+    def test_stage_is_recorded(self):
+        """Test that a stage duration is stored and exported."""
+        trace = SignalTrace("funding_rate")
+        histogram = signal_stage_seconds.labels("funding_rate", "parse")
+        before = histogram._sum.get()
+
+        with trace.stage("parse"):
+            time.sleep(0.001)
+
+        assert trace.stages["parse"] > 0
+        assert histogram._sum.get() > before
+
+    def test_queue_delay_from_source_timestamp(self):
+        """Test queue delay is measured from the Telegram post time."""
+        trace = SignalTrace("mexc_dex", source_ts=time.time() - 2)
+        trace.observe_queue_delay()
+        assert trace.stages["queue"] >= 2
+
+    def test_frame_fields(self):
+        """Test trace fields included in WebSocket frames."""
+        trace = SignalTrace("mexc_dex", source_ts=1700000000.0, trace_id="abc")
+        fields = trace.frame_fields()
+        assert fields["trace_id"] == "abc"
+        assert fields["source_ts"] == 1700000000.0
+        assert fields["sent_at"] >= trace.started_at
+
+    def test_trace_id_is_generated(self):
+        """Test that each trace gets a unique id."""
+        assert SignalTrace().trace_id != SignalTrace().trace_id
@@ -0,0 +1,124 @@
+"""Tests for WebSocket admission control."""
+import pytest
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models.user import Subscription, User
+from app.services.websocket import router as websocket_router
+from app.services.websocket.manager import ConnectionManager, manager
+from tests.conftest import SessionFactory
+
+
+@pytest.fixture
+def ws_client(monkeypatch):
+    """Client for the WebSocket router with the database check stubbed out."""
+    checked = []
+
+    async def check_vip(user_id: int) -> str:
+        checked.append(user_id)
+        return client.status
+
+    monkeypatch.setattr(websocket_router, "check_vip", check_vip)
+    app = FastAPI()
+    app.include_router(websocket_router.router)
+    with TestClient(app) as client:
+        client.checked = checked
+        client.status = "vip"
+        yield client
+
+
+def token(plan: str = "vip", user_id: int = 1) -> str:
+    return create_access_token({"sub": str(user_id), "plan": plan})
+
+
+class TestAdmission:
+    """Tests for connection caps and the plan claim fast path."""
+
+    def test_plan_claim_admits_and_defers_check(self, ws_client):
+        """Test a VIP plan claim connects at once and is verified afterwards."""
+        with ws_client.websocket_connect(f"/ws/signals?token={token()}&snapshot=false") as websocket:
+            assert websocket.receive_json()["type"] == "connected"
+            websocket.send_json({"type": "ping"})
+            assert websocket.receive_json() == {"type": "pong"}
+        assert ws_client.checked == [1]
+
+    def test_free_plan_claim_checked_against_database(self, ws_client):
+        """Test a non-VIP claim is looked up, so a user who upgraded since login gets in."""
+        with ws_client.websocket_connect(f"/ws/signals?token={token('free')}&snapshot=false") as websocket:
+            assert websocket.receive_json()["type"] == "connected"
+        assert ws_client.checked == [1]
+
+        ws_client.status = "not_vip"
+        with ws_client.websocket_connect(f"/ws/signals?token={token('free')}") as websocket:
+            with pytest.raises(WebSocketDisconnect) as closed:
+                websocket.receive_json()
+        assert closed.value.code == 1008
+
+    def test_over_capacity_closes_with_try_again_later(self, ws_client, monkeypatch):
+        """Test a full worker closes new connections with 1013."""
+        monkeypatch.setattr(settings, "ws_max_connections", 0)
+        with ws_client.websocket_connect(f"/ws/signals?token={token()}") as websocket:
+            with pytest.raises(WebSocketDisconnect) as closed:
+                websocket.receive_json()
+        assert closed.value.code == 1013
+        assert manager.websocket_to_user == {}
+
+    async def test_per_user_cap_closes_oldest(self, fake_websocket, monkeypatch):
+        """Test a user's oldest connection makes room for a new one."""
+        monkeypatch.setattr(settings, "ws_max_connections_per_user", 2)
+        connections = ConnectionManager()
+        first, second, third = fake_websocket(), fake_websocket(), fake_websocket()
+        for websocket in (first, second, third):
+            await connections.connect(websocket, 1)
+
+        assert first.closed == 1008
+        assert connections.active_connections[1] == {second, third}
+
+
+class TestCheckVip:
+    """Tests for the subscription lookup."""
+
+    async def test_only_active_vip_subscriptions_count(self, db, monkeypatch):
+        """Test cancelled or expired VIP subscriptions are not confirmed or cached."""
+        monkeypatch.setattr(websocket_router, "AsyncSessionLocal", SessionFactory(db))
+        monkeypatch.setattr(websocket_router, "_vip_confirmed_until", {})
+        statuses = ("active", "cancelled", "expired")
+        users = [User(email=f"{status}@example.com", password_hash="x") for status in statuses]
+        db.add_all(users)
+        await db.flush()
+        for user, status in zip(users, statuses):
+            db.add(Subscription(user_id=user.id, plan="vip", status=status))
+        await db.commit()
+
+        assert [await websocket_router.check_vip(user.id) for user in users] == ["vip", "not_vip", "not_vip"]
+        assert list(websocket_router._vip_confirmed_until) == [users[0].id]
+
+
+class TestRevalidation:
+    """Tests for re-checking connected users' subscriptions."""
+
+    async def test_drops_users_without_active_vip(self, fake_websocket, db, monkeypatch):
+        """Test a connected user whose VIP was cancelled is closed, an active one kept."""
+        connections = ConnectionManager()
+        monkeypatch.setattr(websocket_router, "manager", connections)
+        monkeypatch.setattr(websocket_router, "AsyncSessionLocal", SessionFactory(db))
+        monkeypatch.setattr(websocket_router, "_vip_confirmed_until", {})
+        active = User(email="a@example.com", password_hash="x")
+        cancelled = User(email="c@example.com", password_hash="x")
+        db.add_all([active, cancelled])
+        await db.flush()
+        db.add_all([
+            Subscription(user_id=active.id, plan="vip", status="active"),
+            Subscription(user_id=cancelled.id, plan="vip", status="cancelled"),
+        ])
+        await db.commit()
+        kept, dropped = fake_websocket(), fake_websocket()
+        await connections.connect(kept, active.id)
+        await connections.connect(dropped, cancelled.id)
+
+        assert await websocket_router.revalidate_connections() == 1
+
+        assert (kept.closed, dropped.closed) == (None, 1008)
+        assert connections.websocket_to_user == {kept: active.id}
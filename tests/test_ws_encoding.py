@@ -0,0 +1,43 @@
+"""Tests for WebSocket wire encodings."""
+import json
+from decimal import Decimal
+import msgpack
+from app.services.websocket.encoding import EncodedMessage, encode, encode_batch, negotiate_encoding
+from app.services.websocket.manager import ConnectionManager
+
+
+class TestEncoding:
+    """Tests for JSON and MessagePack frames."""
+
+    def test_encodings_carry_the_same_message(self):
+        """Test both encodings decode to the same message, Decimal as a string."""
+        message = {"type": "new_signal", "data": {"coin_name": "NB", "spread": Decimal("8.84")}}
+        assert json.loads(encode(message, "json")) == msgpack.unpackb(encode(message, "msgpack"))
+
+    def test_batch_built_from_encoded_frames(self):
+        """Test a batch of encoded frames decodes to the batch message."""
+        messages = [{"type": "new_signal", "seq": seq} for seq in (1, 2, 3)]
+        for encoding, decode in (("json", json.loads), ("msgpack", msgpack.unpackb)):
+            payloads = [EncodedMessage(message).payload(encoding) for message in messages]
+            assert decode(encode_batch(payloads, encoding)) == {"type": "batch", "messages": messages}
+
+    def test_negotiate(self):
+        """Test subprotocol and query parameter negotiation."""
+        assert negotiate_encoding([], None) == "json"
+        assert negotiate_encoding(["msgpack"], None) == "msgpack"
+        assert negotiate_encoding([], "msgpack") == "msgpack"
+        assert negotiate_encoding([], "xml") is None
+
+    async def test_mixed_clients_share_one_broadcast(self, fake_websocket):
+        """Test each connection gets the signal in its own encoding."""
+        manager = ConnectionManager()
+        json_client, msgpack_client = fake_websocket(), fake_websocket()
+        await manager.connect(json_client, 1)
+        await manager.connect(msgpack_client, 2, "msgpack")
+
+        signal = {"coin_name": "NB", "spread": "8.84"}
+        message = {"type": "new_signal", "signal_type": "mexc_spot_futures", "data": signal}
+        await manager.broadcast_signal("mexc_spot_futures", signal, message)
+
+        assert (json_client.binary, msgpack_client.binary) == ([False], [True])
+        assert json_client.frames == msgpack_client.frames
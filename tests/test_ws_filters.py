@@ -0,0 +1,118 @@
+"""Tests for WebSocket subscription filters."""
+import asyncio
+import pytest
+from app.services.websocket.manager import ConnectionManager, SignalFilter
+
+
+def new_signal(signal_type: str, data: dict) -> dict:
+    return {"type": "new_signal", "signal_type": signal_type, "data": data}
+
+
+class TestSignalFilter:
+    """Tests for SignalFilter parsing and matching."""
+
+    def test_default_matches_everything(self):
+        """Test a fresh filter accepts any type, coin and value."""
+        signal_filter = SignalFilter()
+        assert signal_filter.matches("mexc_dex", "NB", None)
+        assert signal_filter.matches("funding_rate", "YEE", -1.0)
+
+    def test_thresholds_per_signal_type(self):
+        """Test min_spread and min_profit apply to their signal types."""
+        signal_filter = SignalFilter(min_spread=5, min_profit=0.1)
+        assert signal_filter.matches("mexc_spot_futures", "NB", 5.0)
+        assert not signal_filter.matches("mexc_dex", "NB", 4.9)
+        assert not signal_filter.matches("funding_rate", "NB", 0.05)
+        assert not signal_filter.matches("funding_rate", "NB", None)
+
+    def test_from_message_validates(self):
+        """Test invalid subscribe messages raise ValueError."""
+        with pytest.raises(ValueError):
+            SignalFilter.from_message({"signal_types": ["unknown"]})
+        with pytest.raises(ValueError):
+            SignalFilter.from_message({"coins": "NB"})
+        with pytest.raises(ValueError):
+            SignalFilter.from_message({"min_spread": "a lot"})
+
+        signal_filter = SignalFilter.from_message({"coins": ["nb"], "min_spread": "2.5"})
+        assert signal_filter.to_dict()["coins"] == ["NB"]
+        assert signal_filter.min_spread == 2.5
+
+
+class TestFilteredBroadcast:
+    """Tests for ConnectionManager's filter index."""
+
+    async def test_broadcast_visits_matching_sockets(self, fake_websocket):
+        """Test a signal reaches only connections whose filter matches."""
+        manager = ConnectionManager()
+        everything, nb_only, dex_wide = fake_websocket(), fake_websocket(), fake_websocket()
+        for user_id, websocket in enumerate((everything, nb_only, dex_wide), start=1):
+            await manager.connect(websocket, user_id)
+        manager.subscribe(nb_only, SignalFilter(coins=["NB"]))
+        manager.subscribe(dex_wide, SignalFilter(signal_types=["mexc_dex"], min_spread=10))
+
+        signal = {"coin_name": "NB", "spread_percent": "12.5"}
+        assert await manager.broadcast_signal("mexc_dex", signal, new_signal("mexc_dex", signal)) == 3
+
+        signal = {"coin_name": "YEE", "spread": "3.0"}
+        assert await manager.broadcast_signal("mexc_spot_futures", signal, new_signal("mexc_spot_futures", signal)) == 1
+
+        assert len(everything.frames) == 2
+        assert [frame["data"]["coin_name"] for frame in nb_only.frames] == ["NB"]
+        assert len(dex_wide.frames) == 1
+
+    async def test_resubscribe_and_disconnect_update_index(self, fake_websocket):
+        """Test replacing a filter and disconnecting leave no stale entries."""
+        manager = ConnectionManager()
+        websocket = fake_websocket()
+        await manager.connect(websocket, 1)
+        manager.subscribe(websocket, SignalFilter(coins=["NB"]))
+        manager.subscribe(websocket, SignalFilter(signal_types=["funding_rate"], coins=["YEE"]))
+
+        assert manager.subscribers("mexc_dex", "NB", 1.0) == []
+        assert manager.subscribers("funding_rate", "yee", 0.2) == [websocket]
+        assert manager.subscribers("funding_rate") == [websocket]
+
+        manager.disconnect(websocket)
+        assert manager.subscribers("funding_rate") == []
+        assert manager.filters == {}
+        assert not manager.subscribe(websocket, SignalFilter())
+
+
+class TestCoalescing:
+    """Tests for per-connection frame coalescing."""
+
+    async def test_burst_becomes_one_batch(self, fake_websocket):
+        """Test frames inside the window arrive as one batch frame, in order."""
+        manager = ConnectionManager()
+        websocket = fake_websocket()
+        await manager.connect(websocket, 1)
+        manager.subscribe(websocket, SignalFilter(), coalesce_ms=20)
+
+        for spread in ("1.0", "2.0"):
+            signal = {"coin_name": "NB", "spread": spread}
+            await manager.broadcast_signal("mexc_spot_futures", signal, new_signal("mexc_spot_futures", signal))
+        await manager.send_notification(1, {"type": "sound", "signal_type": "mexc_spot_futures"})
+        assert websocket.frames == []
+
+        await asyncio.sleep(0.05)
+        assert len(websocket.frames) == 1
+        batch = websocket.frames[0]
+        assert batch["type"] == "batch"
+        assert [message["type"] for message in batch["messages"]] == ["new_signal", "new_signal", "notification"]
+
+    async def test_single_frame_is_not_wrapped(self, fake_websocket):
+        """Test a lone frame in a window is sent as is, and disconnect drops pending ones."""
+        manager = ConnectionManager()
+        websocket = fake_websocket()
+        await manager.connect(websocket, 1)
+        manager.subscribe(websocket, SignalFilter(), coalesce_ms=10)
+
+        await manager.send_notification(1, {"title": "NB"})
+        await asyncio.sleep(0.03)
+        assert websocket.frames == [{"type": "notification", "data": {"title": "NB"}}]
+
+        await manager.send_notification(1, {"title": "YEE"})
+        manager.disconnect(websocket)
+        await asyncio.sleep(0.03)
+        assert len(websocket.frames) == 1
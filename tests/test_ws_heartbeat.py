@@ -0,0 +1,48 @@
+"""Tests for server-driven WebSocket heartbeats."""
+import time
+from app.services.websocket.heartbeat import HeartbeatWheel
+from app.services.websocket.manager import ConnectionManager
+
+
+class TestHeartbeatWheel:
+    """Tests for HeartbeatWheel scheduling."""
+
+    def test_each_connection_visited_once_per_interval(self):
+        """Test a connection comes due once per full rotation."""
+        wheel = HeartbeatWheel(interval=3, timeout=10, tick=1)
+        wheel.add("a", now=0)
+        due = [wheel.advance(now=tick)[0] for tick in range(1, 7)]
+        assert due == [[], [], ["a"], [], [], ["a"]]
+
+    def test_touch_keeps_connection_alive(self):
+        """Test silence beyond the timeout marks a connection stale, a message resets it."""
+        wheel = HeartbeatWheel(interval=1, timeout=5, tick=1)
+        wheel.add("a", now=0)
+        wheel.add("b", now=0)
+        wheel.touch("a", now=4)
+
+        alive, stale = wheel.advance(now=6)
+        assert alive == ["a"]
+        assert stale == ["b"]
+
+
+class TestHeartbeat:
+    """Tests for ConnectionManager.heartbeat."""
+
+    async def test_pings_and_reaps(self, fake_websocket):
+        """Test live connections are pinged and silent ones closed and removed."""
+        manager = ConnectionManager()
+        manager.heartbeats = HeartbeatWheel(interval=1, timeout=5, tick=1)
+        live, silent = fake_websocket(), fake_websocket()
+        await manager.connect(live, 1)
+        await manager.connect(silent, 2)
+
+        assert await manager.heartbeat() == 0
+        assert live.frames[-1]["type"] == "ping"
+
+        later = time.monotonic() + 100
+        manager.heartbeats.touch(live, now=later - 1)
+        assert await manager.heartbeat(now=later) == 1
+        assert silent.closed == 1001
+        assert silent not in manager.websocket_to_user
+        assert live in manager.websocket_to_user
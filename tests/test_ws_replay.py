@@ -0,0 +1,65 @@
+"""Tests for sequenced WebSocket frames and resume."""
+from app.services.websocket.manager import ConnectionManager, SignalFilter
+from app.services.websocket.replay import FrameLog
+
+
+async def broadcast(manager: ConnectionManager, coin_name: str, spread: float):
+    signal = {"coin_name": coin_name, "spread": spread}
+    message = {"type": "new_signal", "signal_type": "mexc_spot_futures", "data": signal}
+    await manager.broadcast_signal("mexc_spot_futures", signal, message)
+
+
+def no_snapshot(signal_filter):
+    raise AssertionError("snapshot not expected")
+
+
+class TestFrameLog:
+    """Tests for FrameLog numbering and bounds."""
+
+    def test_since(self):
+        """Test missed frames are returned while kept, None once evicted."""
+        log = FrameLog(size=3)
+        for i in range(5):
+            log.append("funding_rate", "NB", float(i), {"type": "new_signal"})
+
+        assert log.seq == 5
+        assert [frame.seq for frame in log.since(2)] == [3, 4, 5]
+        assert log.since(5) == []
+        assert log.since(1) is None
+        assert log.since(6) is None
+
+
+class TestResume:
+    """Tests for ConnectionManager.resume."""
+
+    async def test_replays_missed_frames_through_filter(self, fake_websocket):
+        """Test a reconnecting client gets only missed frames matching its filter."""
+        manager = ConnectionManager()
+        await broadcast(manager, "NB", 1.0)
+        last_seq = manager.frame_log.seq
+        await broadcast(manager, "YEE", 2.0)
+        await broadcast(manager, "NB", 3.0)
+
+        websocket = fake_websocket()
+        await manager.connect(websocket, 1)
+        manager.subscribe(websocket, SignalFilter(coins=["NB"]))
+        replayed = await manager.resume(websocket, last_seq, manager.frame_log.epoch, no_snapshot)
+
+        assert replayed == 1
+        assert [(frame["seq"], frame["data"]["spread"]) for frame in websocket.frames] == [(3, 3.0)]
+
+        await broadcast(manager, "NB", 4.0)
+        assert websocket.frames[-1]["seq"] == 4
+
+    async def test_snapshot_when_gap_too_old(self, fake_websocket):
+        """Test an unknown epoch falls back to the snapshot."""
+        manager = ConnectionManager()
+        await broadcast(manager, "NB", 1.0)
+        websocket = fake_websocket()
+        await manager.connect(websocket, 1)
+
+        def snapshot(signal_filter):
+            return {"type": "snapshot", "seq": manager.frame_log.seq}
+
+        assert await manager.resume(websocket, 0, "previous-process", snapshot) is None
+        assert websocket.frames == [{"type": "snapshot", "seq": 1}]
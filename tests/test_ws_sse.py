@@ -0,0 +1,53 @@
+"""Tests for the Server-Sent Events signal stream."""
+import json
+from app.services.websocket import sse
+from app.services.websocket.manager import ConnectionManager, SignalFilter
+
+
+async def broadcast(manager: ConnectionManager, coin_name: str, spread: float):
+    signal = {"coin_name": coin_name, "spread": spread}
+    message = {"type": "new_signal", "signal_type": "mexc_spot_futures", "data": signal}
+    await manager.broadcast_signal("mexc_spot_futures", signal, message)
+
+
+def parse_event(text: str) -> dict:
+    fields = dict(line.split(": ", 1) for line in text.strip().split("\n"))
+    fields["data"] = json.loads(fields["data"])
+    return fields
+
+
+class TestSSEStream:
+    """Tests for sse_events."""
+
+    async def test_resume_from_last_event_id(self, monkeypatch):
+        """Test frames get ids and a Last-Event-ID replays only the missed ones."""
+        manager = ConnectionManager()
+        monkeypatch.setattr(sse, "manager", manager)
+        await broadcast(manager, "NB", 1.0)
+        last_event_id = f"{manager.frame_log.epoch}-{manager.frame_log.seq}"
+        await broadcast(manager, "YEE", 2.0)
+        await broadcast(manager, "NB", 3.0)
+
+        connection = sse.SSEConnection()
+        await manager.connect(connection, 1, heartbeat=False)
+        manager.subscribe(connection, SignalFilter(coins=["NB"]))
+        events = sse.sse_events(connection, last_event_id)
+
+        assert (await events.__anext__()).startswith("retry: ")
+        event = parse_event(await events.__anext__())
+        assert event["id"] == f"{manager.frame_log.epoch}-3"
+        assert event["event"] == "new_signal"
+        assert event["data"]["data"]["spread"] == 3.0
+
+        await broadcast(manager, "NB", 4.0)
+        assert parse_event(await events.__anext__())["id"].endswith("-4")
+
+        await connection.close()
+        assert [event async for event in events] == []
+        assert connection not in manager.websocket_to_user
+
+    def test_parse_event_id(self):
+        """Test malformed Last-Event-ID values are ignored."""
+        assert sse.parse_event_id("3f9a-12") == ("3f9a", 12)
+        assert sse.parse_event_id("garbage") == (None, None)
+        assert sse.parse_event_id(None) == (None, None)